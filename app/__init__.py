@@ -1,18 +1,118 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 
 from flask import Flask
 
+from .account_explorer import (
+    DEFAULT_QUERY_URL_BUDGET,
+    DEFAULT_SOQL_LENGTH_BUDGET,
+    FETCH_STRATEGY_AUTO,
+    QUERY_CONCURRENCY,
+    configure_fetch_strategy,
+)
+from .data_import import (
+    DEFAULT_PARSE_PROCESS_THRESHOLD,
+    DEFAULT_PARSE_PROCESSES,
+    configure_parse_pool,
+)
+from .import_snapshot import DEFAULT_SNAPSHOT_DELAY, DEFAULT_SNAPSHOT_TTL, configure_snapshots
 from .routes import main_bp
-from .storage import ensure_storage
+from .salesforce import (
+    DEFAULT_POOL_IDLE_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_QUERY_PREFETCH,
+    configure_session_pool,
+)
+from .session_store import (
+    DEFAULT_MAX_SESSIONS,
+    DEFAULT_SESSION_MEMORY_BUDGET,
+    DEFAULT_SESSION_TTL,
+    configure_session_manager,
+)
+from .storage import SQLITE_DATA_FILE, configure_storage, ensure_storage
 
 
 def create_app() -> Flask:
     """Application factory."""
     ensure_storage()
     app = Flask(__name__)
-    app.config.from_mapping(SECRET_KEY=os.environ.get("FLASK_SECRET_KEY", "dev"))
+    app.config.from_mapping(
+        SECRET_KEY=os.environ.get("FLASK_SECRET_KEY", "dev"),
+        STORAGE_BACKEND=os.environ.get("SF_INTEGRATOR_STORAGE", "json"),
+        STORAGE_SQLITE_PATH=os.environ.get("SF_INTEGRATOR_SQLITE_PATH", str(SQLITE_DATA_FILE)),
+        SALESFORCE_POOL_SIZE=int(os.environ.get("SALESFORCE_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        SALESFORCE_POOL_IDLE_TIMEOUT=float(
+            os.environ.get("SALESFORCE_POOL_IDLE_TIMEOUT", DEFAULT_POOL_IDLE_TIMEOUT)
+        ),
+        SALESFORCE_KEEP_ALIVE=os.environ.get("SALESFORCE_KEEP_ALIVE", "1") != "0",
+        SALESFORCE_QUERY_PREFETCH=int(
+            os.environ.get("SALESFORCE_QUERY_PREFETCH", DEFAULT_QUERY_PREFETCH)
+        ),
+        ACCOUNT_EXPLORER_CONCURRENCY=int(
+            os.environ.get("ACCOUNT_EXPLORER_CONCURRENCY", QUERY_CONCURRENCY)
+        ),
+        ACCOUNT_EXPLORER_FETCH_STRATEGY=os.environ.get(
+            "ACCOUNT_EXPLORER_FETCH_STRATEGY", FETCH_STRATEGY_AUTO
+        ),
+        ACCOUNT_EXPLORER_COMPOSITE_BATCH=os.environ.get("ACCOUNT_EXPLORER_COMPOSITE_BATCH", "1") != "0",
+        ACCOUNT_EXPLORER_URL_BUDGET=int(
+            os.environ.get("ACCOUNT_EXPLORER_URL_BUDGET", DEFAULT_QUERY_URL_BUDGET)
+        ),
+        ACCOUNT_EXPLORER_SOQL_BUDGET=int(
+            os.environ.get("ACCOUNT_EXPLORER_SOQL_BUDGET", DEFAULT_SOQL_LENGTH_BUDGET)
+        ),
+        SESSION_TTL=float(os.environ.get("SF_INTEGRATOR_SESSION_TTL", DEFAULT_SESSION_TTL)),
+        SESSION_MAX_COUNT=int(os.environ.get("SF_INTEGRATOR_MAX_SESSIONS", DEFAULT_MAX_SESSIONS)),
+        SESSION_MEMORY_BUDGET=int(
+            os.environ.get("SF_INTEGRATOR_SESSION_MEMORY_BUDGET", DEFAULT_SESSION_MEMORY_BUDGET)
+        ),
+        SESSION_SPILL=os.environ.get("SF_INTEGRATOR_SESSION_SPILL", "0") == "1",
+        DATA_IMPORT_SNAPSHOTS=os.environ.get("SF_INTEGRATOR_IMPORT_SNAPSHOTS", "1") != "0",
+        DATA_IMPORT_SNAPSHOT_TTL=float(
+            os.environ.get("SF_INTEGRATOR_IMPORT_SNAPSHOT_TTL", DEFAULT_SNAPSHOT_TTL)
+        ),
+        DATA_IMPORT_SNAPSHOT_DELAY=float(
+            os.environ.get("SF_INTEGRATOR_IMPORT_SNAPSHOT_DELAY", DEFAULT_SNAPSHOT_DELAY)
+        ),
+        DATA_IMPORT_PROCESSES=int(
+            os.environ.get("SF_INTEGRATOR_IMPORT_PROCESSES", DEFAULT_PARSE_PROCESSES)
+        ),
+        DATA_IMPORT_PROCESS_THRESHOLD=int(
+            os.environ.get("SF_INTEGRATOR_IMPORT_PROCESS_THRESHOLD", DEFAULT_PARSE_PROCESS_THRESHOLD)
+        ),
+    )
+    configure_storage(
+        app.config["STORAGE_BACKEND"],
+        sqlite_path=Path(app.config["STORAGE_SQLITE_PATH"]),
+    )
+    configure_session_pool(
+        pool_size=app.config["SALESFORCE_POOL_SIZE"],
+        idle_timeout=app.config["SALESFORCE_POOL_IDLE_TIMEOUT"],
+        keep_alive=app.config["SALESFORCE_KEEP_ALIVE"],
+    )
+    configure_session_manager(
+        ttl=app.config["SESSION_TTL"],
+        max_sessions=app.config["SESSION_MAX_COUNT"],
+        memory_budget=app.config["SESSION_MEMORY_BUDGET"],
+        spill=app.config["SESSION_SPILL"],
+    )
+    configure_snapshots(
+        enabled=app.config["DATA_IMPORT_SNAPSHOTS"],
+        ttl=app.config["DATA_IMPORT_SNAPSHOT_TTL"],
+        delay=app.config["DATA_IMPORT_SNAPSHOT_DELAY"],
+    )
+    configure_parse_pool(
+        processes=app.config["DATA_IMPORT_PROCESSES"],
+        threshold=app.config["DATA_IMPORT_PROCESS_THRESHOLD"],
+    )
+    configure_fetch_strategy(
+        app.config["ACCOUNT_EXPLORER_FETCH_STRATEGY"],
+        composite_batch=app.config["ACCOUNT_EXPLORER_COMPOSITE_BATCH"],
+        url_budget=app.config["ACCOUNT_EXPLORER_URL_BUDGET"],
+        soql_budget=app.config["ACCOUNT_EXPLORER_SOQL_BUDGET"],
+    )
     app.register_blueprint(main_bp)
     return app
 
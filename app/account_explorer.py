@@ -2,25 +2,54 @@ from __future__ import annotations
 
 import json
 import logging
+import math
+import queue
 import re
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, MutableMapping, Optional, Sequence, Set, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Set, Tuple
+from urllib.parse import quote_plus
 
 from flask import session
 
 from . import data_import
-from .salesforce import SalesforceError, describe_sobject, query_all
+from .salesforce import (COMPOSITE_BATCH_LIMIT, SalesforceError, batch_query_all,
+                         batch_query_calls, batch_query_more,
+                         describe_child_relationships, describe_sobject,
+                         query_all, query_more)
+from .session_store import estimate_size, session_manager
 from .storage import DATA_DIR, OrgConfig
 
 ACCOUNT_EXPLORER_SESSION_KEY = "account_explorer_session_id"
 MAX_ACCOUNT_IDS = 200
 MAX_FIELDS_PER_OBJECT = 5
+QUERY_CONCURRENCY = 4
 CONFIG_FILE = DATA_DIR / "account_explorer_config.json"
 RESULTS_DIR = DATA_DIR / "account_explorer_results"
+# Background jobs process this many accounts per window and keep this many
+# account payloads in memory for the on-page preview; the rest is only on disk.
+JOB_WINDOW_SIZE = MAX_ACCOUNT_IDS
+JOB_PREVIEW_ACCOUNTS = MAX_ACCOUNT_IDS
+JOB_RETENTION = 3600.0
+# "per_object" runs one IN query per related object, "subquery" nests the
+# objects linked to the account as relationship subqueries of the Account
+# query, "auto" picks whichever needs fewer API calls for the run.
+FETCH_STRATEGY_AUTO = "auto"
+FETCH_STRATEGY_PER_OBJECT = "per_object"
+FETCH_STRATEGY_SUBQUERY = "subquery"
+FETCH_STRATEGIES = (FETCH_STRATEGY_AUTO, FETCH_STRATEGY_PER_OBJECT, FETCH_STRATEGY_SUBQUERY)
+# IN-clause chunks are packed with as many IDs as keep a GET query URL (path
+# plus encoded SOQL) under the URL budget. SOQL sent in a POST body through
+# Composite Batch is only held to Salesforce's statement length limit.
+DEFAULT_QUERY_URL_BUDGET = 16000
+DEFAULT_SOQL_LENGTH_BUDGET = 100000
+_QUERY_PATH = "/services/data/v57.0/query?q="
 
 _ALERT_OPERATORS: Dict[str, str] = {
     "equals": "equals",
@@ -492,10 +521,49 @@ class ExplorerResult:
 class ExplorerSession:
     id: str
     result: Optional[ExplorerResult] = None
+    _memory: Optional[Tuple[int, int]] = field(default=None, repr=False, compare=False)
 
     def serialize(self) -> Dict[str, object]:
         return {"result": self.result.to_dict() if self.result else None}
 
+    def memory_usage(self) -> int:
+        if self.result is None:
+            return 0
+        if self._memory is None or self._memory[0] != id(self.result):
+            self._memory = (id(self.result), estimate_size(self.result.data))
+        return self._memory[1]
+
+
+@dataclass
+class ExplorerJob:
+    """Background explorer run over an arbitrarily long account list."""
+
+    id: str
+    session_id: str
+    account_ids: List[str]
+    state: str = "queued"
+    processed: int = 0
+    missing: int = 0
+    error: Optional[str] = None
+    started_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    finished_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.state in ("done", "failed", "cancelled")
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "id": self.id,
+            "state": self.state,
+            "total": len(self.account_ids),
+            "processed": self.processed,
+            "missing": self.missing,
+            "error": self.error,
+            "startedAt": self.started_at,
+        }
+
 
 @dataclass
 class AdvancedMatch:
@@ -512,11 +580,37 @@ class AdvancedEvaluationResult:
     matches: List[AdvancedMatch] = field(default_factory=list)
 
 
+@dataclass
+class ObjectQueryPlan:
+    query_fields: List[str]
+    display_fields: List[str]
+    link_fields: List[str]
+
+
+@dataclass
+class QueryPlan:
+    objects: Dict[str, ObjectQueryPlan] = field(default_factory=dict)
+
+    def get(self, object_key: str) -> ObjectQueryPlan:
+        return self.objects[object_key]
+
+
+ProgressCallback = Callable[[str, Dict[str, object]], None]
+
 _config_lock = threading.Lock()
-_sessions_lock = threading.Lock()
-_sessions: Dict[str, ExplorerSession] = {}
+_jobs_lock = threading.Lock()
+_jobs: Dict[str, ExplorerJob] = {}
 _fields_cache_lock = threading.Lock()
 _object_fields_cache: Dict[Tuple[str, str], Set[str]] = {}
+_child_relationships_cache: Dict[str, Dict[str, str]] = {}
+# Truncated nested subquery results per account, measured per org and object.
+_nested_paging_rates: Dict[Tuple[str, str], float] = {}
+_fetch_settings = {
+    "strategy": FETCH_STRATEGY_AUTO,
+    "composite_batch": True,
+    "url_budget": DEFAULT_QUERY_URL_BUDGET,
+    "soql_budget": DEFAULT_SOQL_LENGTH_BUDGET,
+}
 
 logger = logging.getLogger(__name__)
 
@@ -580,14 +674,30 @@ def _query_all_with_handling(
     required: bool = False,
 ) -> Dict[str, object]:
     try:
+        if _query_url_length(soql) > _fetch_settings["url_budget"]:
+            # Too long for a GET URL: send it in a Composite Batch POST body instead
+            result = batch_query_all(org, [soql])[0]
+            if isinstance(result, SalesforceError):
+                raise result
+            return result
         return query_all(org, soql)
     except SalesforceError as exc:
-        if not required and _is_recoverable_salesforce_error(exc):
-            if object_key not in warnings:
-                warnings[object_key] = _format_salesforce_error_message(object_key, exc)
-                logger.warning("Skipping %s due to Salesforce error: %s", object_key, exc)
-            return {"records": []}
-        raise
+        _handle_query_error(exc, object_key, warnings, required)
+        return {"records": []}
+
+
+def _handle_query_error(
+    exc: SalesforceError,
+    object_key: str,
+    warnings: MutableMapping[str, str],
+    required: bool = False,
+) -> None:
+    """Record a recoverable error as a warning for ``object_key``; re-raise anything else."""
+    if required or not _is_recoverable_salesforce_error(exc):
+        raise exc
+    if object_key not in warnings:
+        warnings[object_key] = _format_salesforce_error_message(object_key, exc)
+        logger.warning("Skipping %s due to Salesforce error: %s", object_key, exc)
 
 
 def _ensure_session_id() -> str:
@@ -600,11 +710,13 @@ def _ensure_session_id() -> str:
 
 
 def get_session() -> ExplorerSession:
-    session_id = _ensure_session_id()
-    with _sessions_lock:
-        if session_id not in _sessions:
-            _sessions[session_id] = ExplorerSession(id=session_id)
-        return _sessions[session_id]
+    return _get_session_by_id(_ensure_session_id())
+
+
+def _get_session_by_id(session_id: str) -> ExplorerSession:
+    return session_manager.get(
+        "account_explorer", session_id, lambda: ExplorerSession(id=session_id)
+    )
 
 
 def get_config() -> ExplorerConfig:
@@ -795,19 +907,21 @@ def get_object_fields_config() -> Dict[str, List[str]]:
     return payload
 
 
-def parse_account_ids_from_text(raw: str) -> List[str]:
+def parse_account_ids_from_text(raw: str, limit: Optional[int] = MAX_ACCOUNT_IDS) -> List[str]:
     if not raw:
         return []
     tokens = re.split(r"[\s,;]+", raw)
-    return _sanitize_account_ids(tokens)
+    return _sanitize_account_ids(tokens, limit)
 
 
-def parse_account_ids_from_file(filename: str, file_bytes: bytes) -> List[str]:
+def parse_account_ids_from_file(
+    filename: str, file_bytes: bytes, limit: Optional[int] = MAX_ACCOUNT_IDS
+) -> List[str]:
     dataset = data_import.parse_tabular_file(filename, file_bytes)
-    return _sanitize_account_ids(dataset.records.keys())
+    return _sanitize_account_ids(dataset.records.keys(), limit)
 
 
-def _sanitize_account_ids(values: Iterable[str]) -> List[str]:
+def _sanitize_account_ids(values: Iterable[str], limit: Optional[int] = MAX_ACCOUNT_IDS) -> List[str]:
     seen: Set[str] = set()
     ordered: List[str] = []
     for value in values:
@@ -821,7 +935,7 @@ def _sanitize_account_ids(values: Iterable[str]) -> List[str]:
         if candidate not in seen:
             seen.add(candidate)
             ordered.append(candidate)
-        if len(ordered) >= MAX_ACCOUNT_IDS:
+        if limit is not None and len(ordered) >= limit:
             break
     return ordered
 
@@ -854,6 +968,181 @@ def _get_object_field_names(org: OrgConfig, object_key: str) -> Set[str]:
     return names
 
 
+def _get_account_child_relationships(org: OrgConfig) -> Dict[str, str]:
+    """Map the directly linked objects to their Account child relationship names."""
+    cache_key = getattr(org, "id", "") or ""
+    with _fields_cache_lock:
+        cached = _child_relationships_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    relationships: Dict[str, str] = {}
+    for relationship in describe_child_relationships(org, "Account"):
+        object_key = relationship["childSObject"]
+        if object_key not in _DIRECT_OBJECTS or object_key in relationships:
+            continue
+        if relationship["field"] == _OBJECT_DEFINITIONS[object_key]["filter_field"]:
+            relationships[object_key] = relationship["relationshipName"]
+    with _fields_cache_lock:
+        _child_relationships_cache[cache_key] = relationships
+    return relationships
+
+
+def configure_fetch_strategy(
+    strategy: Optional[str] = None,
+    composite_batch: Optional[bool] = None,
+    url_budget: Optional[int] = None,
+    soql_budget: Optional[int] = None,
+) -> None:
+    if strategy is not None:
+        strategy = strategy.strip().lower()
+        if strategy not in FETCH_STRATEGIES:
+            raise ValueError(f"Unknown account explorer fetch strategy: {strategy}")
+        _fetch_settings["strategy"] = strategy
+    if composite_batch is not None:
+        _fetch_settings["composite_batch"] = bool(composite_batch)
+    if url_budget is not None:
+        _fetch_settings["url_budget"] = max(1, int(url_budget))
+    if soql_budget is not None:
+        _fetch_settings["soql_budget"] = max(1, int(soql_budget))
+
+
+def _choose_fetch_strategy(
+    org: OrgConfig, plan: QueryPlan, account_ids: Sequence[str]
+) -> Tuple[str, Dict[str, str], Dict[str, int]]:
+    """Pick the first-stage strategy; returns it, the relationships to nest and call estimates.
+
+    Estimates count the HTTP calls of the planned IN-clause chunks, which share
+    round trips when Composite Batch is on: per object every direct object gets
+    its own chunks, with subqueries only objects without a relationship do, plus
+    the calls to page through truncated nested results. Those are estimated from
+    earlier runs against the same org; an object whose paging costs more than
+    its own queries is queried separately (see :func:`_collect_nested_children`).
+    """
+    direct_queries = {
+        object_key: _build_id_queries(
+            object_key,
+            plan.get(object_key).query_fields,
+            str(_OBJECT_DEFINITIONS[object_key]["filter_field"]),
+            account_ids,
+        )
+        for object_key in _DIRECT_OBJECTS
+    }
+    account_queries = _build_id_queries("Account", plan.get("Account").query_fields, "Id", account_ids)
+    estimates = {
+        FETCH_STRATEGY_PER_OBJECT: _estimate_calls(
+            account_queries + [soql for queries in direct_queries.values() for soql in queries]
+        )
+    }
+    strategy = _fetch_settings["strategy"]
+    if strategy == FETCH_STRATEGY_PER_OBJECT:
+        return strategy, {}, estimates
+    try:
+        relationships = _get_account_child_relationships(org)
+    except SalesforceError as exc:
+        logger.warning("Unable to describe Account relationships: %s", exc)
+        relationships = {}
+    org_key = getattr(org, "id", "") or ""
+    with _fields_cache_lock:
+        paging_rates = {
+            object_key: _nested_paging_rates.get((org_key, object_key), 0.0)
+            for object_key in relationships
+        }
+    estimates[FETCH_STRATEGY_SUBQUERY] = _estimate_calls(
+        _build_account_subqueries(plan, account_ids, relationships)
+        + [
+            soql
+            for object_key, queries in direct_queries.items()
+            if object_key not in relationships
+            for soql in queries
+        ]
+    ) + sum(
+        min(
+            _nested_paging_calls(rate * len(account_ids)),
+            _estimate_calls(direct_queries[object_key]),
+        )
+        for object_key, rate in paging_rates.items()
+    )
+    if not relationships:
+        return FETCH_STRATEGY_PER_OBJECT, {}, estimates
+    if strategy == FETCH_STRATEGY_AUTO and (
+        estimates[FETCH_STRATEGY_SUBQUERY] >= estimates[FETCH_STRATEGY_PER_OBJECT]
+    ):
+        return FETCH_STRATEGY_PER_OBJECT, {}, estimates
+    return FETCH_STRATEGY_SUBQUERY, relationships, estimates
+
+
+def _estimate_calls(queries: Sequence[str]) -> int:
+    """HTTP calls needed for the first page of each query in ``queries``."""
+    if _fetch_settings["composite_batch"]:
+        return batch_query_calls(queries, _fetch_settings["soql_budget"])
+    return len(queries)
+
+
+def _nested_paging_calls(chains: float) -> int:
+    """HTTP calls to fetch one more page for each of ``chains`` truncated nested results."""
+    chains = math.ceil(chains)
+    if _fetch_settings["composite_batch"]:
+        return math.ceil(chains / COMPOSITE_BATCH_LIMIT)
+    return chains
+
+
+def _query_url_length(soql: str) -> int:
+    return len(_QUERY_PATH) + len(quote_plus(soql))
+
+
+def _plan_id_chunks(soql_prefix: str, ids: Sequence[str]) -> List[Sequence[str]]:
+    """Split ``ids`` into IN-clause chunks that keep each query within the length budget.
+
+    ``soql_prefix`` is the query up to ``IN (``. Queries are measured by their
+    encoded URL, which is also what a Composite Batch subrequest carries; only
+    when the prefix leaves no room for an ID in a URL does the SOQL length count.
+    """
+    if not ids:
+        return []
+    url_base = _query_url_length(soql_prefix + ")")
+    longest = max(_id_length(value, encoded=True) for value in ids)
+    encoded = url_base + longest <= _fetch_settings["url_budget"]
+    if encoded:
+        budget = int(_fetch_settings["url_budget"])
+        base = url_base
+        separator = len(quote_plus(", "))
+    else:
+        budget = int(_fetch_settings["soql_budget"])
+        base = len(soql_prefix) + 1
+        separator = len(", ")
+    chunks: List[Sequence[str]] = []
+    start = 0
+    length = base
+    for index, value in enumerate(ids):
+        extra = _id_length(value, encoded) + (separator if index > start else 0)
+        if index > start and length + extra > budget:
+            chunks.append(ids[start:index])
+            start = index
+            length = base
+            extra = _id_length(value, encoded)
+        length += extra
+    chunks.append(ids[start:])
+    return chunks
+
+
+def _id_length(value: str, encoded: bool) -> int:
+    quoted = f"'{value}'"
+    return len(quote_plus(quoted)) if encoded else len(quoted)
+
+
+def _record_chunks(
+    stats: Optional[Dict[str, object]], object_key: str, chunks: Sequence[Sequence[str]]
+) -> None:
+    if stats is None or not chunks:
+        return
+    entry = stats.setdefault("chunks", {}).setdefault(  # type: ignore[union-attr]
+        object_key, {"queries": 0, "ids": 0, "largest": 0}
+    )
+    entry["queries"] += len(chunks)
+    entry["ids"] += sum(len(chunk) for chunk in chunks)
+    entry["largest"] = max(entry["largest"], max(len(chunk) for chunk in chunks))
+
+
 def _build_query_fields(org: OrgConfig, object_key: str, config: ExplorerConfig) -> Tuple[List[str], List[str]]:
     definition = _OBJECT_DEFINITIONS.get(object_key, {})
     required = [field for field in definition.get("required_fields", []) if isinstance(field, str)]
@@ -883,6 +1172,21 @@ def _build_query_fields(org: OrgConfig, object_key: str, config: ExplorerConfig)
     return query_fields, ["Id"] + sanitized_display
 
 
+def _build_query_plan(org: OrgConfig, config: ExplorerConfig, concurrency: int = 1) -> QueryPlan:
+    tasks: Dict[str, Callable[[], object]] = {
+        object_key: partial(_build_query_fields, org, object_key, config)
+        for object_key in _OBJECT_DEFINITIONS.keys()
+    }
+    plan = QueryPlan()
+    for object_key, (query_fields, display_fields) in _run_query_stage(tasks, concurrency).items():
+        plan.objects[object_key] = ObjectQueryPlan(
+            query_fields=query_fields,
+            display_fields=display_fields,
+            link_fields=_get_object_link_fields(object_key),
+        )
+    return plan
+
+
 def _record_to_field_list(
     fields: Sequence[str],
     record: Dict[str, object],
@@ -945,14 +1249,6 @@ def _get_object_link_fields(object_key: str) -> List[str]:
     return link_fields
 
 
-def _filter_records_by_field(records: Sequence[Dict[str, object]], field_name: str, target_value: str) -> List[Dict[str, object]]:
-    filtered = []
-    for record in records:
-        if str(record.get(field_name, "")) == target_value:
-            filtered.append(record)
-    return filtered
-
-
 def _map_records_by_field(records: Sequence[Dict[str, object]], field_name: str) -> MutableMapping[str, List[Dict[str, object]]]:
     mapping: MutableMapping[str, List[Dict[str, object]]] = {}
     for record in records:
@@ -963,6 +1259,16 @@ def _map_records_by_field(records: Sequence[Dict[str, object]], field_name: str)
     return mapping
 
 
+def _index_direct_records(
+    results: Dict[str, List[Dict[str, object]]]
+) -> Dict[str, MutableMapping[str, List[Dict[str, object]]]]:
+    index: Dict[str, MutableMapping[str, List[Dict[str, object]]]] = {}
+    for object_key in _DIRECT_OBJECTS:
+        filter_field = str(_OBJECT_DEFINITIONS[object_key].get("filter_field", "AccountId"))
+        index[object_key] = _map_records_by_field(results.get(object_key, []), filter_field)
+    return index
+
+
 def _aggregate_individuals_by_account(
     contacts: Sequence[Dict[str, object]],
     individuals: MutableMapping[str, Dict[str, object]],
@@ -1731,7 +2037,7 @@ def _get_related_records_for_account(
     object_key: str,
     account_id: str,
     *,
-    results: Dict[str, List[Dict[str, object]]],
+    direct_records_by_account: Dict[str, MutableMapping[str, List[Dict[str, object]]]],
     contact_by_account: MutableMapping[str, List[Dict[str, object]]],
     individual_by_account: MutableMapping[str, Set[str]],
     individual_records: Dict[str, Dict[str, object]],
@@ -1740,9 +2046,7 @@ def _get_related_records_for_account(
     if object_key == "Contact":
         return list(contact_by_account.get(account_id, []))
     if object_key in _DIRECT_OBJECTS:
-        definition = _OBJECT_DEFINITIONS.get(object_key, {})
-        filter_field = str(definition.get("filter_field", "AccountId"))
-        return _filter_records_by_field(results.get(object_key, []), filter_field, account_id)
+        return list(direct_records_by_account.get(object_key, {}).get(account_id, []))
     if object_key == "Individual":
         individual_ids_for_account = individual_by_account.get(account_id, set())
         records = [individual_records.get(individual_id) for individual_id in individual_ids_for_account]
@@ -1781,51 +2085,399 @@ def _get_related_records_for_account(
     return []
 
 
-def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
-    sanitized_ids = _sanitize_account_ids(account_ids)
-    if not sanitized_ids:
-        raise ValueError("no_valid_ids")
+def _run_query_stage(tasks: Dict[str, Callable[[], object]], concurrency: int) -> Dict[str, object]:
+    if concurrency <= 1 or len(tasks) <= 1:
+        return {key: task() for key, task in tasks.items()}
+    with ThreadPoolExecutor(
+        max_workers=min(concurrency, len(tasks)), thread_name_prefix="account-explorer"
+    ) as executor:
+        futures = {key: executor.submit(task) for key, task in tasks.items()}
+        try:
+            return {key: future.result() for key, future in futures.items()}
+        except BaseException:
+            for future in futures.values():
+                future.cancel()
+            raise
 
-    config = get_config()
-    alerts_config = config.get_alerts()
-    alert_object_keys = _get_alert_object_keys(alerts_config)
-    results: Dict[str, List[Dict[str, object]]] = {}
-    warnings: Dict[str, str] = {}
 
-    # Query accounts first
-    account_query_fields, account_display_fields = _build_query_fields(
-        org, "Account", config
+def _query_records_by_ids(
+    org: OrgConfig,
+    object_key: str,
+    query_fields: Sequence[str],
+    filter_field: str,
+    ids: Sequence[str],
+    warnings: MutableMapping[str, str],
+    required: bool = False,
+    stats: Optional[Dict[str, object]] = None,
+) -> List[Dict[str, object]]:
+    records: List[Dict[str, object]] = []
+    for soql in _build_id_queries(object_key, query_fields, filter_field, ids, stats):
+        if object_key in warnings:
+            break
+        data = _query_all_with_handling(org, soql, object_key, warnings, required=required)
+        records.extend(data.get("records", []))
+    return records
+
+
+def _build_id_queries(
+    object_key: str,
+    query_fields: Sequence[str],
+    filter_field: str,
+    ids: Sequence[str],
+    stats: Optional[Dict[str, object]] = None,
+) -> List[str]:
+    prefix = f"SELECT {', '.join(query_fields)} FROM {object_key} WHERE {filter_field} IN ("
+    chunks = _plan_id_chunks(prefix, ids)
+    _record_chunks(stats, object_key, chunks)
+    return [f"{prefix}{_format_ids_for_soql(chunk)})" for chunk in chunks]
+
+
+def _run_batched_queries(
+    org: OrgConfig,
+    queries: Dict[str, List[str]],
+    warnings: MutableMapping[str, str],
+    required: Iterable[str] = (),
+) -> Dict[str, List[Dict[str, object]]]:
+    """Run the chunk queries of several objects over Composite Batch.
+
+    Errors are handled per subrequest as in :func:`_query_records_by_ids`: a
+    recoverable error turns into a warning and drops the object's later chunks.
+    """
+    required_keys = set(required)
+    entries = [(object_key, soql) for object_key, soqls in queries.items() for soql in soqls]
+    responses = batch_query_all(
+        org, [soql for _, soql in entries], _fetch_settings["soql_budget"]
     )
-    account_records: Dict[str, Dict[str, object]] = {}
-    for chunk in _chunk(sanitized_ids, 100):
-        soql = f"SELECT {', '.join(account_query_fields)} FROM Account WHERE Id IN ({_format_ids_for_soql(chunk)})"
+    results: Dict[str, List[Dict[str, object]]] = {object_key: [] for object_key in queries}
+    for (object_key, _), response in zip(entries, responses):
+        if object_key in warnings:
+            continue
+        if isinstance(response, SalesforceError):
+            _handle_query_error(response, object_key, warnings, object_key in required_keys)
+            continue
+        results[object_key].extend(response.get("records", []))
+    return results
+
+
+def _query_accounts_with_children(
+    org: OrgConfig,
+    plan: QueryPlan,
+    account_ids: Sequence[str],
+    relationships: Dict[str, str],
+    warnings: MutableMapping[str, str],
+    stats: Optional[Dict[str, object]] = None,
+) -> Tuple[List[Dict[str, object]], Dict[str, List[Dict[str, object]]]]:
+    """Fetch accounts with their direct objects nested as relationship subqueries.
+
+    Returns the account records and the child records per object.
+    """
+    records: List[Dict[str, object]] = []
+    for soql in _build_account_subqueries(plan, account_ids, relationships, stats):
         data = _query_all_with_handling(org, soql, "Account", warnings, required=True)
-        for record in data.get("records", []):
-            record_id = record.get("Id")
-            if not record_id:
+        records.extend(data.get("records", []))
+    return records, _collect_nested_children(
+        org, plan, account_ids, records, relationships, warnings, stats=stats
+    )
+
+
+def _build_account_subqueries(
+    plan: QueryPlan,
+    account_ids: Sequence[str],
+    relationships: Dict[str, str],
+    stats: Optional[Dict[str, object]] = None,
+) -> List[str]:
+    select_items = list(plan.get("Account").query_fields)
+    for object_key, relationship in relationships.items():
+        select_items.append(
+            f"(SELECT {', '.join(plan.get(object_key).query_fields)} FROM {relationship})"
+        )
+    prefix = f"SELECT {', '.join(select_items)} FROM Account WHERE Id IN ("
+    chunks = _plan_id_chunks(prefix, account_ids)
+    _record_chunks(stats, "Account", chunks)
+    return [f"{prefix}{_format_ids_for_soql(chunk)})" for chunk in chunks]
+
+
+def _collect_nested_children(
+    org: OrgConfig,
+    plan: QueryPlan,
+    account_ids: Sequence[str],
+    records: Sequence[Dict[str, object]],
+    relationships: Dict[str, str],
+    warnings: MutableMapping[str, str],
+    batched: bool = False,
+    stats: Optional[Dict[str, object]] = None,
+) -> Dict[str, List[Dict[str, object]]]:
+    """Return the child records nested in ``records``, completing truncated ones.
+
+    Each truncated nested result needs its own follow-up call, so an object
+    whose pages would take more calls than its IN queries is queried
+    separately instead. The measured paging feeds later strategy estimates.
+    """
+    truncated = {object_key: 0 for object_key in relationships}
+    for record in records:
+        for object_key, relationship in relationships.items():
+            nested = record.get(relationship)
+            if isinstance(nested, dict) and nested.get("nextRecordsUrl"):
+                truncated[object_key] += 1
+    org_key = getattr(org, "id", "") or ""
+    with _fields_cache_lock:
+        for object_key, count in truncated.items():
+            _nested_paging_rates[(org_key, object_key)] = count / max(1, len(account_ids))
+
+    requery: List[str] = []
+    for object_key, count in truncated.items():
+        queries = _build_id_queries(
+            object_key,
+            plan.get(object_key).query_fields,
+            str(_OBJECT_DEFINITIONS[object_key]["filter_field"]),
+            account_ids,
+        )
+        if _nested_paging_calls(count) > _estimate_calls(queries):
+            requery.append(object_key)
+    for record in records:
+        for object_key in requery:
+            record.pop(relationships[object_key], None)
+    nested_relationships = {
+        object_key: relationship
+        for object_key, relationship in relationships.items()
+        if object_key not in requery
+    }
+    children = _split_nested_children(org, records, nested_relationships, batched)
+    if stats is not None:
+        stats["nestedPages"] = int(stats.get("nestedPages", 0)) + sum(  # type: ignore[arg-type]
+            truncated[object_key] for object_key in nested_relationships
+        )
+    if not requery:
+        return children
+    logger.info("Nested paging too expensive, querying separately: %s", ", ".join(requery))
+    if stats is not None:
+        requeried = stats.setdefault("requeriedObjects", [])
+        requeried.extend(key for key in requery if key not in requeried)  # type: ignore[union-attr]
+    if batched:
+        queries = {
+            object_key: _build_id_queries(
+                object_key,
+                plan.get(object_key).query_fields,
+                str(_OBJECT_DEFINITIONS[object_key]["filter_field"]),
+                account_ids,
+                stats,
+            )
+            for object_key in requery
+        }
+        children.update(_run_batched_queries(org, queries, warnings))
+        return children
+    for object_key in requery:
+        children[object_key] = _query_records_by_ids(
+            org,
+            object_key,
+            plan.get(object_key).query_fields,
+            str(_OBJECT_DEFINITIONS[object_key]["filter_field"]),
+            account_ids,
+            warnings,
+            stats=stats,
+        )
+    return children
+
+
+def _split_nested_children(
+    org: OrgConfig,
+    records: Sequence[Dict[str, object]],
+    relationships: Dict[str, str],
+    batched: bool = False,
+) -> Dict[str, List[Dict[str, object]]]:
+    """Move nested subquery results out of the account records, per object.
+
+    Nested results that Salesforce truncates are completed through their
+    ``nextRecordsUrl``, over Composite Batch when ``batched`` is set.
+    """
+    groups: Dict[str, List[Tuple[object, List[Dict[str, object]]]]] = {
+        object_key: [] for object_key in relationships
+    }
+    truncated: List[Tuple[List[Dict[str, object]], str]] = []
+    for record in records:
+        for object_key, relationship in relationships.items():
+            nested = record.pop(relationship, None)
+            if not isinstance(nested, dict):
                 continue
-            account_records[str(record_id)] = record
-    missing_accounts = [account_id for account_id in sanitized_ids if account_id not in account_records]
+            child_records = list(nested.get("records") or [])
+            groups[object_key].append((record.get("Id"), child_records))
+            next_url = nested.get("nextRecordsUrl")
+            if next_url:
+                truncated.append((child_records, str(next_url)))
+    if truncated:
+        urls = [next_url for _, next_url in truncated]
+        if batched:
+            pages = batch_query_more(org, urls, _fetch_settings["soql_budget"])
+        else:
+            pages = [query_more(org, next_url) for next_url in urls]
+        for (child_records, _), more in zip(truncated, pages):
+            if isinstance(more, SalesforceError):
+                raise more
+            child_records.extend(more)
+    children: Dict[str, List[Dict[str, object]]] = {}
+    for object_key, object_groups in groups.items():
+        filter_field = str(_OBJECT_DEFINITIONS[object_key]["filter_field"])
+        children[object_key] = []
+        for account_id, child_records in object_groups:
+            for child in child_records:
+                child.setdefault(filter_field, account_id)
+            children[object_key].extend(child_records)
+    return children
+
+
+def _query_contact_point_object(
+    org: OrgConfig,
+    object_key: str,
+    config: ExplorerConfig,
+    query_fields: Sequence[str],
+    individual_ids: Sequence[str],
+    contact_ids: Sequence[str],
+    warnings: MutableMapping[str, str],
+    stats: Optional[Dict[str, object]] = None,
+) -> Tuple[List[Dict[str, object]], Dict[str, MutableMapping[str, List[Dict[str, object]]]]]:
+    definition = _OBJECT_DEFINITIONS.get(object_key, {})
+    records_by_id: Dict[str, Dict[str, object]] = {}
+    source_config = config.get_contact_point_sources(object_key)
+    active_sources = {
+        source for source, enabled in source_config.items() if enabled and source in _CONTACT_POINT_SOURCE_KEYS
+    }
+    if not active_sources:
+        return [], {"contact": {}, "individual": {}}
+    individual_enabled = "individual" in active_sources
+    contact_enabled = "contact" in active_sources
+    if "individual_field" in definition:
+        raw_individual_field = definition.get("individual_field")
+    else:
+        raw_individual_field = "IndividualId"
+    if "contact_field" in definition:
+        raw_contact_field = definition.get("contact_field")
+    else:
+        raw_contact_field = "ContactId"
+    individual_field = ""
+    contact_field = ""
+    if raw_individual_field is not None:
+        individual_field = str(raw_individual_field)
+    if raw_contact_field is not None:
+        contact_field = str(raw_contact_field)
+    try:
+        available_contact_point_fields = _get_object_field_names(org, object_key)
+    except SalesforceError as exc:
+        logger.warning("Unable to describe %s: %s", object_key, exc)
+        available_contact_point_fields = set()
+    if not individual_enabled:
+        individual_field = ""
+    elif (
+        individual_field
+        and individual_field.lower() != "none"
+        and individual_field not in available_contact_point_fields
+    ):
+        individual_field = ""
+    if not contact_enabled:
+        contact_field = ""
+    elif (
+        contact_field
+        and contact_field.lower() != "none"
+        and contact_field not in available_contact_point_fields
+    ):
+        contact_field = ""
+    if (
+        individual_enabled
+        and individual_field
+        and individual_field.lower() != "none"
+        and individual_ids
+    ):
+        for record in _query_records_by_ids(
+            org, object_key, query_fields, individual_field, individual_ids, warnings, stats=stats
+        ):
+            _store_contact_point_record(records_by_id, record, "individual")
+    if (
+        object_key not in warnings
+        and contact_enabled
+        and contact_field
+        and contact_field.lower() != "none"
+        and contact_ids
+    ):
+        for record in _query_records_by_ids(
+            org, object_key, query_fields, contact_field, contact_ids, warnings, stats=stats
+        ):
+            _store_contact_point_record(records_by_id, record, "contact")
+    records = list(records_by_id.values())
+    mapping = _aggregate_contact_points(
+        records,
+        contact_field=contact_field,
+        individual_field=individual_field,
+        active_sources=active_sources,
+    )
+    return records, mapping
 
-    # Query objects linked directly to accounts
+
+def _explore_window(
+    org: OrgConfig,
+    account_ids: Sequence[str],
+    config: ExplorerConfig,
+    plan: QueryPlan,
+    concurrency: int,
+    warnings: Dict[str, str],
+    progress: Optional[ProgressCallback] = None,
+    stats: Optional[Dict[str, object]] = None,
+) -> Tuple[List[Dict[str, object]], List[str], Dict[str, int]]:
+    """Query and assemble one window of accounts.
+
+    Returns the account payloads, the IDs that were not found and the number of
+    records fetched per object. ``progress`` receives ``object``, ``accounts``,
+    ``account`` and ``alerts`` events as they happen; ``stats`` records the
+    fetch strategy that was used and the IN-clause chunks queried per object.
+    """
+    alerts_config = config.get_alerts()
+    alert_object_keys = _get_alert_object_keys(alerts_config)
+    configured_objects = config.get_objects()
+    results: Dict[str, List[Dict[str, object]]] = {}
+
+    strategy, relationships, estimates = _choose_fetch_strategy(org, plan, account_ids)
+    stage_started = time.perf_counter()
+    chunks_before = {
+        object_key: dict(entry)
+        for object_key, entry in (stats or {}).get("chunks", {}).items()  # type: ignore[union-attr]
+    }
+    try:
+        first_results = _run_first_stage(
+            org, account_ids, plan, relationships, concurrency, warnings, progress, stats
+        )
+    except SalesforceError as exc:
+        if not relationships or not _is_recoverable_salesforce_error(exc):
+            raise
+        logger.warning("Relationship subqueries failed, querying objects separately: %s", exc)
+        strategy, relationships = FETCH_STRATEGY_PER_OBJECT, {}
+        if stats is not None:
+            # Count only the queries that produced the results; note the failed attempt.
+            stats["chunks"] = chunks_before
+            stats["subqueryFallbacks"] = int(stats.get("subqueryFallbacks", 0)) + 1  # type: ignore[arg-type]
+        first_results = _run_first_stage(
+            org, account_ids, plan, relationships, concurrency, warnings, progress, stats
+        )
+    if stats is not None:
+        stats["fetchStrategy"] = strategy
+        stats["estimatedCalls"] = estimates
+    account_records: Dict[str, Dict[str, object]] = {}
+    for record in first_results.pop("Account"):
+        record_id = record.get("Id")
+        if not record_id:
+            continue
+        account_records[str(record_id)] = record
+    missing_accounts = [account_id for account_id in account_ids if account_id not in account_records]
+    if progress is not None:
+        progress(
+            "accounts",
+            {
+                "count": len(account_records),
+                "missing": len(missing_accounts),
+                "seconds": round(time.perf_counter() - stage_started, 3),
+            },
+        )
     for object_key in _DIRECT_OBJECTS:
-        definition = _OBJECT_DEFINITIONS[object_key]
-        filter_field = definition["filter_field"]
-        query_fields, display_fields = _build_query_fields(org, object_key, config)
-        records: List[Dict[str, object]] = []
-        for chunk in _chunk(sanitized_ids, 100):
-            if object_key in warnings:
-                break
-            soql = (
-                f"SELECT {', '.join(query_fields)} FROM {object_key} WHERE {filter_field} IN ({_format_ids_for_soql(chunk)})"
-            )
-            data = _query_all_with_handling(org, soql, object_key, warnings)
-            records.extend(data.get("records", []))
-        results[object_key] = records
+        results[object_key] = first_results[object_key]
 
     contacts = results.get("Contact", [])
-    individuals_config = _build_query_fields(org, "Individual", config)
-    individual_query_fields, individual_display_fields = individuals_config
     individual_ids: List[str] = []
     contact_ids: List[str] = []
     for contact in contacts:
@@ -1835,135 +2487,58 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
         contact_id = contact.get("Id")
         if contact_id and str(contact_id) not in contact_ids:
             contact_ids.append(str(contact_id))
+
+    # Individuals and contact points only depend on the contact query
+    second_stage: Dict[str, Callable[[], object]] = {
+        "Individual": partial(
+            _query_records_by_ids,
+            org,
+            "Individual",
+            plan.get("Individual").query_fields,
+            "Id",
+            individual_ids,
+            warnings,
+            stats=stats,
+        ),
+    }
+    for object_key in _CONTACT_POINT_OBJECTS:
+        second_stage[object_key] = partial(
+            _query_contact_point_object,
+            org,
+            object_key,
+            config,
+            plan.get(object_key).query_fields,
+            individual_ids,
+            contact_ids,
+            warnings,
+            stats=stats,
+        )
+    second_results = _run_query_stage(_report_stage(second_stage, progress), concurrency)
+
     individual_records: Dict[str, Dict[str, object]] = {}
-    if individual_ids:
-        for chunk in _chunk(individual_ids, 100):
-            if "Individual" in warnings:
-                break
-            soql = f"SELECT {', '.join(individual_query_fields)} FROM Individual WHERE Id IN ({_format_ids_for_soql(chunk)})"
-            data = _query_all_with_handling(org, soql, "Individual", warnings)
-            for record in data.get("records", []):
-                record_id = record.get("Id")
-                if record_id:
-                    individual_records[str(record_id)] = record
+    for record in second_results["Individual"]:
+        record_id = record.get("Id")
+        if record_id:
+            individual_records[str(record_id)] = record
     results["Individual"] = list(individual_records.values())
 
-    # Contact points for individuals and contacts
     contact_point_mappings: Dict[
         str, Dict[str, MutableMapping[str, List[Dict[str, object]]]]
     ] = {}
     for object_key in _CONTACT_POINT_OBJECTS:
-        definition = _OBJECT_DEFINITIONS.get(object_key, {})
-        query_fields, display_fields = _build_query_fields(org, object_key, config)
-        records_by_id: Dict[str, Dict[str, object]] = {}
-        source_config = config.get_contact_point_sources(object_key)
-        active_sources = {
-            source for source, enabled in source_config.items() if enabled and source in _CONTACT_POINT_SOURCE_KEYS
-        }
-        if not active_sources:
-            results[object_key] = []
-            contact_point_mappings[object_key] = {"contact": {}, "individual": {}}
-            continue
-        individual_enabled = "individual" in active_sources
-        contact_enabled = "contact" in active_sources
-        if "individual_field" in definition:
-            raw_individual_field = definition.get("individual_field")
-        else:
-            raw_individual_field = "IndividualId"
-        if "contact_field" in definition:
-            raw_contact_field = definition.get("contact_field")
-        else:
-            raw_contact_field = "ContactId"
-        individual_field = ""
-        contact_field = ""
-        if raw_individual_field is not None:
-            individual_field = str(raw_individual_field)
-        if raw_contact_field is not None:
-            contact_field = str(raw_contact_field)
-        try:
-            available_contact_point_fields = _get_object_field_names(org, object_key)
-        except SalesforceError as exc:
-            logger.warning("Unable to describe %s: %s", object_key, exc)
-            available_contact_point_fields = set()
-        if not individual_enabled:
-            individual_field = ""
-        elif (
-            individual_field
-            and individual_field.lower() != "none"
-            and individual_field not in available_contact_point_fields
-        ):
-            individual_field = ""
-        if not contact_enabled:
-            contact_field = ""
-        elif (
-            contact_field
-            and contact_field.lower() != "none"
-            and contact_field not in available_contact_point_fields
-        ):
-            contact_field = ""
-        if (
-            individual_enabled
-            and individual_field
-            and individual_field.lower() != "none"
-            and individual_ids
-        ):
-            for chunk in _chunk(individual_ids, 100):
-                if object_key in warnings:
-                    break
-                soql = (
-                    f"SELECT {', '.join(query_fields)} FROM {object_key} WHERE {individual_field} IN ({_format_ids_for_soql(chunk)})"
-                )
-                data = _query_all_with_handling(org, soql, object_key, warnings)
-                for record in data.get("records", []):
-                    _store_contact_point_record(records_by_id, record, "individual")
-        if (
-            object_key not in warnings
-            and contact_enabled
-            and contact_field
-            and contact_field.lower() != "none"
-            and contact_ids
-        ):
-            for chunk in _chunk(contact_ids, 100):
-                if object_key in warnings:
-                    break
-                soql = (
-                    f"SELECT {', '.join(query_fields)} FROM {object_key} WHERE {contact_field} IN ({_format_ids_for_soql(chunk)})"
-                )
-                data = _query_all_with_handling(org, soql, object_key, warnings)
-                for record in data.get("records", []):
-                    _store_contact_point_record(records_by_id, record, "contact")
-        records = list(records_by_id.values())
+        records, mapping = second_results[object_key]
         results[object_key] = records
-        contact_point_mappings[object_key] = _aggregate_contact_points(
-            records,
-            contact_field=contact_field,
-            individual_field=individual_field,
-            active_sources=active_sources,
-        )
+        contact_point_mappings[object_key] = mapping
 
-    contact_by_account = _map_records_by_field(contacts, "AccountId")
+    direct_records_by_account = _index_direct_records(results)
+    contact_by_account = direct_records_by_account["Contact"]
     individual_by_account = _aggregate_individuals_by_account(contacts, individual_records)
 
-    generated_at = datetime.now(timezone.utc).isoformat()
-    configured_objects = config.get_objects()
-
-    explorer_data: Dict[str, object] = {
-        "accounts": [],
-        "objects": configured_objects,
-        "config": {key: config.get_fields(key) for key in _OBJECT_DEFINITIONS.keys()},
-        "alerts": alerts_config,
-        "summary": {},
-    }
-    if warnings:
-        explorer_data["warnings"] = dict(warnings)
-
-    summary_counts: Dict[str, int] = {}
-    for obj in configured_objects:
-        summary_counts[obj["key"]] = len(results.get(obj["key"], []))
-    explorer_data["summary"] = summary_counts
-
+    payloads: List[Dict[str, object]] = []
+    alert_seconds = 0.0
+    flagged_accounts = 0
     configured_keys = {obj["key"] for obj in configured_objects}
-    for account_id in sanitized_ids:
+    for account_id in account_ids:
         account_record = account_records.get(account_id) or {}
         required_object_keys = set(configured_keys)
         required_object_keys.update(alert_object_keys)
@@ -1977,7 +2552,7 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
             related_records = _get_related_records_for_account(
                 object_key,
                 account_id,
-                results=results,
+                direct_records_by_account=direct_records_by_account,
                 contact_by_account=contact_by_account,
                 individual_by_account=individual_by_account,
                 individual_records=individual_records,
@@ -1985,11 +2560,15 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
             )
             records_by_object[object_key] = _prepare_records_with_keys(object_key, related_records)
 
+        alerts_started = time.perf_counter()
         triggered_alerts, record_alert_details, field_alert_details = _evaluate_alerts_for_account(
             alerts_config,
             (account_id, account_record),
             records_by_object,
         )
+        alert_seconds += time.perf_counter() - alerts_started
+        if triggered_alerts:
+            flagged_accounts += 1
 
         account_field_alerts = field_alert_details.get("Account", {}).get(account_id, {})
         account_alert_entries = record_alert_details.get("Account", {}).get(account_id, [])
@@ -1997,9 +2576,9 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
         account_payload = {
             "id": account_id,
             "fields": _record_to_field_list(
-                account_display_fields,
+                plan.get("Account").display_fields,
                 account_record,
-                extra_fields=_get_object_link_fields("Account"),
+                extra_fields=plan.get("Account").link_fields,
                 alert_details=account_field_alerts,
             ),
             "related": {},
@@ -2011,7 +2590,7 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
 
         for obj in configured_objects:
             key = obj["key"]
-            _, display_fields = _build_query_fields(org, key, config)
+            object_plan = plan.get(key)
             record_pairs = records_by_object.get(key, [])
             record_alert_map = record_alert_details.get(key, {})
             field_alert_map = field_alert_details.get(key, {})
@@ -2029,9 +2608,9 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
                 record_payload: Dict[str, object] = {
                     "id": record.get("Id"),
                     "fields": _record_to_field_list(
-                        display_fields,
+                        object_plan.display_fields,
                         record,
-                        extra_fields=_get_object_link_fields(key),
+                        extra_fields=object_plan.link_fields,
                         alert_details=field_alerts_for_record,
                     ),
                 }
@@ -2045,13 +2624,239 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
                     record_payload["alertDetails"] = record_alerts_for_record
                 payload_records.append(record_payload)
             account_payload["related"][key] = payload_records
-        explorer_data["accounts"].append(account_payload)
+        payloads.append(account_payload)
+        if progress is not None:
+            progress("account", account_payload)
+
+    if progress is not None:
+        progress(
+            "alerts",
+            {
+                "accounts": len(payloads),
+                "flagged": flagged_accounts,
+                "seconds": round(alert_seconds, 3),
+            },
+        )
+    record_counts = {object_key: len(records) for object_key, records in results.items()}
+    return payloads, missing_accounts, record_counts
+
+
+def _run_first_stage(
+    org: OrgConfig,
+    account_ids: Sequence[str],
+    plan: QueryPlan,
+    relationships: Dict[str, str],
+    concurrency: int,
+    warnings: Dict[str, str],
+    progress: Optional[ProgressCallback],
+    stats: Optional[Dict[str, object]] = None,
+) -> Dict[str, List[Dict[str, object]]]:
+    """Fetch accounts and the objects linked directly to them.
+
+    Objects listed in ``relationships`` come back nested in the Account query;
+    the others get their own IN query. With Composite Batch enabled all chunk
+    queries share batch round trips instead of running as separate requests.
+    """
+    if _fetch_settings["composite_batch"]:
+        return _run_first_stage_batched(
+            org, account_ids, plan, relationships, warnings, progress, stats
+        )
+    # Accounts and the objects linked directly to them only depend on the ID list
+    first_stage: Dict[str, Callable[[], object]] = {}
+    if relationships:
+        first_stage["Account"] = partial(
+            _query_accounts_with_children, org, plan, account_ids, relationships, warnings, stats
+        )
+    else:
+        first_stage["Account"] = partial(
+            _query_records_by_ids,
+            org,
+            "Account",
+            plan.get("Account").query_fields,
+            "Id",
+            account_ids,
+            warnings,
+            required=True,
+            stats=stats,
+        )
+    for object_key in _DIRECT_OBJECTS:
+        if object_key in relationships:
+            continue
+        first_stage[object_key] = partial(
+            _query_records_by_ids,
+            org,
+            object_key,
+            plan.get(object_key).query_fields,
+            str(_OBJECT_DEFINITIONS[object_key]["filter_field"]),
+            account_ids,
+            warnings,
+            stats=stats,
+        )
+    stage_started = time.perf_counter()
+    first_results = _run_query_stage(_report_stage(first_stage, progress), concurrency)
+    if relationships:
+        first_results["Account"], children = first_results["Account"]
+        for object_key, records in children.items():
+            first_results[object_key] = records
+            if progress is not None:
+                progress(
+                    "object",
+                    {
+                        "object": object_key,
+                        "count": len(records),
+                        "seconds": round(time.perf_counter() - stage_started, 3),
+                    },
+                )
+    return first_results
+
+
+def _run_first_stage_batched(
+    org: OrgConfig,
+    account_ids: Sequence[str],
+    plan: QueryPlan,
+    relationships: Dict[str, str],
+    warnings: Dict[str, str],
+    progress: Optional[ProgressCallback],
+    stats: Optional[Dict[str, object]] = None,
+) -> Dict[str, List[Dict[str, object]]]:
+    stage_started = time.perf_counter()
+    queries: Dict[str, List[str]] = {}
+    if relationships:
+        queries["Account"] = _build_account_subqueries(plan, account_ids, relationships, stats)
+    else:
+        queries["Account"] = _build_id_queries(
+            "Account", plan.get("Account").query_fields, "Id", account_ids, stats
+        )
+    for object_key in _DIRECT_OBJECTS:
+        if object_key in relationships:
+            continue
+        queries[object_key] = _build_id_queries(
+            object_key,
+            plan.get(object_key).query_fields,
+            str(_OBJECT_DEFINITIONS[object_key]["filter_field"]),
+            account_ids,
+            stats,
+        )
+    first_results = _run_batched_queries(org, queries, warnings, required=("Account",))
+    if relationships:
+        first_results.update(
+            _collect_nested_children(
+                org,
+                plan,
+                account_ids,
+                first_results["Account"],
+                relationships,
+                warnings,
+                batched=True,
+                stats=stats,
+            )
+        )
+    if progress is not None:
+        seconds = round(time.perf_counter() - stage_started, 3)
+        for object_key, records in first_results.items():
+            progress("object", {"object": object_key, "count": len(records), "seconds": seconds})
+    return first_results
+
+
+def _report_stage(
+    tasks: Dict[str, Callable[[], object]], progress: Optional[ProgressCallback]
+) -> Dict[str, Callable[[], object]]:
+    """Wrap query tasks so each reports its record count and duration when done."""
+    if progress is None:
+        return tasks
+
+    def timed(object_key: str, task: Callable[[], object]) -> object:
+        started = time.perf_counter()
+        result = task()
+        records = result[0] if isinstance(result, tuple) else result
+        progress(
+            "object",
+            {
+                "object": object_key,
+                "count": len(records),
+                "seconds": round(time.perf_counter() - started, 3),
+            },
+        )
+        return result
+
+    return {object_key: partial(timed, object_key, task) for object_key, task in tasks.items()}
+
+
+def _build_explorer_data(
+    config: ExplorerConfig,
+    accounts: List[Dict[str, object]],
+    record_counts: Dict[str, int],
+    warnings: Dict[str, str],
+    stats: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    configured_objects = config.get_objects()
+    explorer_data: Dict[str, object] = {
+        "accounts": accounts,
+        "objects": configured_objects,
+        "config": {key: config.get_fields(key) for key in _OBJECT_DEFINITIONS.keys()},
+        "alerts": config.get_alerts(),
+        "summary": {obj["key"]: record_counts.get(obj["key"], 0) for obj in configured_objects},
+    }
+    if warnings:
+        explorer_data["warnings"] = dict(warnings)
+    if stats:
+        explorer_data["stats"] = dict(stats)
+    return explorer_data
+
 
+def _new_result_path(run_id: Optional[str] = None) -> Path:
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-    filename = f"account_explorer_{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}.json"
-    file_path = RESULTS_DIR / filename
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    filename = f"account_explorer_{timestamp}_{run_id or uuid.uuid4().hex}.json"
+    return RESULTS_DIR / filename
+
+
+def run_explorer(
+    org: OrgConfig,
+    account_ids: Sequence[str],
+    concurrency: int = QUERY_CONCURRENCY,
+    progress: Optional[ProgressCallback] = None,
+    session_state: Optional[ExplorerSession] = None,
+) -> ExplorerResult:
+    sanitized_ids = _sanitize_account_ids(account_ids)
+    if not sanitized_ids:
+        raise ValueError("no_valid_ids")
+
+    config = get_config()
+    warnings: Dict[str, str] = {}
+    stats: Dict[str, object] = {}
+    if progress is not None:
+        header = _build_explorer_data(config, [], {}, {})
+        progress(
+            "start",
+            {
+                "total": len(sanitized_ids),
+                "objects": header["objects"],
+                "config": header["config"],
+                "alerts": header["alerts"],
+            },
+        )
+    plan = _build_query_plan(org, config, concurrency)
+    accounts, missing_accounts, record_counts = _explore_window(
+        org, sanitized_ids, config, plan, concurrency, warnings, progress, stats
+    )
+
+    generated_at = datetime.now(timezone.utc).isoformat()
+    explorer_data = _build_explorer_data(config, accounts, record_counts, warnings, stats)
+
+    write_started = time.perf_counter()
+    file_path = _new_result_path()
     with file_path.open("w", encoding="utf-8") as fh:
         json.dump(explorer_data, fh, ensure_ascii=False, indent=2, default=str)
+    if progress is not None:
+        try:
+            progress(
+                "file",
+                {"name": file_path.name, "seconds": round(time.perf_counter() - write_started, 3)},
+            )
+        except _StreamClosed:
+            file_path.unlink(missing_ok=True)
+            raise
 
     explorer_result = ExplorerResult(
         account_ids=sanitized_ids,
@@ -2060,10 +2865,188 @@ def run_explorer(org: OrgConfig, account_ids: Sequence[str]) -> ExplorerResult:
         data=explorer_data,
         file_path=str(file_path),
     )
-    session_state = get_session()
+    if session_state is None:
+        session_state = get_session()
     session_state.result = explorer_result
     return explorer_result
 
 
+class _StreamClosed(Exception):
+    """Raised from the progress callback once the client stops reading the stream."""
+
+
+def stream_explorer(
+    org: OrgConfig, account_ids: Sequence[str], concurrency: int = QUERY_CONCURRENCY
+) -> Iterator[Tuple[str, Dict[str, object]]]:
+    """Run the explorer in a worker thread and yield its progress events.
+
+    The last event is ``result`` (the result without the account payloads, which
+    were already sent as ``account`` events) or ``error``.
+    """
+    if not _sanitize_account_ids(account_ids):
+        raise ValueError("no_valid_ids")
+    session_state = get_session()
+    events: "queue.Queue[Optional[Tuple[str, Dict[str, object]]]]" = queue.Queue()
+    closed = threading.Event()
+    started = time.perf_counter()
+
+    def publish(event: str, data: Dict[str, object]) -> None:
+        # Progress is reported throughout the run, so this is where a run whose
+        # client went away is stopped.
+        if closed.is_set():
+            raise _StreamClosed()
+        events.put((event, {**data, "elapsed": round(time.perf_counter() - started, 3)}))
+
+    def run() -> None:
+        try:
+            result = run_explorer(
+                org, account_ids, concurrency, progress=publish, session_state=session_state
+            )
+            payload = result.to_dict()
+            payload["data"] = {key: value for key, value in result.data.items() if key != "accounts"}
+            publish("result", payload)
+        except _StreamClosed:
+            logger.info("Account explorer stream closed by the client; run stopped")
+        except SalesforceError as exc:
+            publish("error", {"error": str(exc)})
+        except ValueError as exc:
+            code = exc.args[0] if exc.args and isinstance(exc.args[0], str) else "invalid_accounts"
+            publish("error", {"error": "invalid_accounts", "code": code})
+        except Exception:
+            logger.exception("Account explorer run failed")
+            publish("error", {"error": "run_failed", "code": "run_failed"})
+        finally:
+            events.put(None)
+
+    threading.Thread(target=run, name="account-explorer-stream", daemon=True).start()
+
+    def iterate() -> Iterator[Tuple[str, Dict[str, object]]]:
+        try:
+            while True:
+                item = events.get()
+                if item is None:
+                    return
+                yield item
+        finally:
+            closed.set()
+
+    return iterate()
+
+
+def start_explorer_job(
+    org: OrgConfig, account_ids: Sequence[str], concurrency: int = QUERY_CONCURRENCY
+) -> ExplorerJob:
+    """Run the explorer in a background thread, window by window."""
+    sanitized_ids = _sanitize_account_ids(account_ids, limit=None)
+    if not sanitized_ids:
+        raise ValueError("no_valid_ids")
+    session_id = _ensure_session_id()
+    with _jobs_lock:
+        _prune_jobs()
+        if any(job.session_id == session_id and not job.finished for job in _jobs.values()):
+            raise ValueError("job_running")
+        job = ExplorerJob(id=uuid.uuid4().hex, session_id=session_id, account_ids=sanitized_ids)
+        _jobs[job.id] = job
+    thread = threading.Thread(
+        target=_run_explorer_job,
+        args=(job, org, concurrency),
+        name=f"account-explorer-job-{job.id[:8]}",
+        daemon=True,
+    )
+    thread.start()
+    return job
+
+
+def get_job(job_id: str) -> Optional[ExplorerJob]:
+    """Return the job if it belongs to the current browser session."""
+    session_id = _ensure_session_id()
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    if job is None or job.session_id != session_id:
+        return None
+    return job
+
+
+def cancel_job(job_id: str) -> Optional[ExplorerJob]:
+    job = get_job(job_id)
+    if job is not None and not job.finished:
+        job.cancel_event.set()
+    return job
+
+
+def _prune_jobs() -> None:
+    cutoff = time.monotonic() - JOB_RETENTION
+    for job_id in [
+        job_id
+        for job_id, job in _jobs.items()
+        if job.finished_at is not None and job.finished_at < cutoff
+    ]:
+        del _jobs[job_id]
+
+
+def _run_explorer_job(job: ExplorerJob, org: OrgConfig, concurrency: int) -> None:
+    job.state = "running"
+    file_path = _new_result_path(job.id)
+    try:
+        config = get_config()
+        plan = _build_query_plan(org, config, concurrency)
+        warnings: Dict[str, str] = {}
+        stats: Dict[str, object] = {}
+        record_counts: Dict[str, int] = {}
+        missing_accounts: List[str] = []
+        preview: List[Dict[str, object]] = []
+        with file_path.open("w", encoding="utf-8") as fh:
+            # Account payloads are streamed into the file as each window completes;
+            # the remaining keys are written once the totals are known.
+            fh.write('{"accounts": [')
+            separator = "\n"
+            for window in _chunk(job.account_ids, JOB_WINDOW_SIZE):
+                if job.cancel_event.is_set():
+                    break
+                accounts, window_missing, window_counts = _explore_window(
+                    org, window, config, plan, concurrency, warnings, stats=stats
+                )
+                for account_payload in accounts:
+                    fh.write(separator)
+                    json.dump(account_payload, fh, ensure_ascii=False, default=str)
+                    separator = ",\n"
+                    if len(preview) < JOB_PREVIEW_ACCOUNTS:
+                        preview.append(account_payload)
+                for object_key, count in window_counts.items():
+                    record_counts[object_key] = record_counts.get(object_key, 0) + count
+                missing_accounts.extend(window_missing)
+                job.processed += len(window)
+                job.missing = len(missing_accounts)
+            explorer_data = _build_explorer_data(config, [], record_counts, warnings, stats)
+            del explorer_data["accounts"]
+            fh.write("\n], ")
+            fh.write(json.dumps(explorer_data, ensure_ascii=False, default=str)[1:])
+        if job.cancel_event.is_set():
+            file_path.unlink(missing_ok=True)
+            job.state = "cancelled"
+            return
+        explorer_data["accounts"] = preview
+        explorer_data["totalAccounts"] = len(job.account_ids)
+        explorer_data["truncated"] = len(preview) < len(job.account_ids)
+        _get_session_by_id(job.session_id).result = ExplorerResult(
+            account_ids=job.account_ids,
+            missing_account_ids=missing_accounts,
+            generated_at=datetime.now(timezone.utc).isoformat(),
+            data=explorer_data,
+            file_path=str(file_path),
+        )
+        job.state = "done"
+    except Exception as exc:
+        file_path.unlink(missing_ok=True)
+        if isinstance(exc, SalesforceError):
+            job.error = str(exc)
+        else:
+            logger.exception("Account explorer job %s failed", job.id)
+            job.error = "run_failed"
+        job.state = "failed"
+    finally:
+        job.finished_at = time.monotonic()
+
+
 def describe_object(org: OrgConfig, object_name: str) -> List[Dict[str, str]]:
     return describe_sobject(org, object_name)
@@ -1,18 +1,46 @@
 from __future__ import annotations
 
+import bisect
 import csv
 import io
+import logging
+import os
+import sys
 import threading
+import time
 import uuid
+from array import array
 from collections import defaultdict, deque
+from collections.abc import Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, MutableMapping, Optional, Sequence, Set, Tuple
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Sequence, Set, Tuple, Union
 
 from flask import session
 
+from . import import_snapshot
+from .session_store import session_manager
+
+logger = logging.getLogger(__name__)
+
 DATA_IMPORT_SESSION_KEY = "data_import_session_id"
 
+DEFAULT_PARSE_PROCESSES = 2
+DEFAULT_PARSE_PROCESS_THRESHOLD = 5 * 1024 * 1024
+BATCH_PARSE_THREADS = 4
+PROGRESS_INTERVAL = 5000
+
+_parse_pool_settings = {
+    "processes": DEFAULT_PARSE_PROCESSES,
+    "threshold": DEFAULT_PARSE_PROCESS_THRESHOLD,
+}
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+PARSE_JOB_RETENTION = 3600.0
+
 DATA_IMPORT_OBJECTS: List[Dict[str, str]] = [
     {"key": "Account", "label": "Account"},
     {"key": "BillingProfile__c", "label": "Billing Profile"},
@@ -28,57 +56,908 @@ DATA_IMPORT_OBJECTS: List[Dict[str, str]] = [
 ]
 
 _OBJECT_LOOKUP = {item["key"]: item for item in DATA_IMPORT_OBJECTS}
+_OBJECT_ORDER = {item["key"]: index for index, item in enumerate(DATA_IMPORT_OBJECTS)}
+
+LINK_MODE_ALL = "all"
+LINK_MODE_SALESFORCE_IDS = "salesforce_ids"
+LINK_MODES = (LINK_MODE_ALL, LINK_MODE_SALESFORCE_IDS)
+
+# Standard key prefixes; custom objects use org-specific prefixes and are not checked.
+_ID_PREFIXES: Dict[str, str] = {
+    "Account": "001",
+    "Contact": "003",
+    "Contract": "800",
+    "AccountContactRelation": "07k",
+    "Individual": "0PK",
+    "Case": "500",
+    "Order": "801",
+}
+
+
+class ColumnarRecords(Mapping):
+    """Read-only ``{record_id: {field: value}}`` mapping stored column by column.
+
+    Each field keeps one array of codes into a per-column dictionary of distinct
+    values, so repeated values and field names are stored once per column.
+    """
+
+    def __init__(self, fields: Sequence[str]) -> None:
+        self.fields: List[str] = list(fields)
+        self._field_positions = {field_name: index for index, field_name in enumerate(self.fields)}
+        self._ids: Sequence[str] = []
+        # Built on first lookup for wrapped columns; see _rows.
+        self._row_by_id: Optional[Dict[str, int]] = {}
+        self._columns: List[array] = [array("I") for _ in self.fields]
+        self._dictionaries: List[List[str]] = [[] for _ in self.fields]
+        self._encoders: Optional[List[Dict[str, int]]] = [{} for _ in self.fields]
+        self._memory_bytes: Optional[int] = None
+
+    @classmethod
+    def from_mapping(
+        cls, fields: Sequence[str], records: Mapping[str, Mapping[str, str]]
+    ) -> "ColumnarRecords":
+        columnar = cls(fields)
+        for record_id, record in records.items():
+            columnar.append(record_id, [record.get(field_name, "") for field_name in columnar.fields])
+        columnar.freeze()
+        return columnar
+
+    @classmethod
+    def from_columns(
+        cls,
+        fields: Sequence[str],
+        ids: Sequence[str],
+        columns: Sequence[Sequence[int]],
+        dictionaries: Sequence[Sequence[str]],
+    ) -> "ColumnarRecords":
+        """Wrap already encoded columns, e.g. memory-mapped snapshot buffers.
+
+        The id lookup is only built once a record is looked up by id.
+        """
+        columnar = cls(fields)
+        columnar._ids = ids
+        columnar._row_by_id = None
+        columnar._columns = list(columns)
+        columnar._dictionaries = list(dictionaries)
+        columnar._encoders = None
+        return columnar
+
+    def __reduce__(self):
+        # Mapped buffers cannot be pickled, so copy them into plain arrays and lists.
+        self.freeze()
+        columns = [
+            array(_typecode_for(len(dictionary)), column)
+            for column, dictionary in zip(self._columns, self._dictionaries)
+        ]
+        dictionaries = [list(dictionary) for dictionary in self._dictionaries]
+        return (ColumnarRecords.from_columns, (self.fields, list(self._ids), columns, dictionaries))
+
+    def iter_encoded_columns(self) -> Iterator[Tuple[Sequence[int], Sequence[str]]]:
+        return iter(zip(self._columns, self._dictionaries))
+
+    def append(self, record_id: str, values: Sequence[str]) -> None:
+        if self._encoders is None:
+            raise RuntimeError("records are frozen")
+        self._row_by_id[record_id] = len(self._ids)
+        self._ids.append(record_id)
+        for column, dictionary, encoder, value in zip(
+            self._columns, self._dictionaries, self._encoders, values
+        ):
+            code = encoder.get(value)
+            if code is None:
+                code = len(dictionary)
+                encoder[value] = code
+                dictionary.append(value)
+            column.append(code)
+
+    def freeze(self) -> None:
+        """Drop the build-time encoders and narrow each code array to fit."""
+        if self._encoders is None:
+            return
+        self._encoders = None
+        for position, dictionary in enumerate(self._dictionaries):
+            typecode = _typecode_for(len(dictionary))
+            if typecode != self._columns[position].typecode:
+                self._columns[position] = array(typecode, self._columns[position])
+
+    def _rows(self) -> Dict[str, int]:
+        if self._row_by_id is None:
+            self._row_by_id = {record_id: row for row, record_id in enumerate(self._ids)}
+            self._memory_bytes = None
+        return self._row_by_id
+
+    def __getitem__(self, record_id: str) -> "_RecordView":
+        return _RecordView(self, self._rows()[record_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, record_id: object) -> bool:
+        return record_id in self._rows()
+
+    def get(self, record_id: str, default=None):
+        row = self._rows().get(record_id)
+        if row is None:
+            return default
+        return _RecordView(self, row)
+
+    def row_of(self, record_id: str) -> int:
+        return self._rows()[record_id]
+
+    def value(self, row: int, field_name: str) -> Optional[str]:
+        position = self._field_positions.get(field_name)
+        if position is None:
+            return None
+        return self._dictionaries[position][self._columns[position][row]]
+
+    def encoded_column(self, field_name: str) -> Tuple[array, List[str]]:
+        """Return the code array and distinct-value dictionary of one field."""
+        position = self._field_positions[field_name]
+        return self._columns[position], self._dictionaries[position]
+
+    def iter_column(self, field_name: str) -> Iterator[Tuple[str, str]]:
+        codes, dictionary = self.encoded_column(field_name)
+        for record_id, code in zip(self._ids, codes):
+            yield record_id, dictionary[code]
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by ids, code arrays and distinct values."""
+        if self._memory_bytes is None or self._encoders is not None:
+            total = sys.getsizeof(self._ids) + sys.getsizeof(self._row_by_id)
+            if isinstance(self._ids, list):
+                total += sum(sys.getsizeof(record_id) for record_id in self._ids)
+            if self._row_by_id:
+                # The lookup holds its own decoded copies of mapped ids.
+                total += len(self._row_by_id) * _INT_SIZE
+                if not isinstance(self._ids, list):
+                    total += sum(map(sys.getsizeof, self._row_by_id))
+            for column, dictionary in zip(self._columns, self._dictionaries):
+                total += sys.getsizeof(column) + sys.getsizeof(dictionary)
+                if isinstance(dictionary, list):
+                    # Memory-mapped dictionaries live in the shared page cache instead.
+                    total += sum(sys.getsizeof(value) for value in dictionary)
+            self._memory_bytes = total
+        return self._memory_bytes
+
+
+def _typecode_for(size: int) -> str:
+    if size <= 0x100:
+        return "B"
+    if size <= 0x10000:
+        return "H"
+    return "I"
+
+
+class _RecordView(Mapping):
+    __slots__ = ("_records", "_row")
+
+    def __init__(self, records: ColumnarRecords, row: int) -> None:
+        self._records = records
+        self._row = row
+
+    def __getitem__(self, field_name: str) -> str:
+        value = self._records.value(self._row, field_name)
+        if value is None:
+            raise KeyError(field_name)
+        return value
+
+    def get(self, field_name: str, default=None):
+        value = self._records.value(self._row, field_name)
+        return default if value is None else value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records.fields)
+
+    def __len__(self) -> int:
+        return len(self._records.fields)
 
 
 @dataclass
 class ObjectDataset:
     fields: List[str]
-    records: Dict[str, Dict[str, str]]
+    records: ColumnarRecords
     filename: str
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.records, ColumnarRecords):
+            self.records = ColumnarRecords.from_mapping(self.fields, self.records)
+
+    def memory_usage(self) -> int:
+        return self.records.memory_usage()
+
+
+@dataclass
+class ImportJob:
+    """Background parse of one uploaded file, applied to its session when done."""
+
+    id: str
+    object_key: str
+    filename: str
+    source_path: str
+    future: Future
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    state: str = "running"
+    error: Optional[str] = None
+    rows: int = 0
+
+    @property
+    def progress_path(self) -> str:
+        return self.source_path + ".progress"
+
+    def read_progress(self) -> int:
+        if self.state == "running":
+            try:
+                self.rows = int(Path(self.progress_path).read_text(encoding="utf-8") or 0)
+            except (OSError, ValueError):
+                pass
+        return self.rows
+
+    def cleanup(self) -> None:
+        for path in (self.source_path, self.progress_path):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "id": self.id,
+            "object": self.object_key,
+            "filename": self.filename,
+            "state": self.state,
+            "error": self.error,
+            "rows": self.read_progress(),
+            "startedAt": self.started_at.isoformat(),
+        }
+
+
+# Session id -> object key -> latest background parse. Jobs live outside the
+# sessions so one spilled to disk mid-parse finds them again once reloaded.
+_parse_jobs: Dict[str, Dict[str, ImportJob]] = {}
+_parse_jobs_lock = threading.Lock()
+
+
+def _prune_parse_jobs() -> None:
+    """Drop finished jobs of sessions that never came back for them."""
+    cutoff = datetime.now(timezone.utc).timestamp() - PARSE_JOB_RETENTION
+    with _parse_jobs_lock:
+        for session_id, jobs in list(_parse_jobs.items()):
+            for object_key, job in list(jobs.items()):
+                if job.future.done() and job.started_at.timestamp() < cutoff:
+                    job.cleanup()
+                    del jobs[object_key]
+            if not jobs:
+                del _parse_jobs[session_id]
+
+
+Node = Tuple[str, str]
+
+# Joins the lower-cased distinct values of a field into one searchable blob.
+_VALUE_SEPARATOR = "\x00"
+
+# Sizes used to estimate the memory of the link index without walking its tuples.
+_NODE_SIZE = sys.getsizeof(("", ""))
+_INT_SIZE = sys.getsizeof(1 << 30)
+
+
+class FieldIndex:
+    """Lazily built lookup structures for one (object, field) pair."""
+
+    def __init__(self, dataset: ObjectDataset, field_name: str) -> None:
+        self._dataset = dataset
+        self._field_name = field_name
+        self._exact: Optional[Dict[str, List[str]]] = None
+        self._values: Optional[List[str]] = None
+        self._blob = ""
+        self._offsets: List[int] = []
+        self._memory_bytes: Optional[int] = None
+
+    def _iter_values(self) -> Iterable[Tuple[str, str]]:
+        for record_id, value in self._dataset.records.iter_column(self._field_name):
+            yield record_id, value.strip()
+
+    def lookup(self, normalized_value: str) -> List[str]:
+        if self._exact is None:
+            exact: Dict[str, List[str]] = {}
+            for record_id, value in self._iter_values():
+                exact.setdefault(value.lower(), []).append(record_id)
+            self._exact = exact
+            self._memory_bytes = None
+        return self._exact.get(normalized_value, [])
+
+    def _ensure_values(self) -> List[str]:
+        if self._values is None:
+            values = sorted({value for _, value in self._iter_values() if value})
+            lowered = [value.lower() for value in values]
+            offsets = []
+            position = 0
+            for value in lowered:
+                offsets.append(position)
+                position += len(value) + 1
+            self._blob = _VALUE_SEPARATOR.join(lowered)
+            self._offsets = offsets
+            self._values = values
+            self._memory_bytes = None
+        return self._values
+
+    def complete(self, normalized_term: str, limit: int) -> List[str]:
+        values = self._ensure_values()
+        if not normalized_term:
+            return values[:limit] if limit else list(values)
+        if _VALUE_SEPARATOR in normalized_term:
+            matches = [value for value in values if normalized_term in value.lower()]
+            return matches[:limit] if limit else matches
+        # Values are sorted, so walking the blob front to back yields matches in order.
+        matches: List[str] = []
+        blob = self._blob
+        start = blob.find(normalized_term)
+        while start != -1:
+            index = bisect.bisect_right(self._offsets, start) - 1
+            matches.append(values[index])
+            if limit and len(matches) >= limit:
+                break
+            next_value = index + 1
+            if next_value >= len(values):
+                break
+            start = blob.find(normalized_term, self._offsets[next_value])
+        return matches
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the structures built so far."""
+        if self._memory_bytes is None:
+            total = sys.getsizeof(self._blob) + sys.getsizeof(self._offsets)
+            total += len(self._offsets) * _INT_SIZE
+            if self._values is not None:
+                total += sys.getsizeof(self._values) + sum(map(sys.getsizeof, self._values))
+            if self._exact is not None:
+                total += sys.getsizeof(self._exact)
+                total += sum(sys.getsizeof(key) + sys.getsizeof(ids) for key, ids in self._exact.items())
+            self._memory_bytes = total
+        return self._memory_bytes
+
 
 class ImportSession:
-    def __init__(self) -> None:
+    def __init__(self, session_id: Optional[str] = None) -> None:
+        self.session_id = session_id
+        # Signature of the on-disk snapshot this session was loaded from or saved to.
+        self.snapshot_signature: Optional[Tuple[int, int]] = None
         self.objects: Dict[str, ObjectDataset] = {}
-        self._links: MutableMapping[Tuple[str, str], Set[Tuple[str, str]]] = defaultdict(set)
+        self.link_mode = LINK_MODE_ALL
+        # Object key -> the only columns scanned for references (all when unset).
+        self.reference_fields: Dict[str, List[str]] = {}
+        self._links: MutableMapping[Node, Set[Node]] = defaultdict(set)
+        # Id key (see _record_key) -> node references resolve to. As in a full
+        # scan, the record of the object loaded last wins when several share a key.
+        self._id_index: Dict[str, Node] = {}
+        # Id key -> every node holding it, only for keys held by more than one.
+        self._id_collisions: Dict[str, List[Node]] = {}
+        # Target node -> source nodes whose field values reference it.
+        self._referrers: MutableMapping[Node, Set[Node]] = defaultdict(set)
+        # Object key -> token -> id(s) of records in that object holding the token
+        # without a loaded record to point at (yet); see _add_dangling.
+        self._dangling: Dict[str, Dict[str, Union[str, List[str]]]] = {}
+        self._field_indexes: Dict[Tuple[str, str], FieldIndex] = {}
+        # Union-find over linked nodes; removals mark it dirty for a lazy rebuild.
+        self._parent: Dict[Node, Node] = {}
+        self._members: Dict[Node, List[Node]] = {}
+        self._components_dirty = False
+        # Saved link index waiting to be installed; see restore_link_index.
+        self._pending_link_index: Optional[Tuple[Iterable[Tuple[Node, Node]], Dict[str, object]]] = None
+        # Cached estimate of the link structures above; None after they change.
+        self._link_memory_bytes: Optional[int] = None
+        # Jobs of a session without an id; see the jobs property.
+        self._jobs: Dict[str, ImportJob] = {}
+
+    @property
+    def jobs(self) -> Dict[str, ImportJob]:
+        """Object key -> latest background parse of an upload for that object."""
+        if not self.session_id:
+            return self._jobs
+        with _parse_jobs_lock:
+            return _parse_jobs.setdefault(self.session_id, {})
 
     def set_object_data(self, object_key: str, dataset: ObjectDataset) -> None:
+        self._ensure_link_index()
+        if object_key in self.objects:
+            self._unlink_object(object_key)
+        self._drop_field_indexes(object_key)
         self.objects[object_key] = dataset
-        self._rebuild_links()
+        self._link_object(object_key)
 
-    def clear_object_data(self, object_key: str) -> bool:
-        removed = self.objects.pop(object_key, None) is not None
-        if removed:
+    def set_objects_data(self, datasets: Dict[str, ObjectDataset]) -> None:
+        """Install several datasets with one pass over the link index."""
+        for object_key in datasets:
+            self.cancel_parse_job(object_key)
+            self._drop_field_indexes(object_key)
+        if set(datasets) >= set(self.objects):
+            # Everything is replaced: start from an empty index instead of unlinking.
+            self.objects = {**self.objects, **datasets}
             self._rebuild_links()
-        return removed
+            return
+        self._ensure_link_index()
+        for object_key in datasets:
+            if object_key in self.objects:
+                self._unlink_object(object_key)
+        self.objects.update(datasets)
+        for object_key in datasets:
+            self._link_object(object_key)
+
+    def clear_object_data(self, object_key: str) -> bool:
+        cancelled = self.cancel_parse_job(object_key)
+        if object_key not in self.objects:
+            return cancelled
+        self._ensure_link_index()
+        self._unlink_object(object_key)
+        self._drop_field_indexes(object_key)
+        del self.objects[object_key]
+        return True
+
+    def _drop_field_indexes(self, object_key: str) -> None:
+        for key in [key for key in self._field_indexes if key[0] == object_key]:
+            del self._field_indexes[key]
+
+    def _get_field_index(self, object_key: str, field_name: str) -> Optional[FieldIndex]:
+        dataset = self.objects.get(object_key)
+        if not dataset or field_name not in dataset.fields:
+            return None
+        key = (object_key, field_name)
+        index = self._field_indexes.get(key)
+        if index is None:
+            index = FieldIndex(dataset, field_name)
+            self._field_indexes[key] = index
+        return index
+
+    def start_parse_job(self, object_key: str, filename: str, source_path: str) -> ImportJob:
+        """Parse ``source_path`` in the process pool; the session takes ownership of the file."""
+        self.cancel_parse_job(object_key)
+        _prune_parse_jobs()
+        job_id = uuid.uuid4().hex
+        future = _get_parse_pool().submit(
+            _parse_file_in_subprocess, filename, source_path, source_path + ".progress"
+        )
+        job = ImportJob(
+            id=job_id, object_key=object_key, filename=filename, source_path=source_path, future=future
+        )
+        self.jobs[object_key] = job
+        return job
+
+    def cancel_parse_job(self, object_key: str) -> bool:
+        job = self.jobs.pop(object_key, None)
+        if job is None:
+            return False
+        job.future.cancel()
+        job.cleanup()
+        return True
+
+    def apply_finished_jobs(self) -> bool:
+        """Install datasets of finished background parses; returns whether any changed."""
+        changed = False
+        for object_key, job in list(self.jobs.items()):
+            if job.state != "running" or not job.future.done():
+                continue
+            try:
+                dataset = job.future.result()
+            except Exception as exc:  # includes a broken pool or a cancelled job
+                job.state = "failed"
+                job.error = upload_error_code(exc)
+            else:
+                self.set_object_data(object_key, dataset)
+                job.state = "done"
+                job.rows = len(dataset.records)
+                changed = True
+            job.cleanup()
+        return changed
+
+    def get_link_settings(self) -> Dict[str, object]:
+        return {
+            "mode": self.link_mode,
+            "modes": list(LINK_MODES),
+            "referenceFields": {key: list(value) for key, value in self.reference_fields.items()},
+        }
+
+    def configure_links(
+        self,
+        mode: Optional[str] = None,
+        reference_fields: Optional[Dict[str, Sequence[str]]] = None,
+    ) -> None:
+        if mode is not None and mode not in LINK_MODES:
+            raise ValueError("invalid_link_mode")
+        if reference_fields is not None and any(key not in _OBJECT_LOOKUP for key in reference_fields):
+            raise ValueError("unknown_object")
+        if mode is not None:
+            self.link_mode = mode
+        if reference_fields is not None:
+            for object_key, field_names in reference_fields.items():
+                cleaned = [name for name in field_names if isinstance(name, str) and name]
+                if cleaned:
+                    self.reference_fields[object_key] = cleaned
+                else:
+                    self.reference_fields.pop(object_key, None)
+        self._rebuild_links()
+
+    def _record_key(self, object_key: str, record_id: str) -> Optional[str]:
+        if self.link_mode == LINK_MODE_ALL:
+            return record_id
+        if not _is_salesforce_id(record_id):
+            return None
+        prefix = _ID_PREFIXES.get(object_key)
+        if prefix and not record_id.startswith(prefix):
+            return None
+        return record_id[:15]
+
+    def _token_key(self, token: str) -> Optional[str]:
+        if self.link_mode == LINK_MODE_ALL:
+            return token
+        return token[:15] if _is_salesforce_id(token) else None
+
+    def _link_fields(self, object_key: str, dataset: ObjectDataset) -> List[str]:
+        declared = self.reference_fields.get(object_key)
+        return [
+            field_name
+            for field_name in dataset.fields
+            if field_name and field_name.lower() != "id" and (not declared or field_name in declared)
+        ]
+
+    def _is_reference_column(self, object_key: str, field_name: str) -> bool:
+        """Whether unresolved values of the column are kept to link records loaded later.
+
+        Outside declared or lookup-like columns only Salesforce IDs are kept; free
+        text matching a later record ID is found by _resolve_free_text instead.
+        """
+        return bool(self.reference_fields.get(object_key)) or _looks_like_reference(field_name)
+
+    def _keeps_dangling(self, object_key: str, field_name: str, key: str) -> bool:
+        return _is_salesforce_id(key) or self._is_reference_column(object_key, field_name)
 
     def _rebuild_links(self) -> None:
+        self._pending_link_index = None
+        self._link_memory_bytes = None
         self._links = defaultdict(set)
-        id_lookup: Dict[str, Tuple[str, str]] = {}
+        self._referrers = defaultdict(set)
+        self._dangling = {}
+        self._components_dirty = True
+        self._index_all_ids()
+        for object_key in self.objects:
+            self._link_object(object_key, indexed=True)
+
+    def _index_all_ids(self) -> None:
+        self._id_index = {}
+        self._id_collisions = {}
         for object_key, dataset in self.objects.items():
             for record_id in dataset.records.keys():
-                id_lookup[record_id] = (object_key, record_id)
+                key = self._record_key(object_key, record_id)
+                if key is None:
+                    continue
+                node = (object_key, record_id)
+                current = self._id_index.get(key)
+                if current is not None:
+                    self._id_collisions.setdefault(key, [current]).append(node)
+                self._id_index[key] = node
 
-        for object_key, dataset in self.objects.items():
-            for record_id, record in dataset.records.items():
+    def _object_order(self) -> Dict[str, int]:
+        return {object_key: position for position, object_key in enumerate(self.objects)}
+
+    def export_link_index(
+        self,
+    ) -> Tuple[List[Tuple[Node, Node]], Dict[str, Dict[str, Union[str, List[str]]]]]:
+        self._ensure_link_index()
+        references = [
+            (source, target) for target, sources in self._referrers.items() for source in sources
+        ]
+        return references, self._dangling
+
+    def restore_link_index(
+        self,
+        references: Iterable[Tuple[Node, Node]],
+        dangling: Dict[str, object],
+    ) -> None:
+        """Install a link index saved by export_link_index for the current objects.
+
+        ``dangling`` gives each object's tokens as a dict or as ``(token, ids)``
+        pairs. The index is materialized on first use so loading a snapshot stays cheap.
+        """
+        self._pending_link_index = (references, dangling)
+
+    def _ensure_link_index(self) -> None:
+        if self._pending_link_index is None:
+            return
+        references, dangling = self._pending_link_index
+        self._pending_link_index = None
+        self._link_memory_bytes = None
+        self._links = defaultdict(set)
+        self._referrers = defaultdict(set)
+        self._components_dirty = True
+        self._index_all_ids()
+        for source, target in references:
+            self._add_reference(source, target)
+        self._dangling = {object_key: dict(dangling.get(object_key, {})) for object_key in self.objects}
+
+    def _add_reference(self, source: Node, target: Node) -> None:
+        self._referrers[target].add(source)
+        self._links[source].add(target)
+        self._links[target].add(source)
+        if not self._components_dirty:
+            self._union(source, target)
+
+    def _find(self, node: Node) -> Node:
+        parent = self._parent
+        root = parent.setdefault(node, node)
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    def _union(self, left: Node, right: Node) -> None:
+        left_root = self._find(left)
+        right_root = self._find(right)
+        if left_root == right_root:
+            return
+        left_members = self._members.setdefault(left_root, [left_root])
+        right_members = self._members.setdefault(right_root, [right_root])
+        if len(left_members) < len(right_members):
+            left_root, right_root = right_root, left_root
+            left_members, right_members = right_members, left_members
+        self._parent[right_root] = left_root
+        left_members.extend(right_members)
+        del self._members[right_root]
+
+    def _ensure_components(self) -> None:
+        if not self._components_dirty:
+            return
+        self._link_memory_bytes = None
+        self._parent = {}
+        self._members = {}
+        self._components_dirty = False
+        for node, neighbors in self._links.items():
+            for neighbor in neighbors:
+                self._union(node, neighbor)
+
+    def _component_of(self, node: Node) -> List[Node]:
+        if node not in self._parent:
+            return [node]
+        return self._members.get(self._find(node), [node])
+
+    def _link_object(self, object_key: str, indexed: bool = False) -> None:
+        """Add the records of ``object_key`` to the link index.
+
+        ``indexed`` means _index_all_ids already registered their IDs.
+        """
+        self._link_memory_bytes = None
+        dataset = self.objects[object_key]
+        order = self._object_order()
+        record_keys: List[Tuple[str, str]] = []
+        # New keys that other objects may hold as free text, which is not kept as dangling.
+        free_keys: Dict[str, str] = {}
+        for record_id in dataset.records.keys():
+            key = self._record_key(object_key, record_id)
+            if key is None:
+                continue
+            record_keys.append((key, record_id))
+            if indexed:
+                continue
+            node = (object_key, record_id)
+            current = self._id_index.get(key)
+            if current is None:
+                self._id_index[key] = node
+                if not _is_salesforce_id(key):
+                    free_keys[key] = record_id
+                continue
+            self._id_collisions.setdefault(key, [current]).append(node)
+            if order[object_key] >= order[current[0]]:
+                self._id_index[key] = node
+                self._retarget_references(current, node, key)
+
+        dangling: Dict[str, Union[str, List[str]]] = {}
+        record_ids = list(dataset.records.keys())
+        for field_name in self._link_fields(object_key, dataset):
+            reference_column = self._is_reference_column(object_key, field_name)
+            codes, dictionary = dataset.records.encoded_column(field_name)
+            # Tokenize each distinct value once per column.
+            tokens_by_code: List[Optional[List[str]]] = [None] * len(dictionary)
+            for record_id, code in zip(record_ids, codes):
+                candidates = tokens_by_code[code]
+                if candidates is None:
+                    candidates = tokens_by_code[code] = [
+                        key
+                        for key in map(self._token_key, _extract_candidate_ids(dictionary[code]))
+                        if key is not None
+                    ]
+                if not candidates:
+                    continue
                 node = (object_key, record_id)
-                self._links.setdefault(node, set())
-                for field_name, value in record.items():
-                    if not field_name or field_name.lower() == "id":
-                        continue
-                    for candidate in _extract_candidate_ids(value):
-                        target = id_lookup.get(candidate)
-                        if not target or target == node:
-                            continue
-                        self._links[node].add(target)
-                        self._links[target].add(node)
+                for candidate in candidates:
+                    target = self._id_index.get(candidate)
+                    if target is None:
+                        if reference_column or _is_salesforce_id(candidate):
+                            _add_dangling(dangling, candidate, record_id)
+                    elif target != node:
+                        self._add_reference(node, target)
+        self._dangling[object_key] = dangling
+
+        # Resolve references other datasets already hold to the new IDs.
+        for other_key, other_dangling in self._dangling.items():
+            if other_key == object_key or not other_dangling:
+                continue
+            for key, record_id in record_keys:
+                sources = other_dangling.pop(key, None)
+                if not sources:
+                    continue
+                target = (object_key, record_id)
+                if self._id_index.get(key) != target:
+                    other_dangling[key] = sources
+                    continue
+                for source_id in (sources,) if isinstance(sources, str) else sources:
+                    self._add_reference((other_key, source_id), target)
+        if free_keys:
+            self._resolve_free_text(object_key, free_keys)
+
+    def _resolve_free_text(self, object_key: str, keys: Dict[str, str]) -> None:
+        """Link values of other objects' plain columns to the new ``keys`` of ``object_key``."""
+        for other_key, dataset in self.objects.items():
+            if other_key == object_key:
+                continue
+            record_ids: Optional[List[str]] = None
+            for field_name in self._link_fields(other_key, dataset):
+                if self._is_reference_column(other_key, field_name):
+                    continue
+                codes, dictionary = dataset.records.encoded_column(field_name)
+                targets_by_code: Dict[int, List[str]] = {}
+                for code, value in enumerate(dictionary):
+                    targets = [keys[token] for token in _extract_candidate_ids(value) if token in keys]
+                    if targets:
+                        targets_by_code[code] = targets
+                if not targets_by_code:
+                    continue
+                if record_ids is None:
+                    record_ids = list(dataset.records.keys())
+                for record_id, code in zip(record_ids, codes):
+                    for target_id in targets_by_code.get(code, ()):
+                        self._add_reference((other_key, record_id), (object_key, target_id))
+
+    def _holds_key(self, node: Node, key: str, kept_only: bool = False) -> bool:
+        """Whether ``node`` holds ``key`` in a link column.
+
+        With ``kept_only``, only columns whose unresolved values are kept count.
+        """
+        object_key, record_id = node
+        dataset = self.objects[object_key]
+        record = dataset.records.get(record_id) or {}
+        for field_name in self._link_fields(object_key, dataset):
+            if kept_only and not self._keeps_dangling(object_key, field_name, key):
+                continue
+            if key in map(self._token_key, _extract_candidate_ids(record.get(field_name))):
+                return True
+        return False
+
+    def _retarget_references(self, previous: Node, target: Node, key: str) -> None:
+        """Point the references resolved to ``previous`` at ``target``, which now owns their key."""
+        self._components_dirty = True
+        if self._holds_key(previous, key):
+            # ``previous`` naming its own key was skipped as a self-reference.
+            self._add_reference(previous, target)
+        for source in self._referrers.pop(previous, set()):
+            if previous not in self._referrers.get(source, ()):
+                # Drop the edge unless ``previous`` also references ``source`` itself.
+                for left, right in ((source, previous), (previous, source)):
+                    peers = self._links.get(left)
+                    if peers is not None:
+                        peers.discard(right)
+                        if not peers:
+                            del self._links[left]
+            if source != target:
+                self._add_reference(source, target)
+
+    def _unlink_object(self, object_key: str) -> None:
+        self._link_memory_bytes = None
+        dataset = self.objects[object_key]
+        order = self._object_order()
+        # Keys this object owned that another object's record takes over.
+        promoted: List[Tuple[str, Node]] = []
+        # Key -> referrers holding it as free text, which is not kept as dangling.
+        orphaned: Dict[str, List[Node]] = defaultdict(list)
+        # Removing edges may split components, which union-find cannot undo.
+        self._components_dirty = True
+        for record_id in dataset.records.keys():
+            node = (object_key, record_id)
+            key = self._record_key(object_key, record_id)
+            for source in self._referrers.pop(node, set()):
+                if source[0] == object_key or source[0] not in self._dangling or key is None:
+                    continue
+                if _is_salesforce_id(key) or self._holds_key(source, key, kept_only=True):
+                    _add_dangling(self._dangling[source[0]], key, source[1])
+                else:
+                    orphaned[key].append(source)
+            for neighbor in self._links.pop(node, set()):
+                peers = self._links.get(neighbor)
+                if peers is not None:
+                    peers.discard(node)
+                    if not peers:
+                        del self._links[neighbor]
+                referrers = self._referrers.get(neighbor)
+                if referrers is not None:
+                    referrers.discard(node)
+                    if not referrers:
+                        del self._referrers[neighbor]
+            if key is None:
+                continue
+            owners = self._id_collisions.get(key)
+            if owners is None:
+                if self._id_index.get(key) == node:
+                    del self._id_index[key]
+                continue
+            owners.remove(node)
+            if self._id_index.get(key) == node:
+                remaining = [owner for owner in owners if owner[0] != object_key]
+                if remaining:
+                    # The latest record of the object loaded last, as a full rebuild would pick.
+                    winner = max(
+                        enumerate(remaining), key=lambda item: (order[item[1][0]], item[0])
+                    )[1]
+                    self._id_index[key] = winner
+                    promoted.append((key, winner))
+                else:
+                    del self._id_index[key]
+            if len(owners) < 2:
+                del self._id_collisions[key]
+        self._dangling.pop(object_key, None)
+
+        # References that pointed at this object's copy of a key now resolve to the survivor.
+        for key, target in promoted:
+            for source in orphaned.get(key, ()):
+                if source != target:
+                    self._add_reference(source, target)
+            for other_key, other_dangling in self._dangling.items():
+                sources = other_dangling.pop(key, None)
+                if not sources:
+                    continue
+                for source_id in (sources,) if isinstance(sources, str) else sources:
+                    if (other_key, source_id) != target:
+                        self._add_reference((other_key, source_id), target)
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Field indexes are rebuilt on demand, no need to spill them. Jobs stay in
+        # _parse_jobs under the session id and are picked up again after a reload.
+        self._ensure_link_index()
+        state = dict(self.__dict__)
+        state["_field_indexes"] = {}
+        state["_jobs"] = {}
+        return state
+
+    def memory_usage(self) -> int:
+        total = sum(dataset.memory_usage() for dataset in self.objects.values())
+        total += sum(index.memory_usage() for index in self._field_indexes.values())
+        return total + self._link_memory_usage()
+
+    def _link_memory_usage(self) -> int:
+        """Approximate bytes held by the link index, dangling tokens and union-find."""
+        if self._link_memory_bytes is None:
+            total = 0
+            for mapping in (self._links, self._referrers):
+                total += sys.getsizeof(mapping) + len(mapping) * _NODE_SIZE
+                total += sum(map(sys.getsizeof, mapping.values()))
+            total += sys.getsizeof(self._id_index) + len(self._id_index) * _NODE_SIZE
+            total += sys.getsizeof(self._id_collisions)
+            total += sum(map(sys.getsizeof, self._id_collisions.values()))
+            for tokens in self._dangling.values():
+                total += sys.getsizeof(tokens) + sum(map(sys.getsizeof, tokens))
+                total += sum(
+                    sys.getsizeof(sources) for sources in tokens.values() if isinstance(sources, list)
+                )
+            total += sys.getsizeof(self._parent) + sys.getsizeof(self._members)
+            total += sum(map(sys.getsizeof, self._members.values()))
+            self._link_memory_bytes = total
+        return self._link_memory_bytes
 
     def get_status(self) -> List[Dict[str, object]]:
         status = []
         for definition in DATA_IMPORT_OBJECTS:
             object_key = definition["key"]
             dataset = self.objects.get(object_key)
+            job = self.jobs.get(object_key)
             if not dataset:
                 status.append(
                     {
@@ -89,6 +968,9 @@ class ImportSession:
                         "fields": [],
                         "filename": None,
                         "updatedAt": None,
+                        "memoryBytes": 0,
+                        "referenceFields": list(self.reference_fields.get(object_key, [])),
+                        "job": job.to_dict() if job else None,
                     }
                 )
                 continue
@@ -101,6 +983,9 @@ class ImportSession:
                     "fields": list(dataset.fields),
                     "filename": dataset.filename,
                     "updatedAt": dataset.updated_at.isoformat(),
+                    "memoryBytes": dataset.memory_usage(),
+                    "referenceFields": list(self.reference_fields.get(object_key, [])),
+                    "job": job.to_dict() if job else None,
                 }
             )
         return status
@@ -114,62 +999,66 @@ class ImportSession:
     def get_autocomplete_values(
         self, object_key: str, field_name: str, term: str, limit: int = 12
     ) -> List[str]:
-        dataset = self.objects.get(object_key)
-        if not dataset or field_name not in dataset.fields:
+        index = self._get_field_index(object_key, field_name)
+        if index is None:
             return []
-        normalized_term = (term or "").strip().lower()
-        unique_values: Set[str] = set()
-        for record in dataset.records.values():
-            value = (record.get(field_name) or "").strip()
-            if not value:
-                continue
-            if normalized_term and normalized_term not in value.lower():
-                continue
-            unique_values.add(value)
-            if len(unique_values) >= limit * 3:
-                # Gather extra values for better sorting
-                break
-        sorted_values = sorted(unique_values)
-        if limit:
-            return sorted_values[:limit]
-        return sorted_values
+        return index.complete((term or "").strip().lower(), limit)
 
     def search_records(
         self, object_key: str, field_name: str, value: str
     ) -> List[Tuple[str, str]]:
-        dataset = self.objects.get(object_key)
-        if not dataset or field_name not in dataset.fields:
+        index = self._get_field_index(object_key, field_name)
+        if index is None:
             return []
         target = (value or "").strip().lower()
         if not target:
             return []
-        matches: List[Tuple[str, str]] = []
-        for record_id, record in dataset.records.items():
-            candidate = (record.get(field_name) or "").strip().lower()
-            if candidate == target:
-                matches.append((object_key, record_id))
-        return matches
+        return [(object_key, record_id) for record_id in index.lookup(target)]
 
     def get_related_component(
-        self, starting_nodes: Sequence[Tuple[str, str]]
+        self,
+        starting_nodes: Sequence[Tuple[str, str]],
+        max_depth: Optional[int] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> Dict[str, object]:
+        """Return the records linked to ``starting_nodes``, one page at a time.
+
+        Without ``max_depth`` the precomputed connected components are used; with
+        it, only records within that many hops of a match are included.
+        """
         if not starting_nodes:
-            return {"objects": {}, "matches": []}
-        visited: Set[Tuple[str, str]] = set()
-        queue: deque[Tuple[str, str]] = deque(starting_nodes)
+            return {"objects": {}, "matches": [], "total": 0, "offset": 0, "hasMore": False}
+        self._ensure_link_index()
         component: Set[Tuple[str, str]] = set()
-        while queue:
-            node = queue.popleft()
-            if node in visited:
-                continue
-            visited.add(node)
-            component.add(node)
-            for neighbor in self._links.get(node, set()):
-                if neighbor not in visited:
-                    queue.append(neighbor)
+        if max_depth is None:
+            self._ensure_components()
+            for node in starting_nodes:
+                if node not in component:
+                    component.update(self._component_of(node))
+        else:
+            frontier = set(starting_nodes)
+            component.update(frontier)
+            for _ in range(max_depth):
+                next_frontier = set()
+                for node in frontier:
+                    for neighbor in self._links.get(node, set()):
+                        if neighbor not in component:
+                            next_frontier.add(neighbor)
+                if not next_frontier:
+                    break
+                component.update(next_frontier)
+                frontier = next_frontier
+
+        ordered = sorted(component, key=_node_sort_key)
+        object_totals: Dict[str, int] = {}
+        for object_key, _ in ordered:
+            object_totals[object_key] = object_totals.get(object_key, 0) + 1
+        offset = max(offset, 0)
+        page = ordered[offset:offset + limit] if limit else ordered[offset:]
 
         objects_payload: Dict[str, Dict[str, object]] = {}
-        for object_key, record_id in component:
+        for object_key, record_id in page:
             dataset = self.objects.get(object_key)
             if not dataset:
                 continue
@@ -181,6 +1070,7 @@ class ImportSession:
                 {
                     "key": object_key,
                     "label": _OBJECT_LOOKUP.get(object_key, {}).get("label", object_key),
+                    "total": object_totals.get(object_key, 0),
                     "records": [],
                 },
             )
@@ -197,9 +1087,6 @@ class ImportSession:
                 }
             )
 
-        for object_info in objects_payload.values():
-            object_info["records"].sort(key=lambda item: item.get("id", ""))
-
         matches_payload = []
         for object_key, record_id in starting_nodes:
             dataset = self.objects.get(object_key)
@@ -216,7 +1103,45 @@ class ImportSession:
                 }
             )
 
-        return {"objects": objects_payload, "matches": matches_payload}
+        return {
+            "objects": objects_payload,
+            "matches": matches_payload,
+            "total": len(ordered),
+            "offset": offset,
+            "hasMore": offset + len(page) < len(ordered),
+        }
+
+
+def _node_sort_key(node: Node) -> Tuple[int, str]:
+    return _OBJECT_ORDER.get(node[0], len(_OBJECT_ORDER)), node[1]
+
+
+def _is_salesforce_id(value: str) -> bool:
+    return len(value) in (15, 18) and value.isascii() and value.isalnum()
+
+
+_OBJECT_STEMS = {item["key"].lower().replace("__c", "") for item in DATA_IMPORT_OBJECTS}
+
+
+def _looks_like_reference(field_name: str) -> bool:
+    """Whether a column name reads as a lookup, such as ``AccountId`` or ``Contact__c``."""
+    name = field_name.lower()
+    if name.endswith("__c"):
+        name = name[:-3]
+        return name.endswith("id") or name.replace("_", "") in _OBJECT_STEMS
+    return name.endswith("id")
+
+
+def _add_dangling(dangling: Dict[str, Union[str, List[str]]], token: str, record_id: str) -> None:
+    # Most tokens are held by a single record, so store a bare id until a second one appears.
+    existing = dangling.get(token)
+    if existing is None:
+        dangling[token] = record_id
+    elif isinstance(existing, str):
+        if existing != record_id:
+            dangling[token] = [existing, record_id]
+    elif existing[-1] != record_id:
+        existing.append(record_id)
 
 
 def _serialize_record_fields(fields: Iterable[str], record: Optional[Dict[str, str]]) -> List[Dict[str, str]]:
@@ -257,49 +1182,45 @@ def _stringify_cell(value: object) -> str:
     return str(value)
 
 
-def parse_tabular_file(filename: str, file_bytes: bytes) -> ObjectDataset:
+def parse_tabular_file(
+    filename: str,
+    source: Union[bytes, BinaryIO],
+    progress: Optional[Callable[[int], None]] = None,
+) -> ObjectDataset:
+    """Parse a CSV or Excel upload in one streaming pass over its rows.
+
+    ``progress`` is called with the number of rows read every PROGRESS_INTERVAL rows.
+    """
     if not filename:
         raise ValueError("missing_filename")
-    if not file_bytes:
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+    if not stream.read(1):
         raise ValueError("empty_file")
+    stream.seek(0)
     name_lower = filename.lower()
     if name_lower.endswith(".csv"):
-        headers, rows = _parse_csv(file_bytes)
+        rows = _iter_csv_rows(stream)
     else:
-        headers, rows = _parse_excel(file_bytes)
-
-    normalized_headers = []
-    source_headers: Dict[str, str] = {}
-    for raw_header in headers:
-        normalized = _normalize_header(raw_header)
-        if normalized.lower() == "id":
-            normalized = "Id"
-        normalized_headers.append(normalized)
-        source_headers[normalized] = raw_header if isinstance(raw_header, str) else str(raw_header)
-    if not normalized_headers or any(not header for header in normalized_headers):
-        raise ValueError("invalid_headers")
-    lower_headers = [header.lower() for header in normalized_headers]
-    if len(set(lower_headers)) != len(lower_headers):
-        raise ValueError("duplicate_headers")
-    if "id" not in lower_headers:
-        raise ValueError("missing_id")
-
-    id_field = next((header for header in normalized_headers if header.lower() == "id"), "Id")
-    records: Dict[str, Dict[str, str]] = {}
-    for row in rows:
-        record: Dict[str, str] = {}
-        for field in normalized_headers:
-            source_key = source_headers.get(field, field)
-            if isinstance(row, dict):
-                value = row.get(source_key)
-            else:
-                value = None
-            record[field] = _stringify_cell(value)
-        record_id = record.get(id_field, "").strip()
-        if not record_id:
-            continue
-        if record_id not in records:
-            records[record_id] = record
+        rows = _iter_excel_rows(stream)
+
+    try:
+        headers = next(rows)
+        normalized_headers = []
+        for raw_header in headers:
+            normalized = _normalize_header(raw_header)
+            if normalized.lower() == "id":
+                normalized = "Id"
+            normalized_headers.append(normalized)
+        if not normalized_headers or any(not header for header in normalized_headers):
+            raise ValueError("invalid_headers")
+        lower_headers = [header.lower() for header in normalized_headers]
+        if len(set(lower_headers)) != len(lower_headers):
+            raise ValueError("duplicate_headers")
+        if "id" not in lower_headers:
+            raise ValueError("missing_id")
+        records = _build_records(normalized_headers, lower_headers.index("id"), rows, progress)
+    finally:
+        rows.close()
 
     dataset = ObjectDataset(
         fields=normalized_headers,
@@ -310,25 +1231,147 @@ def parse_tabular_file(filename: str, file_bytes: bytes) -> ObjectDataset:
     return dataset
 
 
-def _parse_csv(file_bytes: bytes) -> Tuple[List[str], List[Dict[str, object]]]:
-    text_stream = io.StringIO(file_bytes.decode("utf-8-sig"))
-    reader = csv.reader(text_stream)
+def _build_records(
+    fields: List[str],
+    id_index: int,
+    rows: Iterator[Sequence[object]],
+    progress: Optional[Callable[[int], None]] = None,
+) -> ColumnarRecords:
+    records = ColumnarRecords(fields)
+    width_needed = len(fields)
+    for row_number, values in enumerate(rows, 1):
+        if progress is not None and row_number % PROGRESS_INTERVAL == 0:
+            progress(row_number)
+        width = len(values)
+        record_id = _stringify_cell(values[id_index] if id_index < width else None).strip()
+        if not record_id or record_id in records:
+            continue
+        row = [_stringify_cell(value) for value in values[:width_needed]]
+        if width < width_needed:
+            row.extend([""] * (width_needed - width))
+        records.append(record_id, row)
+    records.freeze()
+    return records
+
+
+def upload_error_code(exc: Exception) -> str:
+    if isinstance(exc, ModuleNotFoundError):
+        return "missing_dependency"
+    error_code = exc.args[0] if isinstance(exc, ValueError) and exc.args else "invalid_file"
+    return error_code if isinstance(error_code, str) else "invalid_file"
+
+
+def configure_parse_pool(processes: Optional[int] = None, threshold: Optional[int] = None) -> None:
+    global _parse_pool
+    with _parse_pool_lock:
+        if processes is not None and processes != _parse_pool_settings["processes"]:
+            if _parse_pool is not None:
+                _parse_pool.shutdown(wait=False, cancel_futures=True)
+                _parse_pool = None
+            _parse_pool_settings["processes"] = max(0, int(processes))
+        if threshold is not None:
+            _parse_pool_settings["threshold"] = max(0, int(threshold))
+
+
+def should_parse_in_background(filename: str, size: int) -> bool:
+    """Large Excel files are parsed in a worker process; CSV stays inline."""
+    return (
+        _parse_pool_settings["processes"] > 0
+        and size >= _parse_pool_settings["threshold"]
+        and not filename.lower().endswith(".csv")
+    )
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=_parse_pool_settings["processes"])
+        return _parse_pool
+
+
+def _parse_file_in_subprocess(filename: str, source_path: str, progress_path: str) -> ObjectDataset:
+    def report(rows: int) -> None:
+        Path(progress_path).write_text(str(rows), encoding="utf-8")
+
+    with open(source_path, "rb") as handle:
+        return parse_tabular_file(filename, handle, progress=report)
+
+
+def parse_uploaded_files(uploads: Sequence[Tuple[str, str, str]]) -> List[Dict[str, object]]:
+    """Parse ``(object_key, filename, path)`` uploads concurrently.
+
+    Each result carries the object key, the dataset or an error code, and the
+    parse time. Files go through the parse process pool when it is enabled,
+    otherwise through a short-lived thread pool.
+    """
+    results: List[Dict[str, object]] = []
+    if len(uploads) > 1 and _parse_pool_settings["processes"] > 0:
+        outcomes = _parse_concurrently(_get_parse_pool(), uploads)
+    elif len(uploads) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(len(uploads), BATCH_PARSE_THREADS), thread_name_prefix="data-import-parse"
+        ) as executor:
+            outcomes = _parse_concurrently(executor, uploads)
+    else:
+        outcomes = []
+        for _, filename, path in uploads:
+            try:
+                outcomes.append(_timed_parse(filename, path))
+            except Exception as exc:
+                outcomes.append(exc)
+    for (object_key, filename, _), outcome in zip(uploads, outcomes):
+        result: Dict[str, object] = {"object": object_key, "filename": filename}
+        if isinstance(outcome, Exception):
+            result["error"] = upload_error_code(outcome)
+        else:
+            dataset, seconds = outcome
+            result["dataset"] = dataset
+            result["seconds"] = round(seconds, 3)
+        results.append(result)
+    return results
+
+
+def _parse_concurrently(
+    executor: Executor, uploads: Sequence[Tuple[str, str, str]]
+) -> List[Union[Tuple[ObjectDataset, float], Exception]]:
+    futures = [executor.submit(_timed_parse, filename, path) for _, filename, path in uploads]
+    outcomes: List[Union[Tuple[ObjectDataset, float], Exception]] = []
+    for future in futures:
+        try:
+            outcomes.append(future.result())
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
+
+
+def _timed_parse(filename: str, path: str) -> Tuple[ObjectDataset, float]:
+    started = time.perf_counter()
+    with open(path, "rb") as handle:
+        dataset = parse_tabular_file(filename, handle)
+    return dataset, time.perf_counter() - started
+
+
+def _iter_csv_rows(stream: BinaryIO) -> Iterator[Sequence[object]]:
+    """Yield the header row, then every data row, decoding the stream lazily."""
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
     try:
-        headers = next(reader)
-    except StopIteration as exc:
-        raise ValueError("empty_file") from exc
-    rows: List[Dict[str, object]] = []
-    for values in reader:
-        row = {headers[index]: values[index] if index < len(values) else "" for index in range(len(headers))}
-        rows.append(row)
-    return headers, rows
+        reader = csv.reader(text_stream)
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError("empty_file")
+        yield headers
+        yield from reader
+    finally:
+        text_stream.detach()
 
 
-def _parse_excel(file_bytes: bytes) -> Tuple[List[str], List[Dict[str, object]]]:
+def _iter_excel_rows(stream: BinaryIO) -> Iterator[Sequence[object]]:
+    """Yield the header row, then every data row of the active worksheet."""
     from openpyxl import load_workbook
 
     try:
-        workbook = load_workbook(io.BytesIO(file_bytes), data_only=True, read_only=True)
+        workbook = load_workbook(stream, data_only=True, read_only=True)
     except Exception as exc:  # pragma: no cover - delegated to openpyxl
         raise ValueError("invalid_workbook") from exc
     try:
@@ -337,23 +1380,13 @@ def _parse_excel(file_bytes: bytes) -> Tuple[List[str], List[Dict[str, object]]]
         headers = next(rows_iter, None)
         if not headers:
             raise ValueError("empty_file")
-        headers_list = [str(cell) if cell is not None else "" for cell in headers]
-        rows: List[Dict[str, object]] = []
+        yield [str(cell) if cell is not None else "" for cell in headers]
         for row_values in rows_iter:
-            row_dict: Dict[str, object] = {}
-            for index, header in enumerate(headers_list):
-                cell_value = row_values[index] if row_values and index < len(row_values) else None
-                row_dict[header] = cell_value
-            rows.append(row_dict)
-        return headers_list, rows
+            yield row_values or ()
     finally:
         workbook.close()
 
 
-_sessions: Dict[str, ImportSession] = {}
-_sessions_lock = threading.Lock()
-
-
 def _ensure_session_id() -> str:
     session_id = session.get(DATA_IMPORT_SESSION_KEY)
     if session_id and isinstance(session_id, str):
@@ -365,10 +1398,46 @@ def _ensure_session_id() -> str:
 
 def get_import_session() -> ImportSession:
     session_id = _ensure_session_id()
-    with _sessions_lock:
-        if session_id not in _sessions:
-            _sessions[session_id] = ImportSession()
-        return _sessions[session_id]
+    import_session = session_manager.get(
+        "data_import", session_id, lambda: _load_import_session(session_id)
+    )
+    if import_snapshot.is_enabled():
+        # Another worker may have saved a newer snapshot for this browser session.
+        # Unwritten local changes are newer than any file on disk.
+        signature = import_snapshot.snapshot_signature(session_id)
+        if (
+            signature is not None
+            and signature != import_session.snapshot_signature
+            and not import_snapshot.has_pending_write(session_id)
+        ):
+            import_session = _load_import_session(session_id)
+            session_manager.put("data_import", session_id, import_session)
+    if import_session.apply_finished_jobs():
+        save_import_session(import_session)
+    return import_session
+
+
+def _load_import_session(session_id: str) -> ImportSession:
+    if import_snapshot.is_enabled():
+        try:
+            import_snapshot.flush_snapshot(session_id)
+            loaded = import_snapshot.load_snapshot(session_id)
+        except Exception:  # pragma: no cover - a broken snapshot just starts fresh
+            logger.exception("Unable to load data import snapshot %s", session_id)
+            loaded = None
+        if loaded is not None:
+            return loaded
+    return ImportSession(session_id=session_id)
+
+
+def save_import_session(import_session: ImportSession) -> None:
+    """Queue a snapshot write so restarts and other workers can reuse the session."""
+    if not import_snapshot.is_enabled() or not import_session.session_id:
+        return
+    try:
+        import_snapshot.schedule_snapshot(import_session.session_id, import_session)
+    except Exception:  # pragma: no cover - snapshots are best effort
+        logger.exception("Unable to write data import snapshot %s", import_session.session_id)
 
 
 def get_object_definition(object_key: str) -> Optional[Dict[str, str]]:
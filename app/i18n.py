@@ -43,6 +43,7 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                 "run_button": "Run query",
                 "run_button_bypass": "Run without LIMIT/WHERE",
                 "run_button_fetch_all": "Run up to 500k records",
+                "run_button_bulk_export": "Export all as CSV (Bulk API)",
                 "helpers": {
                     "add_limit": "Add LIMIT 100",
                     "add_order_by": "Add ORDER BY CreatedDate DESC",
@@ -95,6 +96,10 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                 "updated_at": "Loaded",
                 "remove_button": "Remove data",
                 "loaded_badge": "Loaded",
+                "reference_fields_label": "Reference columns",
+                "reference_fields_help": "Only the selected columns are scanned for links. Leave empty to scan every column.",
+                "batch_label": "Upload several files",
+                "batch_help": "Name each file after its object (for example Account.csv or Contact.xlsx) to load them together.",
             },
             "search": {
                 "title": "Relationship explorer",
@@ -104,6 +109,9 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                 "value_placeholder": "Type a value to search",
                 "submit": "Show related",
                 "reset": "Clear",
+                "link_mode_label": "Link detection",
+                "link_mode_all": "Any matching value",
+                "link_mode_salesforce_ids": "Salesforce IDs only (15/18 characters)",
             },
             "results": {
                 "title": "Related records",
@@ -120,7 +128,7 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
             "title": "Account Relationship Explorer",
             "input": {
                 "title": "Load Account IDs",
-                "description": "Upload a file or paste a list of Account IDs (up to {limit}).",
+                "description": "Upload a file or paste a list of Account IDs. Lists longer than {limit} run as a background job.",
                 "file_label": "Import from file",
                 "file_help": "Supports CSV or Excel files containing an Id column.",
                 "text_label": "Paste Account IDs",
@@ -140,6 +148,20 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                 "download": "Download JSON",
                 "status_running": "Loading related records…",
                 "generated_at": "Data generated {timestamp}",
+                "cancel": "Cancel",
+                "job_started": "More than {limit} accounts: the explorer runs as a background job.",
+                "job_progress": "Background job: {processed} of {total} accounts processed…",
+                "job_cancelled": "Background job cancelled.",
+                "job_truncated": "Showing the first {shown} of {total} accounts. Download the JSON file for the full result.",
+                "progress_start": "Exploring {total} accounts…",
+                "progress_object": "{label}: {count} records in {seconds} s",
+                "progress_accounts": "Found {count} accounts ({missing} missing) in {seconds} s",
+                "progress_account": "Assembled {count} of {total} accounts…",
+                "progress_alerts": "Alerts evaluated: {flagged} of {accounts} accounts flagged in {seconds} s",
+                "progress_file": "Result file written in {seconds} s",
+                "query_stats": "{queries} queries, up to {largest} IDs each ({strategy})",
+                "strategy_per_object": "one query per object",
+                "strategy_subquery": "relationship subqueries",
             },
             "results": {
                 "title": "Related data",
@@ -403,7 +425,7 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
             "saved": "Settings updated successfully.",
             "account_explorer": {
                 "title": "Account explorer fields",
-                "description": "Select up to five fields per object to display in the explorer results (runs are limited to {limit} accounts).",
+                "description": "Select up to five fields per object to display in the explorer results (lists longer than {limit} accounts run as a background job).",
                 "org_label": "Field suggestions org",
                 "org_placeholder": "Select an org (optional)",
                 "org_help": "Used to provide autocomplete suggestions when editing fields.",
@@ -457,6 +479,8 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                 "results_export_failed": "Unable to export results",
                 "query_without_limit_where": "Add a WHERE or LIMIT clause before running the query.",
                 "query_truncated": "Showing the first {limit} records. Additional records were omitted.",
+                "bulk_export_started": "Bulk query job submitted. The CSV download will start when it completes.",
+                "bulk_export_ready": "Bulk query job completed, downloading the CSV",
             },
             "query": {
                 "no_records": "No records returned.",
@@ -490,6 +514,15 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                 "missing_selection": "Select an object and field before searching.",
                 "missing_value": "Enter a value to search.",
                 "no_matches": "No records found for the requested value.",
+                "load_more": "Load more linked records ({loaded} of {total})",
+                "load_more_failed": "Unable to load more linked records.",
+                "links_updated": "Link settings updated.",
+                "links_failed": "Unable to update the link settings.",
+                "parse_started": "{filename} is large and is being read in the background.",
+                "parse_progress": "Reading {filename}: {rows} rows so far…",
+                "batch_success": "Loaded {count} files in {seconds} s.",
+                "batch_file_failed": "{filename}: {message}",
+                "batch_unmatched": "No object matches {filenames}.",
                 "errors": {
                     "invalid_file": "The file cannot be read.",
                     "missing_id": "The uploaded file must contain an Id column.",
@@ -502,6 +535,7 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                     "missing_parameters": "Missing required information.",
                     "unknown_object": "Unknown object.",
                     "missing_dependency": "Install the \"openpyxl\" package to read Excel files.",
+                    "cancelled": "The upload was replaced or removed before it finished.",
                 },
             },
             "account_explorer": {
@@ -535,6 +569,7 @@ _LANGUAGE_PACKS: Dict[str, Dict[str, Any]] = {
                     "invalid_file": "The uploaded file could not be processed.",
                     "no_valid_ids": "No valid Account IDs were found.",
                     "invalid_accounts": "No valid Account IDs were provided.",
+                    "job_running": "A background explorer job is already running.",
                     "run_failed": "Unable to load related records.",
                     "parse_failed": "Unable to process the provided accounts.",
                 },
@@ -580,6 +615,7 @@ _LANGUAGE_PACKS.update(
                     "run_button": "Esegui query",
                     "run_button_bypass": "Esegui senza LIMIT/WHERE",
                     "run_button_fetch_all": "Esegui fino a 500k record",
+                    "run_button_bulk_export": "Esporta tutto in CSV (Bulk API)",
                     "helpers": {
                         "add_limit": "Aggiungi LIMIT 100",
                         "add_order_by": "Aggiungi ORDER BY CreatedDate DESC",
@@ -632,6 +668,10 @@ _LANGUAGE_PACKS.update(
                     "updated_at": "Caricato",
                     "remove_button": "Rimuovi dati",
                     "loaded_badge": "Caricato",
+                    "reference_fields_label": "Colonne di riferimento",
+                    "reference_fields_help": "Solo le colonne selezionate vengono analizzate per i collegamenti. Lascia vuoto per analizzarle tutte.",
+                    "batch_label": "Carica più file",
+                    "batch_help": "Dai a ogni file il nome del suo oggetto (ad esempio Account.csv o Contact.xlsx) per caricarli insieme.",
                 },
                 "search": {
                     "title": "Esploratore relazioni",
@@ -641,6 +681,9 @@ _LANGUAGE_PACKS.update(
                     "value_placeholder": "Scrivi un valore da cercare",
                     "submit": "Mostra relazioni",
                     "reset": "Pulisci",
+                    "link_mode_label": "Rilevamento collegamenti",
+                    "link_mode_all": "Qualsiasi valore corrispondente",
+                    "link_mode_salesforce_ids": "Solo ID Salesforce (15/18 caratteri)",
                 },
                 "results": {
                     "title": "Record correlati",
@@ -657,7 +700,7 @@ _LANGUAGE_PACKS.update(
                 "title": "Esploratore relazioni account",
                 "input": {
                     "title": "Carica ID Account",
-                    "description": "Carica un file o incolla un elenco di ID Account (massimo {limit}).",
+                    "description": "Carica un file o incolla un elenco di ID Account. Gli elenchi con più di {limit} ID vengono elaborati in background.",
                     "file_label": "Importa da file",
                     "file_help": "Supporta file CSV o Excel con una colonna Id.",
                     "text_label": "Incolla ID Account",
@@ -677,6 +720,20 @@ _LANGUAGE_PACKS.update(
                     "download": "Scarica JSON",
                     "status_running": "Caricamento record correlati…",
                     "generated_at": "Dati generati {timestamp}",
+                    "cancel": "Annulla",
+                    "job_started": "Più di {limit} account: l'esplorazione viene eseguita in background.",
+                    "job_progress": "Elaborazione in background: {processed} di {total} account elaborati…",
+                    "job_cancelled": "Elaborazione in background annullata.",
+                    "job_truncated": "Vengono mostrati i primi {shown} di {total} account. Scarica il file JSON per il risultato completo.",
+                    "progress_start": "Esplorazione di {total} account…",
+                    "progress_object": "{label}: {count} record in {seconds} s",
+                    "progress_accounts": "Trovati {count} account ({missing} mancanti) in {seconds} s",
+                    "progress_account": "Preparati {count} di {total} account…",
+                    "progress_alerts": "Avvisi valutati: {flagged} di {accounts} account segnalati in {seconds} s",
+                    "progress_file": "File dei risultati scritto in {seconds} s",
+                    "query_stats": "{queries} query, fino a {largest} ID ciascuna ({strategy})",
+                    "strategy_per_object": "una query per oggetto",
+                    "strategy_subquery": "sottoquery di relazione",
                 },
                     "results": {
                         "title": "Dati correlati",
@@ -944,7 +1001,7 @@ _LANGUAGE_PACKS.update(
                 "saved": "Impostazioni aggiornate correttamente.",
                 "account_explorer": {
                     "title": "Campi esploratore account",
-                    "description": "Seleziona fino a cinque campi per oggetto da mostrare nei risultati dell'esploratore (le esecuzioni sono limitate a {limit} account).",
+                    "description": "Seleziona fino a cinque campi per oggetto da mostrare nei risultati dell'esploratore (gli elenchi con più di {limit} account vengono elaborati in background).",
                     "org_label": "Organizzazione per i suggerimenti",
                     "org_placeholder": "Seleziona un'organizzazione (opzionale)",
                     "org_help": "Usata per fornire suggerimenti di compilazione dei campi.",
@@ -998,6 +1055,8 @@ _LANGUAGE_PACKS.update(
                     "results_export_failed": "Impossibile esportare i risultati",
                     "query_without_limit_where": "Aggiungi una clausola WHERE o LIMIT prima di eseguire la query.",
                     "query_truncated": "Visualizzazione limitata ai primi {limit} record. I successivi sono stati omessi.",
+                    "bulk_export_started": "Job Bulk API inviato. Il download del CSV partirà al termine.",
+                    "bulk_export_ready": "Job Bulk API completato, download del CSV in corso",
                 },
                 "query": {
                     "no_records": "Nessun record restituito.",
@@ -1031,6 +1090,15 @@ _LANGUAGE_PACKS.update(
                     "missing_selection": "Seleziona un oggetto e un campo prima di cercare.",
                     "missing_value": "Inserisci un valore da cercare.",
                     "no_matches": "Nessun record trovato per il valore richiesto.",
+                    "load_more": "Carica altri record collegati ({loaded} di {total})",
+                    "load_more_failed": "Impossibile caricare altri record collegati.",
+                    "links_updated": "Impostazioni dei collegamenti aggiornate.",
+                    "links_failed": "Impossibile aggiornare le impostazioni dei collegamenti.",
+                    "parse_started": "{filename} è di grandi dimensioni e viene letto in background.",
+                    "parse_progress": "Lettura di {filename}: {rows} righe finora…",
+                    "batch_success": "Caricati {count} file in {seconds} s.",
+                    "batch_file_failed": "{filename}: {message}",
+                    "batch_unmatched": "Nessun oggetto corrisponde a {filenames}.",
                     "errors": {
                         "invalid_file": "Il file non può essere letto.",
                         "missing_id": "Il file caricato deve contenere la colonna Id.",
@@ -1043,6 +1111,7 @@ _LANGUAGE_PACKS.update(
                         "missing_parameters": "Informazioni richieste mancanti.",
                         "unknown_object": "Oggetto sconosciuto.",
                         "missing_dependency": "Installa il pacchetto \"openpyxl\" per leggere i file Excel.",
+                        "cancelled": "Il caricamento è stato sostituito o rimosso prima del termine.",
                     },
                 },
                 "account_explorer": {
@@ -1072,6 +1141,7 @@ _LANGUAGE_PACKS.update(
                         "invalid_file": "Il file caricato non può essere elaborato.",
                         "no_valid_ids": "Nessun ID Account valido trovato.",
                         "invalid_accounts": "Non sono stati forniti ID Account validi.",
+                        "job_running": "È già in corso un'esplorazione in background.",
                         "run_failed": "Impossibile caricare i record correlati.",
                         "parse_failed": "Impossibile elaborare gli account indicati.",
                     },
@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from . import data_import
+from .storage import DATA_DIR
+
+SNAPSHOT_DIR = DATA_DIR / "import_snapshots"
+DEFAULT_SNAPSHOT_TTL = 7 * 24 * 3600.0
+DEFAULT_SNAPSHOT_DELAY = 2.0
+
+# File layout: magic, u64 offset of the JSON header, 8-byte aligned sections,
+# JSON header last. Sections are raw arrays so they can be used straight from mmap;
+# the header only holds metadata and section locations.
+_MAGIC = b"SFIMPSN1"
+_VERSION = 3
+_PREFIX = struct.Struct("<8sQ")
+_OFFSET_TYPECODE = "Q"
+_NODE_TYPECODE = "I"
+
+# Windows cannot replace or delete a file while any process has it mapped, so
+# snapshots are read into memory there instead.
+_USE_MMAP = os.name != "nt"
+
+_SESSION_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+_settings = {
+    "enabled": True,
+    "ttl": DEFAULT_SNAPSHOT_TTL,
+    "delay": DEFAULT_SNAPSHOT_DELAY,
+    "directory": SNAPSHOT_DIR,
+}
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _SnapshotState:
+    """What a snapshot write needs, captured so the session can keep changing."""
+
+    objects: Dict[str, "data_import.ObjectDataset"]
+    link_mode: str
+    reference_fields: Dict[str, List[str]]
+    # Source and target rows, numbered across objects in the order of ``objects``.
+    references: Tuple[array, array]
+    # Object key -> tokens, start of each token's sources in rows, source rows.
+    dangling: Dict[str, Tuple[List[str], array, array]]
+
+
+# Sessions waiting for their debounced write and the timers that will write them.
+_pending: Dict[str, Tuple["data_import.ImportSession", _SnapshotState]] = {}
+_timers: Dict[str, threading.Timer] = {}
+_in_flight: Dict[str, int] = {}
+_pending_lock = threading.Lock()
+# Serializes writes so an older state can never replace a newer file.
+_write_lock = threading.Lock()
+
+
+def configure_snapshots(
+    enabled: Optional[bool] = None,
+    ttl: Optional[float] = None,
+    delay: Optional[float] = None,
+    directory: Optional[Path] = None,
+) -> None:
+    if enabled is not None:
+        _settings["enabled"] = bool(enabled)
+    if ttl is not None:
+        _settings["ttl"] = max(0.0, float(ttl))
+    if delay is not None:
+        _settings["delay"] = max(0.0, float(delay))
+    if directory is not None:
+        _settings["directory"] = Path(directory)
+
+
+def is_enabled() -> bool:
+    return bool(_settings["enabled"])
+
+
+def snapshot_path(session_id: str) -> Optional[Path]:
+    if not _SESSION_ID_PATTERN.match(session_id or ""):
+        return None
+    return Path(_settings["directory"]) / f"{session_id}.snapshot"
+
+
+def snapshot_signature(session_id: str) -> Optional[Tuple[int, int]]:
+    path = snapshot_path(session_id)
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class MappedStrings(Sequence):
+    """Read-only list of strings decoded on access from a UTF-8 blob."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview) -> None:
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return str(self._blob[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def __iter__(self):
+        offsets = self._offsets
+        blob = self._blob
+        start = offsets[0]
+        for position in range(1, len(offsets)):
+            end = offsets[position]
+            yield str(blob[start:end], "utf-8")
+            start = end
+
+
+class _MappedDangling:
+    """Re-iterable ``(token, sources)`` pairs of one object, decoded from mapped sections."""
+
+    def __init__(
+        self, tokens: MappedStrings, starts: memoryview, rows: memoryview, ids: Sequence[str]
+    ) -> None:
+        self._tokens = tokens
+        self._starts = starts
+        self._rows = rows
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __iter__(self) -> Iterator[Tuple[str, object]]:
+        starts, rows, ids = self._starts, self._rows, self._ids
+        for position, token in enumerate(self._tokens):
+            start, end = starts[position], starts[position + 1]
+            if end - start == 1:
+                yield token, ids[rows[start]]
+            else:
+                yield token, [ids[row] for row in rows[start:end]]
+
+
+class _SectionWriter:
+    def __init__(self, handle: BinaryIO) -> None:
+        self._handle = handle
+        self.position = _PREFIX.size
+
+    def write(self, payload: bytes) -> List[int]:
+        padding = -self.position % 8
+        if padding:
+            self._handle.write(b"\0" * padding)
+            self.position += padding
+        offset = self.position
+        self._handle.write(payload)
+        self.position += len(payload)
+        return [offset, len(payload)]
+
+    def write_array(self, values: array) -> List[object]:
+        return [*self.write(values.tobytes()), values.typecode]
+
+    def write_strings(self, values: Iterable[str]) -> Dict[str, List[object]]:
+        offsets = array(_OFFSET_TYPECODE, [0])
+        chunks: List[bytes] = []
+        position = 0
+        for value in values:
+            encoded = value.encode("utf-8")
+            chunks.append(encoded)
+            position += len(encoded)
+            offsets.append(position)
+        return {"offsets": self.write_array(offsets), "blob": self.write(b"".join(chunks))}
+
+
+def schedule_snapshot(session_id: str, import_session: "data_import.ImportSession") -> None:
+    """Write the session in the background once it has been quiet for the configured delay.
+
+    Changes made while a write is pending are folded into that write.
+    """
+    if snapshot_path(session_id) is None:
+        return
+    state = _capture_state(import_session)
+    delay = float(_settings["delay"])
+    if not delay:
+        with _write_lock:
+            import_session.snapshot_signature = _write_state(session_id, state)
+        return
+    with _pending_lock:
+        _pending[session_id] = (import_session, state)
+        previous = _timers.pop(session_id, None)
+        if previous is not None:
+            previous.cancel()
+        timer = threading.Timer(delay, _flush_pending, args=(session_id,))
+        timer.daemon = True
+        _timers[session_id] = timer
+        timer.start()
+
+
+def has_pending_write(session_id: str) -> bool:
+    """True while this process holds changes for ``session_id`` newer than its file."""
+    with _pending_lock:
+        return session_id in _pending or session_id in _in_flight
+
+
+def flush_snapshot(session_id: str) -> None:
+    """Write a pending snapshot now instead of waiting for its timer."""
+    _flush_pending(session_id)
+
+
+def flush_all_snapshots() -> None:
+    with _pending_lock:
+        session_ids = list(_pending)
+    for session_id in session_ids:
+        _flush_pending(session_id)
+
+
+atexit.register(flush_all_snapshots)
+
+
+def _flush_pending(session_id: str) -> None:
+    with _write_lock:
+        with _pending_lock:
+            timer = _timers.pop(session_id, None)
+            if timer is not None:
+                timer.cancel()
+            item = _pending.pop(session_id, None)
+            if item is None:
+                return
+            _in_flight[session_id] = _in_flight.get(session_id, 0) + 1
+        import_session, state = item
+        try:
+            import_session.snapshot_signature = _write_state(session_id, state)
+        except PermissionError:
+            # Windows: another process still has the old file open; retry later
+            # unless a newer change has been queued meanwhile.
+            logger.warning("Snapshot %s is in use, retrying later", session_id)
+            with _pending_lock:
+                if session_id not in _pending:
+                    _pending[session_id] = item
+                    timer = threading.Timer(
+                        max(float(_settings["delay"]), 1.0), _flush_pending, args=(session_id,)
+                    )
+                    timer.daemon = True
+                    _timers[session_id] = timer
+                    timer.start()
+        except Exception:  # pragma: no cover - snapshots are best effort
+            logger.exception("Unable to write data import snapshot %s", session_id)
+        finally:
+            with _pending_lock:
+                _in_flight[session_id] -= 1
+                if not _in_flight[session_id]:
+                    del _in_flight[session_id]
+
+
+def _capture_state(import_session: "data_import.ImportSession") -> _SnapshotState:
+    """Copy the link index into row arrays, so the session can keep changing."""
+    objects = dict(import_session.objects)
+    bases: Dict[str, int] = {}
+    total_rows = 0
+    for object_key, dataset in objects.items():
+        dataset.records.freeze()
+        bases[object_key] = total_rows
+        total_rows += len(dataset.records)
+    references, dangling = import_session.export_link_index()
+
+    sources = array(_NODE_TYPECODE)
+    targets = array(_NODE_TYPECODE)
+    for (source_key, source_id), (target_key, target_id) in references:
+        sources.append(bases[source_key] + objects[source_key].records.row_of(source_id))
+        targets.append(bases[target_key] + objects[target_key].records.row_of(target_id))
+
+    dangling_rows: Dict[str, Tuple[List[str], array, array]] = {}
+    for object_key, tokens in dangling.items():
+        records = objects[object_key].records
+        starts = array(_NODE_TYPECODE, [0])
+        rows = array(_NODE_TYPECODE)
+        for record_ids in tokens.values():
+            for record_id in (record_ids,) if isinstance(record_ids, str) else record_ids:
+                rows.append(records.row_of(record_id))
+            starts.append(len(rows))
+        dangling_rows[object_key] = (list(tokens), starts, rows)
+
+    return _SnapshotState(
+        objects=objects,
+        link_mode=import_session.link_mode,
+        reference_fields={
+            key: list(value) for key, value in import_session.reference_fields.items()
+        },
+        references=(sources, targets),
+        dangling=dangling_rows,
+    )
+
+
+def write_snapshot(
+    session_id: str, import_session: "data_import.ImportSession"
+) -> Optional[Tuple[int, int]]:
+    """Atomically write ``import_session`` to its snapshot file; returns its signature."""
+    if snapshot_path(session_id) is None:
+        return None
+    state = _capture_state(import_session)
+    with _write_lock:
+        return _write_state(session_id, state)
+
+
+def _write_state(session_id: str, state: _SnapshotState) -> Optional[Tuple[int, int]]:
+    path = snapshot_path(session_id)
+    if path is None:
+        return None
+    if not state.objects:
+        path.unlink(missing_ok=True)
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _prune_expired(path.parent)
+
+    object_keys = list(state.objects)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{session_id}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_PREFIX.pack(_MAGIC, 0))
+            writer = _SectionWriter(handle)
+            objects_header = []
+            for object_key in object_keys:
+                dataset = state.objects[object_key]
+                records = dataset.records
+                columns_header = []
+                for codes, dictionary in records.iter_encoded_columns():
+                    if not isinstance(codes, array):
+                        codes = array(codes.format, codes)
+                    columns_header.append(
+                        {
+                            "codes": writer.write_array(codes),
+                            "values": writer.write_strings(dictionary),
+                        }
+                    )
+                object_header = {
+                    "key": object_key,
+                    "fields": list(dataset.fields),
+                    "filename": dataset.filename,
+                    "updatedAt": dataset.updated_at.isoformat(),
+                    "ids": writer.write_strings(records.keys()),
+                    "columns": columns_header,
+                }
+                if object_key in state.dangling:
+                    tokens, starts, rows = state.dangling[object_key]
+                    object_header["dangling"] = {
+                        "tokens": writer.write_strings(tokens),
+                        "starts": writer.write_array(starts),
+                        "rows": writer.write_array(rows),
+                    }
+                objects_header.append(object_header)
+
+            sources, targets = state.references
+            header = {
+                "version": _VERSION,
+                "linkMode": state.link_mode,
+                "referenceFields": state.reference_fields,
+                "objects": objects_header,
+                "references": {
+                    "sources": writer.write_array(sources),
+                    "targets": writer.write_array(targets),
+                },
+            }
+            header_offset = writer.position
+            handle.write(json.dumps(header).encode("utf-8"))
+            handle.seek(0)
+            handle.write(_PREFIX.pack(_MAGIC, header_offset))
+        # Workers that mapped the previous file keep reading its (unlinked) inode.
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return snapshot_signature(session_id)
+
+
+def load_snapshot(session_id: str) -> Optional["data_import.ImportSession"]:
+    """Map a snapshot read-only and rebuild the session around the mapped columns."""
+    path = snapshot_path(session_id)
+    if path is None:
+        return None
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return None
+    with handle:
+        signature = os.fstat(handle.fileno())
+        if _USE_MMAP:
+            contents = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            contents = handle.read()
+    view = memoryview(contents)
+    magic, header_offset = _PREFIX.unpack_from(view, 0)
+    if magic != _MAGIC:
+        raise ValueError("invalid_snapshot")
+    header = json.loads(str(view[header_offset:], "utf-8"))
+    if header.get("version") != _VERSION:
+        # Older layouts are simply rebuilt from the next upload.
+        return None
+
+    def section(location: Sequence[object]) -> memoryview:
+        offset, length = int(location[0]), int(location[1])
+        data = view[offset:offset + length]
+        return data.cast(str(location[2])) if len(location) > 2 else data
+
+    def strings(location: Dict[str, List[object]]) -> MappedStrings:
+        return MappedStrings(section(location["offsets"]), section(location["blob"]))
+
+    import_session = data_import.ImportSession(session_id=session_id)
+    import_session.link_mode = header.get("linkMode", data_import.LINK_MODE_ALL)
+    import_session.reference_fields = {
+        key: list(value) for key, value in (header.get("referenceFields") or {}).items()
+    }
+    nodes_by_base: List[Tuple[int, str, MappedStrings]] = []
+    dangling: Dict[str, _MappedDangling] = {}
+    base = 0
+    for item in header["objects"]:
+        ids = strings(item["ids"])
+        records = data_import.ColumnarRecords.from_columns(
+            item["fields"],
+            ids,
+            [section(column["codes"]) for column in item["columns"]],
+            [strings(column["values"]) for column in item["columns"]],
+        )
+        import_session.objects[item["key"]] = data_import.ObjectDataset(
+            fields=list(item["fields"]),
+            records=records,
+            filename=item["filename"],
+            updated_at=datetime.fromisoformat(item["updatedAt"]),
+        )
+        nodes_by_base.append((base, item["key"], ids))
+        base += len(ids)
+        if "dangling" in item:
+            location = item["dangling"]
+            dangling[item["key"]] = _MappedDangling(
+                strings(location["tokens"]), section(location["starts"]), section(location["rows"]), ids
+            )
+
+    bases = [entry[0] for entry in nodes_by_base]
+
+    def node(index: int) -> data_import.Node:
+        base_index, object_key, ids = nodes_by_base[bisect_right(bases, index) - 1]
+        return object_key, ids[index - base_index]
+
+    sources = section(header["references"]["sources"])
+    targets = section(header["references"]["targets"])
+    import_session.restore_link_index(
+        ((node(source), node(target)) for source, target in zip(sources, targets)),
+        dangling,
+    )
+    import_session.snapshot_signature = (signature.st_mtime_ns, signature.st_size)
+    return import_session
+
+
+def delete_snapshot(session_id: str) -> None:
+    with _pending_lock:
+        _pending.pop(session_id, None)
+        timer = _timers.pop(session_id, None)
+        if timer is not None:
+            timer.cancel()
+    path = snapshot_path(session_id)
+    if path is not None:
+        with _write_lock:
+            path.unlink(missing_ok=True)
+
+
+def _prune_expired(directory: Path) -> None:
+    ttl = float(_settings["ttl"])
+    if not ttl:
+        return
+    cutoff = time.time() - ttl
+    for candidate in directory.glob("*.snapshot"):
+        try:
+            if candidate.stat().st_mtime < cutoff:
+                candidate.unlink()
+        except FileNotFoundError:
+            continue
+        except PermissionError:
+            # Still open in another process on Windows; the next prune retries.
+            continue
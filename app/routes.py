@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import secrets
+import tempfile
 import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from flask import (Blueprint, Response, current_app, jsonify, redirect,
                    render_template, request, send_file, session, url_for)
@@ -14,18 +18,26 @@ from itsdangerous import BadSignature, URLSafeSerializer
 
 from . import account_explorer, data_import
 from .salesforce import (
+    BULK_POLL_INTERVAL,
+    DEFAULT_QUERY_PREFETCH,
     SalesforceError,
     build_authorize_url,
     describe_sobject,
     exchange_code_for_token,
+    get_bulk_query_job,
+    get_session_pool_stats,
+    iter_bulk_query_results,
+    iter_query_all,
     list_sobjects,
     query,
     query_all,
     serialize_org,
+    start_bulk_query,
 )
 from .i18n import (DEFAULT_LANGUAGE, get_frontend_translations,
                    get_language_codes, get_language_name, get_language_pack,
                    translate)
+from .session_store import get_session_manager_stats
 from .storage import (OrgConfig, query_history_storage, saved_queries_storage,
                       storage)
 
@@ -35,6 +47,8 @@ THEMES = ["classic", "modern", "dark", "sci-fi"]
 DEFAULT_THEME = THEMES[0]
 
 _FROM_PATTERN = re.compile(r"\bFROM\s+([a-zA-Z0-9_.]+)", re.IGNORECASE)
+_BULK_JOB_ID_PATTERN = re.compile(r"^[A-Za-z0-9]{15,18}$")
+_BULK_FILENAME_PATTERN = re.compile(r"^[\w.-]+\.csv$")
 
 
 def _extract_object_name(soql: str | None) -> str | None:
@@ -156,6 +170,7 @@ def data_import_page() -> str:
         "data_import.html",
         data_import_objects=data_import.DATA_IMPORT_OBJECTS,
         data_import_status=status,
+        data_import_link_settings=import_session.get_link_settings(),
         title="Data Import All Files",
     )
 
@@ -180,6 +195,14 @@ def settings() -> str:
     )
 
 
+@main_bp.route("/api/stats", methods=["GET"])
+def api_stats() -> Response:
+    return jsonify({
+        "sessions": get_session_manager_stats(),
+        "salesforcePool": get_session_pool_stats(),
+    })
+
+
 @main_bp.route("/api/data-import/status", methods=["GET"])
 def api_data_import_status() -> Response:
     import_session = data_import.get_import_session()
@@ -196,22 +219,75 @@ def api_data_import_upload() -> Response:
     file = request.files.get("file")
     if not file or not file.filename:
         return jsonify({"error": "missing_file"}), 400
-    file_bytes = file.read()
+    with tempfile.NamedTemporaryFile(prefix="sf-import-", delete=False) as spooled:
+        file.save(spooled)
+        size = spooled.tell()
+    if data_import.should_parse_in_background(file.filename, size):
+        import_session = data_import.get_import_session()
+        job = import_session.start_parse_job(object_key, file.filename, spooled.name)
+        return (
+            jsonify({"status": import_session.get_status(), "object": object_key, "job": job.to_dict()}),
+            202,
+        )
     try:
-        dataset = data_import.parse_tabular_file(file.filename, file_bytes)
-    except ModuleNotFoundError:
-        return jsonify({"error": "invalid_file", "code": "missing_dependency"}), 400
-    except ValueError as exc:
-        error_code = exc.args[0] if exc.args else "invalid_file"
-        if not isinstance(error_code, str):
-            error_code = "invalid_file"
-        return jsonify({"error": "invalid_file", "code": error_code}), 400
+        with open(spooled.name, "rb") as source:
+            dataset = data_import.parse_tabular_file(file.filename, source)
+    except (ModuleNotFoundError, ValueError) as exc:
+        return jsonify({"error": "invalid_file", "code": data_import.upload_error_code(exc)}), 400
+    finally:
+        os.unlink(spooled.name)
 
     import_session = data_import.get_import_session()
+    import_session.cancel_parse_job(object_key)
     import_session.set_object_data(object_key, dataset)
+    data_import.save_import_session(import_session)
     return jsonify({"status": import_session.get_status(), "object": object_key})
 
 
+@main_bp.route("/api/data-import/upload-batch", methods=["POST"])
+def api_data_import_upload_batch() -> Response:
+    """Load several objects at once; form field names are object keys."""
+    object_keys = [key for key in request.files if request.files[key].filename]
+    if not object_keys:
+        return jsonify({"error": "missing_file"}), 400
+    for object_key in object_keys:
+        if not data_import.get_object_definition(object_key):
+            return jsonify({"error": "unknown_object", "object": object_key}), 400
+
+    started = time.perf_counter()
+    uploads = []
+    try:
+        for object_key in object_keys:
+            file = request.files[object_key]
+            with tempfile.NamedTemporaryFile(prefix="sf-import-", delete=False) as spooled:
+                uploads.append((object_key, file.filename, spooled.name))
+                file.save(spooled)
+        results = data_import.parse_uploaded_files(uploads)
+    finally:
+        for _, _, path in uploads:
+            os.unlink(path)
+
+    datasets = {result["object"]: result.pop("dataset") for result in results if "dataset" in result}
+    link_started = time.perf_counter()
+    import_session = data_import.get_import_session()
+    if datasets:
+        import_session.set_objects_data(datasets)
+        data_import.save_import_session(import_session)
+    link_seconds = time.perf_counter() - link_started
+    for result in results:
+        dataset = datasets.get(result["object"])
+        if dataset is not None:
+            result["recordCount"] = len(dataset.records)
+    return jsonify(
+        {
+            "status": import_session.get_status(),
+            "files": results,
+            "linkSeconds": round(link_seconds, 3),
+            "totalSeconds": round(time.perf_counter() - started, 3),
+        }
+    )
+
+
 @main_bp.route("/api/data-import/upload", methods=["DELETE"])
 def api_data_import_remove() -> Response:
     payload = request.get_json(silent=True) or {}
@@ -222,9 +298,37 @@ def api_data_import_remove() -> Response:
         return jsonify({"error": "unknown_object"}), 400
     import_session = data_import.get_import_session()
     import_session.clear_object_data(object_key)
+    data_import.save_import_session(import_session)
     return jsonify({"status": import_session.get_status(), "object": object_key})
 
 
+@main_bp.route("/api/data-import/links", methods=["GET"])
+def api_data_import_get_links() -> Response:
+    import_session = data_import.get_import_session()
+    return jsonify(import_session.get_link_settings())
+
+
+@main_bp.route("/api/data-import/links", methods=["POST"])
+def api_data_import_update_links() -> Response:
+    payload = request.get_json(silent=True) or {}
+    if not isinstance(payload, dict):
+        return jsonify({"error": "invalid_payload"}), 400
+    mode = payload.get("mode")
+    reference_fields = payload.get("referenceFields")
+    if reference_fields is not None and not (
+        isinstance(reference_fields, dict)
+        and all(isinstance(value, list) for value in reference_fields.values())
+    ):
+        return jsonify({"error": "invalid_payload"}), 400
+    import_session = data_import.get_import_session()
+    try:
+        import_session.configure_links(mode=mode, reference_fields=reference_fields)
+    except ValueError as exc:
+        return jsonify({"error": exc.args[0] if exc.args else "invalid_payload"}), 400
+    data_import.save_import_session(import_session)
+    return jsonify({"links": import_session.get_link_settings(), "status": import_session.get_status()})
+
+
 @main_bp.route("/api/data-import/fields", methods=["GET"])
 def api_data_import_fields() -> Response:
     object_key = request.args.get("object", "")
@@ -265,10 +369,25 @@ def api_data_import_related() -> Response:
     matches = import_session.search_records(object_key, field_name, str(value))
     if not matches:
         return jsonify({"error": "no_matches"}), 404
-    graph = import_session.get_related_component(matches)
+    graph = import_session.get_related_component(
+        matches,
+        max_depth=_optional_non_negative_int(payload.get("depth")),
+        offset=_optional_non_negative_int(payload.get("offset")) or 0,
+        limit=_optional_non_negative_int(payload.get("limit")),
+    )
     return jsonify(graph)
 
 
+def _optional_non_negative_int(value: object) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed >= 0 else None
+
+
 @main_bp.route("/api/account-explorer/config", methods=["GET"])
 def api_account_explorer_get_config() -> Response:
     config = account_explorer.get_config()
@@ -310,7 +429,7 @@ def api_account_explorer_parse() -> Response:
             return jsonify({"error": "missing_file"}), 400
         file_bytes = file.read()
         try:
-            ids = account_explorer.parse_account_ids_from_file(file.filename, file_bytes)
+            ids = account_explorer.parse_account_ids_from_file(file.filename, file_bytes, limit=None)
         except ModuleNotFoundError:
             return jsonify({"error": "invalid_file", "code": "missing_dependency"}), 400
         except ValueError as exc:
@@ -321,7 +440,7 @@ def api_account_explorer_parse() -> Response:
     else:
         payload = request.get_json(force=True)
         text = payload.get("text") if isinstance(payload, dict) else ""
-        ids = account_explorer.parse_account_ids_from_text(text or "")
+        ids = account_explorer.parse_account_ids_from_text(text or "", limit=None)
     return jsonify({"ids": ids, "count": len(ids), "limit": account_explorer.MAX_ACCOUNT_IDS})
 
 
@@ -338,7 +457,13 @@ def api_account_explorer_run() -> Response:
         return jsonify({"error": "Unknown org"}), 404
 
     try:
-        result = account_explorer.run_explorer(org, account_ids)
+        result = account_explorer.run_explorer(
+            org,
+            account_ids,
+            concurrency=current_app.config.get(
+                "ACCOUNT_EXPLORER_CONCURRENCY", account_explorer.QUERY_CONCURRENCY
+            ),
+        )
     except ValueError as exc:
         code = exc.args[0] if exc.args else "invalid_accounts"
         if not isinstance(code, str):
@@ -350,6 +475,95 @@ def api_account_explorer_run() -> Response:
     return jsonify(result.to_dict())
 
 
+@main_bp.route("/api/account-explorer/run/stream", methods=["POST"])
+def api_account_explorer_run_stream() -> Response:
+    payload = request.get_json(force=True)
+    org_id = (payload.get("org_id") or "").strip() if isinstance(payload, dict) else ""
+    account_ids = payload.get("account_ids") if isinstance(payload, dict) else None
+    if not org_id or not isinstance(account_ids, list):
+        return jsonify({"error": "missing_parameters"}), 400
+
+    org = storage.get(org_id)
+    if not org:
+        return jsonify({"error": "Unknown org"}), 404
+
+    try:
+        events = account_explorer.stream_explorer(
+            org,
+            account_ids,
+            concurrency=current_app.config.get(
+                "ACCOUNT_EXPLORER_CONCURRENCY", account_explorer.QUERY_CONCURRENCY
+            ),
+        )
+    except ValueError as exc:
+        code = exc.args[0] if exc.args else "invalid_accounts"
+        if not isinstance(code, str):
+            code = "invalid_accounts"
+        return jsonify({"error": "invalid_accounts", "code": code}), 400
+    return Response(
+        _stream_sse(events),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _stream_sse(events: Iterator[Tuple[str, Dict[str, object]]]) -> Iterator[str]:
+    try:
+        for event, data in events:
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+    finally:
+        # Closing the source lets the producer stop when the client disconnects.
+        close = getattr(events, "close", None)
+        if close is not None:
+            close()
+
+
+@main_bp.route("/api/account-explorer/jobs", methods=["POST"])
+def api_account_explorer_start_job() -> Response:
+    payload = request.get_json(force=True)
+    org_id = (payload.get("org_id") or "").strip() if isinstance(payload, dict) else ""
+    account_ids = payload.get("account_ids") if isinstance(payload, dict) else None
+    if not org_id or not isinstance(account_ids, list):
+        return jsonify({"error": "missing_parameters"}), 400
+
+    org = storage.get(org_id)
+    if not org:
+        return jsonify({"error": "Unknown org"}), 404
+
+    try:
+        job = account_explorer.start_explorer_job(
+            org,
+            account_ids,
+            concurrency=current_app.config.get(
+                "ACCOUNT_EXPLORER_CONCURRENCY", account_explorer.QUERY_CONCURRENCY
+            ),
+        )
+    except ValueError as exc:
+        code = exc.args[0] if exc.args else "invalid_accounts"
+        if code == "job_running":
+            return jsonify({"error": "job_running", "code": code}), 409
+        if not isinstance(code, str):
+            code = "invalid_accounts"
+        return jsonify({"error": "invalid_accounts", "code": code}), 400
+    return jsonify({"job": job.to_dict()}), 202
+
+
+@main_bp.route("/api/account-explorer/jobs/<job_id>", methods=["GET"])
+def api_account_explorer_job_status(job_id: str) -> Response:
+    job = account_explorer.get_job(job_id)
+    if job is None:
+        return jsonify({"error": "unknown_job"}), 404
+    return jsonify({"job": job.to_dict()})
+
+
+@main_bp.route("/api/account-explorer/jobs/<job_id>/cancel", methods=["POST"])
+def api_account_explorer_cancel_job(job_id: str) -> Response:
+    job = account_explorer.cancel_job(job_id)
+    if job is None:
+        return jsonify({"error": "unknown_job"}), 404
+    return jsonify({"job": job.to_dict()})
+
+
 @main_bp.route("/api/account-explorer/result", methods=["GET"])
 def api_account_explorer_result() -> Response:
     session_state = account_explorer.get_session()
@@ -520,19 +734,139 @@ def api_query() -> Response:
             parsed = None
         if parsed and parsed > 0:
             max_records = parsed
+    prefetch = current_app.config.get("SALESFORCE_QUERY_PREFETCH", DEFAULT_QUERY_PREFETCH)
+    if "prefetch" in options:
+        try:
+            prefetch = max(int(options.get("prefetch")), 0)
+        except (TypeError, ValueError):
+            pass
+
+    engine = str(options.get("engine") or "rest").strip().lower()
+    if engine not in ("rest", "bulk"):
+        return jsonify({"error": f"Unknown query engine: {engine}"}), 400
 
     org = storage.get(org_id)
     if not org:
         return jsonify({"error": "Unknown org"}), 404
 
+    if engine == "bulk":
+        try:
+            job = start_bulk_query(org, soql)
+        except SalesforceError as exc:
+            return jsonify({"error": str(exc)}), 400
+        _store_query_history(org_id, soql)
+        object_name = _extract_object_name(soql) or "query"
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return jsonify(
+            {
+                "bulkJob": {
+                    **_bulk_job_status(job),
+                    "filename": f"{object_name}_{timestamp}.csv",
+                    "pollInterval": BULK_POLL_INTERVAL,
+                }
+            }
+        ), 202
+
+    if fetch_all and options.get("stream"):
+        pages = iter_query_all(org, soql, max_records=max_records, prefetch=prefetch)
+        try:
+            first_page = next(pages)
+        except SalesforceError as exc:
+            return jsonify({"error": str(exc)}), 400
+        _store_query_history(org_id, soql)
+        return Response(_stream_ndjson(first_page, pages), mimetype="application/x-ndjson")
+
     try:
         if fetch_all:
-            result = query_all(org, soql, max_records=max_records)
+            result = query_all(org, soql, max_records=max_records, prefetch=prefetch)
         else:
             result = query(org, soql)
     except SalesforceError as exc:
         return jsonify({"error": str(exc)}), 400
 
+    _store_query_history(org_id, soql)
+    return jsonify(result)
+
+
+def _bulk_job_status(job: Dict[str, object]) -> Dict[str, object]:
+    return {
+        "id": job.get("id"),
+        "state": job.get("state"),
+        "recordsProcessed": job.get("numberRecordsProcessed"),
+        "error": job.get("errorMessage"),
+    }
+
+
+def _get_bulk_job_org(job_id: str) -> Tuple[Optional[OrgConfig], Optional[Tuple[Response, int]]]:
+    if not _BULK_JOB_ID_PATTERN.match(job_id):
+        return None, (jsonify({"error": "unknown_job"}), 404)
+    org_id = request.args.get("org_id", "")
+    if not org_id:
+        return None, (jsonify({"error": "org_id is required"}), 400)
+    org = storage.get(org_id)
+    if not org:
+        return None, (jsonify({"error": "Unknown org"}), 404)
+    return org, None
+
+
+@main_bp.route("/api/query/bulk-jobs/<job_id>", methods=["GET"])
+def api_query_bulk_job_status(job_id: str) -> Response:
+    """Poll a Bulk API query job started through ``/api/query``."""
+    org, error = _get_bulk_job_org(job_id)
+    if error:
+        return error
+    try:
+        job, _ = get_bulk_query_job(org, job_id)
+    except SalesforceError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify({"bulkJob": _bulk_job_status(job)})
+
+
+@main_bp.route("/api/query/bulk-jobs/<job_id>/results", methods=["GET"])
+def api_query_bulk_job_results(job_id: str) -> Response:
+    """Stream the CSV of a completed Bulk API query job as a download."""
+    org, error = _get_bulk_job_org(job_id)
+    if error:
+        return error
+    filename = request.args.get("filename", "")
+    if not _BULK_FILENAME_PATTERN.match(filename):
+        filename = f"bulk_export_{job_id}.csv"
+    chunks = iter_bulk_query_results(org, job_id)
+    try:
+        # Fetch the first chunk so Salesforce errors are reported before the download starts.
+        first_chunk = next(chunks, b"")
+    except SalesforceError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return Response(
+        _prepend_chunk(first_chunk, chunks),
+        mimetype="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _prepend_chunk(first_chunk: bytes, chunks: Iterator[bytes]) -> Iterator[bytes]:
+    try:
+        if first_chunk:
+            yield first_chunk
+        yield from chunks
+    finally:
+        chunks.close()
+
+
+def _stream_ndjson(
+    first_page: Dict[str, object], pages: Iterator[Dict[str, object]]
+) -> Iterator[str]:
+    try:
+        yield json.dumps(first_page) + "\n"
+        for item in pages:
+            yield json.dumps(item) + "\n"
+    except SalesforceError as exc:
+        yield json.dumps({"error": str(exc)}) + "\n"
+    finally:
+        pages.close()
+
+
+def _store_query_history(org_id: str, soql: str) -> None:
     try:
         query_history_storage.add(
             org_id=org_id,
@@ -542,8 +876,6 @@ def api_query() -> Response:
     except Exception:  # pragma: no cover - defensive logging
         current_app.logger.exception("Unable to store query history entry")
 
-    return jsonify(result)
-
 
 @main_bp.route("/api/saved-queries", methods=["GET"])
 def api_list_saved_queries() -> Response:
@@ -2,20 +2,154 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import json
 import logging
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlencode, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
 from .storage import OrgConfig, storage
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT = 300.0
+REQUEST_TIMEOUT = 30
+DEFAULT_QUERY_PREFETCH = 4
+# Seconds clients wait between Bulk API job status polls
+BULK_POLL_INTERVAL = 2.0
+# Maximum number of subrequests in one Composite Batch request
+COMPOSITE_BATCH_LIMIT = 25
+
+_NEXT_RECORDS_PATTERN = re.compile(r"^(?P<prefix>.+/[^/]+)-(?P<offset>\d+)$")
+
 
 class SalesforceError(RuntimeError):
     pass
 
 
+class SessionPool:
+    """Keep-alive HTTP sessions keyed by host (instance or login URL)."""
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_POOL_IDLE_TIMEOUT,
+        keep_alive: bool = True,
+    ) -> None:
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.keep_alive = keep_alive
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sessions: Dict[str, Tuple[requests.Session, float]] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        pool_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        keep_alive: Optional[bool] = None,
+    ) -> None:
+        with self._lock:
+            if pool_size is not None and pool_size > 0:
+                self.pool_size = pool_size
+            if idle_timeout is not None and idle_timeout >= 0:
+                self.idle_timeout = idle_timeout
+            if keep_alive is not None:
+                self.keep_alive = keep_alive
+            stale = [session for session, _ in self._sessions.values()]
+            self._sessions.clear()
+        for session in stale:
+            session.close()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _evict_idle(self, now: float) -> List[requests.Session]:
+        if not self.idle_timeout:
+            return []
+        expired = [
+            key for key, (_, last_used) in self._sessions.items() if now - last_used > self.idle_timeout
+        ]
+        evicted = [self._sessions.pop(key)[0] for key in expired]
+        self.evictions += len(evicted)
+        return evicted
+
+    def get(self, url: str) -> requests.Session:
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}".lower()
+        now = time.monotonic()
+        with self._lock:
+            evicted = self._evict_idle(now)
+            entry = self._sessions.get(key)
+            if entry:
+                self.hits += 1
+                session = entry[0]
+            else:
+                self.misses += 1
+                session = self._create_session()
+            self._sessions[key] = (session, now)
+        for stale in evicted:
+            stale.close()
+        return session
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "hosts": sorted(self._sessions.keys()),
+                "size": len(self._sessions),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "poolSize": self.pool_size,
+                "idleTimeout": self.idle_timeout,
+                "keepAlive": self.keep_alive,
+            }
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = [session for session, _ in self._sessions.values()]
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+session_pool = SessionPool()
+
+
+def configure_session_pool(
+    pool_size: Optional[int] = None,
+    idle_timeout: Optional[float] = None,
+    keep_alive: Optional[bool] = None,
+) -> None:
+    session_pool.configure(pool_size=pool_size, idle_timeout=idle_timeout, keep_alive=keep_alive)
+
+
+def get_session_pool_stats() -> Dict[str, object]:
+    return session_pool.stats()
+
+
+def _request(method: str, url: str, **kwargs) -> requests.Response:
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    return session_pool.get(url).request(method, url, **kwargs)
+
+
 def _encode_code_challenge(code_verifier: str) -> str:
     digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
     return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
@@ -46,7 +180,7 @@ def exchange_code_for_token(org: OrgConfig, code: str, code_verifier: Optional[s
     }
     if code_verifier:
         payload["code_verifier"] = code_verifier
-    response = requests.post(f"{org.login_url}/services/oauth2/token", data=payload, timeout=30)
+    response = _request("POST", f"{org.login_url}/services/oauth2/token", data=payload)
     if not response.ok:
         raise SalesforceError(f"Failed to exchange code: {response.text}")
     data = response.json()
@@ -64,7 +198,7 @@ def refresh_access_token(org: OrgConfig) -> OrgConfig:
         "client_id": org.client_id,
         "client_secret": org.client_secret,
     }
-    response = requests.post(f"{org.login_url}/services/oauth2/token", data=payload, timeout=30)
+    response = _request("POST", f"{org.login_url}/services/oauth2/token", data=payload)
     if not response.ok:
         raise SalesforceError(f"Failed to refresh token: {response.text}")
     data = response.json()
@@ -78,24 +212,36 @@ def _ensure_authorized(org: OrgConfig) -> None:
         raise SalesforceError("Org is not authorized. Please connect using OAuth first.")
 
 
-def _authorized_get(
-    org: OrgConfig, path: str, params: Optional[Dict[str, str]] = None
-) -> Tuple[Dict, OrgConfig]:
+def _authorized_request(
+    org: OrgConfig,
+    method: str,
+    path: str,
+    params: Optional[Dict[str, str]] = None,
+    **kwargs,
+) -> Tuple[requests.Response, OrgConfig]:
     _ensure_authorized(org)
     url = f"{org.instance_url}{path}"
     headers = {"Authorization": f"Bearer {org.access_token}"}
-    response = requests.get(url, headers=headers, params=params, timeout=30)
+    response = _request(method, url, headers=headers, params=params, **kwargs)
 
     if response.status_code == 401 and org.refresh_token:
+        response.close()
         refreshed = refresh_access_token(org)
         url = f"{refreshed.instance_url}{path}"
         headers = {"Authorization": f"Bearer {refreshed.access_token}"}
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _request(method, url, headers=headers, params=params, **kwargs)
         org = refreshed
 
     if not response.ok:
         raise SalesforceError(f"Salesforce request failed: {response.text}")
 
+    return response, org
+
+
+def _authorized_get(
+    org: OrgConfig, path: str, params: Optional[Dict[str, str]] = None
+) -> Tuple[Dict, OrgConfig]:
+    response, org = _authorized_request(org, "GET", path, params=params)
     return response.json(), org
 
 
@@ -104,37 +250,326 @@ def query(org: OrgConfig, soql: str) -> Dict:
     return data
 
 
-def query_all(org: OrgConfig, soql: str, max_records: Optional[int] = None) -> Dict[str, object]:
+def _iter_sequential_pages(org: OrgConfig, next_url: Optional[str]) -> Iterator[Dict]:
+    while next_url:
+        data, org = _authorized_get(org, next_url)
+        yield data
+        next_url = data.get("nextRecordsUrl")
+
+
+def _iter_next_pages(
+    org: OrgConfig,
+    next_url: Optional[str],
+    prefetch: int = 0,
+    total_size: Optional[int] = None,
+    max_records: Optional[int] = None,
+) -> Iterator[Dict]:
+    """Yield the pages of a ``nextRecordsUrl`` chain in order.
+
+    With ``prefetch`` above one, the ``<locator>-<offset>`` pattern of the
+    first ``nextRecordsUrl`` is used to request up to ``prefetch`` pages
+    concurrently. If a page comes back with a ``nextRecordsUrl`` other than
+    the predicted one, the remaining speculative requests are dropped and the
+    chain is followed sequentially from the actual URL.
+    """
+    match = _NEXT_RECORDS_PATTERN.match(next_url or "") if prefetch > 1 else None
+    batch_size = int(match.group("offset")) if match else 0
+    if not match or not batch_size or not total_size:
+        yield from _iter_sequential_pages(org, next_url)
+        return
+
+    prefix = match.group("prefix")
+    end = total_size if max_records is None else min(total_size, max_records)
+    offsets = iter(range(batch_size, end, batch_size))
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="sf-prefetch")
+    in_flight: Deque[Tuple[int, Future]] = deque()
+
+    def _schedule() -> None:
+        while len(in_flight) < prefetch:
+            offset = next(offsets, None)
+            if offset is None:
+                return
+            in_flight.append((offset, executor.submit(_authorized_get, org, f"{prefix}-{offset}")))
+
+    try:
+        _schedule()
+        while in_flight:
+            offset, future = in_flight.popleft()
+            data, org = future.result()
+            _schedule()
+            actual_next = data.get("nextRecordsUrl")
+            following = offset + batch_size
+            expected_next = f"{prefix}-{following}" if following < total_size else None
+            if actual_next != expected_next:
+                for _, pending in in_flight:
+                    pending.cancel()
+                in_flight.clear()
+            yield data
+            if not in_flight:
+                yield from _iter_sequential_pages(org, actual_next)
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_query_all(
+    org: OrgConfig,
+    soql: str,
+    max_records: Optional[int] = None,
+    prefetch: int = 0,
+) -> Iterator[Dict[str, object]]:
+    """Yield ``{"records": [...]}`` per page, then one summary dict.
+
+    The summary carries ``totalSize``, ``done``, ``nextRecordsUrl``,
+    ``truncated`` and ``max_records`` exactly as :func:`query_all` reports
+    them, so callers can stream pages without holding the full result.
+    """
     data, current_org = _authorized_get(org, "/services/data/v57.0/query", params={"q": soql})
-    records = list(data.get("records", []))
     next_url = data.get("nextRecordsUrl")
+    total = 0
     truncated = False
 
-    while next_url:
-        if max_records is not None and len(records) >= max_records:
-            truncated = True
-            break
-        data, current_org = _authorized_get(current_org, next_url)
-        chunk = data.get("records", [])
-        if chunk:
-            records.extend(chunk)
-        next_url = data.get("nextRecordsUrl")
-
-    if max_records is not None and len(records) > max_records:
-        truncated = True
-        records = records[:max_records]
+    pages = _iter_next_pages(
+        current_org,
+        next_url,
+        prefetch=prefetch,
+        total_size=data.get("totalSize"),
+        max_records=max_records,
+    )
+    try:
+        while True:
+            chunk = list(data.get("records", []))
+            if max_records is not None and total + len(chunk) > max_records:
+                truncated = True
+                chunk = chunk[: max(max_records - total, 0)]
+            total += len(chunk)
+            yield {"records": chunk}
+            if not next_url:
+                break
+            if max_records is not None and total >= max_records:
+                truncated = True
+                break
+            data = next(pages)
+            next_url = data.get("nextRecordsUrl")
+    finally:
+        pages.close()
 
     has_more = bool(next_url) or truncated
-    payload: Dict[str, object] = {
-        "records": records,
-        "totalSize": len(records),
+    summary: Dict[str, object] = {
+        "totalSize": total,
         "done": not has_more,
         "nextRecordsUrl": None if truncated else next_url,
         "truncated": truncated,
     }
     if max_records is not None and max_records > 0:
-        payload["max_records"] = max_records
-    return payload
+        summary["max_records"] = max_records
+    yield summary
+
+
+def query_all(
+    org: OrgConfig,
+    soql: str,
+    max_records: Optional[int] = None,
+    prefetch: int = 0,
+) -> Dict[str, object]:
+    records: List[Dict] = []
+    summary: Dict[str, object] = {}
+    for item in iter_query_all(org, soql, max_records=max_records, prefetch=prefetch):
+        if "records" in item:
+            records.extend(item["records"])
+        else:
+            summary = item
+    return {"records": records, **summary}
+
+
+def query_more(org: OrgConfig, next_url: str) -> List[Dict]:
+    """Follow a ``nextRecordsUrl`` chain, e.g. of a nested subquery, and return its records."""
+    records: List[Dict] = []
+    for page in _iter_sequential_pages(org, next_url):
+        records.extend(page.get("records", []))
+    return records
+
+
+def composite_batch(
+    org: OrgConfig, paths: Sequence[str], max_body: Optional[int] = None
+) -> List[Union[Dict, SalesforceError]]:
+    """Run GET requests through Composite Batch, ``COMPOSITE_BATCH_LIMIT`` per round trip.
+
+    ``paths`` are REST paths such as a ``nextRecordsUrl``. When ``max_body`` is
+    set, a round trip also stops before its subrequest URLs exceed that many
+    characters. Returns, in order, each subrequest's body or a
+    :class:`SalesforceError` carrying its errors.
+    """
+    results: List[Union[Dict, SalesforceError]] = []
+    for urls in _group_batch_requests([_batch_request_url(path) for path in paths], max_body):
+        batch_requests = [{"method": "GET", "url": url} for url in urls]
+        response, org = _authorized_request(
+            org,
+            "POST",
+            "/services/data/v57.0/composite/batch",
+            json={"batchRequests": batch_requests, "haltOnError": False},
+        )
+        items = response.json().get("results")
+        if not isinstance(items, list) or len(items) != len(urls):
+            count = len(items) if isinstance(items, list) else 0
+            raise SalesforceError(
+                f"Composite Batch returned {count} results for {len(urls)} subrequests"
+            )
+        for item in items:
+            status = int(item.get("statusCode") or 0)
+            body = item.get("result")
+            if 200 <= status < 300:
+                results.append(body or {})
+            else:
+                results.append(SalesforceError(f"Salesforce request failed: {json.dumps(body)}"))
+    return results
+
+
+def composite_batch_calls(paths: Sequence[str], max_body: Optional[int] = None) -> int:
+    """Number of round trips :func:`composite_batch` needs for ``paths``."""
+    return len(_group_batch_requests([_batch_request_url(path) for path in paths], max_body))
+
+
+def _group_batch_requests(urls: Sequence[str], max_body: Optional[int]) -> List[Sequence[str]]:
+    groups: List[Sequence[str]] = []
+    start = 0
+    length = 0
+    for index, url in enumerate(urls):
+        full = index - start >= COMPOSITE_BATCH_LIMIT
+        if index > start and (full or (max_body and length + len(url) > max_body)):
+            groups.append(urls[start:index])
+            start = index
+            length = 0
+        length += len(url)
+    if start < len(urls):
+        groups.append(urls[start:])
+    return groups
+
+
+def _batch_request_url(path: str) -> str:
+    # Subrequest URLs are relative to /services/data
+    prefix = "/services/data/"
+    return path[len(prefix):] if path.startswith(prefix) else path.lstrip("/")
+
+
+def _batch_query_path(soql: str) -> str:
+    return f"v57.0/query?{urlencode({'q': soql})}"
+
+
+def _collect_batch_pages(
+    org: OrgConfig, paths: Sequence[str], max_body: Optional[int] = None
+) -> List[Union[List[Dict], SalesforceError]]:
+    """Fetch ``paths`` and their ``nextRecordsUrl`` chains over Composite Batch.
+
+    Pending next pages of all chains are requested together, so the number of
+    round trips follows the longest chain rather than the number of chains.
+    """
+    results: List[Union[List[Dict], SalesforceError]] = [[] for _ in paths]
+    pending = dict(enumerate(paths))
+    while pending:
+        indexes = list(pending)
+        pages = composite_batch(org, [pending[index] for index in indexes], max_body)
+        pending = {}
+        for index, page in zip(indexes, pages):
+            if isinstance(page, SalesforceError):
+                results[index] = page
+                continue
+            results[index].extend(page.get("records", []))
+            if page.get("nextRecordsUrl"):
+                pending[index] = page["nextRecordsUrl"]
+    return results
+
+
+def batch_query_all(
+    org: OrgConfig, soqls: Sequence[str], max_body: Optional[int] = None
+) -> List[Union[Dict[str, object], SalesforceError]]:
+    """:func:`query_all` for several independent queries sharing Composite Batch round trips."""
+    paths = [_batch_query_path(soql) for soql in soqls]
+    results: List[Union[Dict[str, object], SalesforceError]] = []
+    for records in _collect_batch_pages(org, paths, max_body):
+        if isinstance(records, SalesforceError):
+            results.append(records)
+            continue
+        results.append(
+            {
+                "records": records,
+                "totalSize": len(records),
+                "done": True,
+                "nextRecordsUrl": None,
+                "truncated": False,
+            }
+        )
+    return results
+
+
+def batch_query_calls(soqls: Sequence[str], max_body: Optional[int] = None) -> int:
+    """Round trips :func:`batch_query_all` needs for the first pages of ``soqls``."""
+    return composite_batch_calls([_batch_query_path(soql) for soql in soqls], max_body)
+
+
+def batch_query_more(
+    org: OrgConfig, next_urls: Sequence[str], max_body: Optional[int] = None
+) -> List[Union[List[Dict], SalesforceError]]:
+    """:func:`query_more` for several ``nextRecordsUrl`` chains sharing Composite Batch round trips."""
+    return _collect_batch_pages(org, next_urls, max_body)
+
+
+def create_bulk_query_job(org: OrgConfig, soql: str) -> Tuple[Dict, OrgConfig]:
+    payload = {"operation": "query", "query": soql, "contentType": "CSV", "lineEnding": "LF"}
+    response, org = _authorized_request(org, "POST", "/services/data/v57.0/jobs/query", json=payload)
+    return response.json(), org
+
+
+def get_bulk_query_job(org: OrgConfig, job_id: str) -> Tuple[Dict, OrgConfig]:
+    return _authorized_get(org, f"/services/data/v57.0/jobs/query/{job_id}")
+
+
+def iter_bulk_query_results(
+    org: OrgConfig,
+    job_id: str,
+    page_size: Optional[int] = None,
+    chunk_size: int = 64 * 1024,
+) -> Iterator[bytes]:
+    """Yield the CSV of a completed job as one document across locator pages."""
+    path = f"/services/data/v57.0/jobs/query/{job_id}/results"
+    locator: Optional[str] = None
+    first_page = True
+    while True:
+        params: Dict[str, str] = {}
+        if locator:
+            params["locator"] = locator
+        if page_size:
+            params["maxRecords"] = str(page_size)
+        response, org = _authorized_request(org, "GET", path, params=params or None, stream=True)
+        try:
+            skip_header = not first_page
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if skip_header:
+                    newline = chunk.find(b"\n")
+                    if newline < 0:
+                        continue
+                    chunk = chunk[newline + 1 :]
+                    skip_header = False
+                if chunk:
+                    yield chunk
+        finally:
+            response.close()
+        first_page = False
+        locator = response.headers.get("Sforce-Locator")
+        if not locator or locator == "null":
+            return
+
+
+def start_bulk_query(org: OrgConfig, soql: str) -> Dict:
+    """Submit a Bulk API 2.0 query job and return its info without waiting for it.
+
+    Callers poll :func:`get_bulk_query_job` until ``state`` is ``JobComplete``
+    and then stream the CSV with :func:`iter_bulk_query_results`.
+    """
+    job, _ = create_bulk_query_job(org, soql)
+    if not job.get("id"):
+        raise SalesforceError("Bulk query job was not created")
+    return job
 
 
 def list_sobjects(org: OrgConfig) -> List[Dict[str, str]]:
@@ -168,6 +603,26 @@ def describe_sobject(org: OrgConfig, object_name: str) -> List[Dict[str, str]]:
     return fields
 
 
+def describe_child_relationships(org: OrgConfig, object_name: str) -> List[Dict[str, str]]:
+    """Child relationships of ``object_name`` that can be used in parent-to-child subqueries."""
+    if not object_name:
+        raise SalesforceError("Missing object name")
+    data, _ = _authorized_get(org, f"/services/data/v57.0/sobjects/{object_name}/describe")
+    relationships = []
+    for relationship in data.get("childRelationships", []):
+        name = relationship.get("relationshipName")
+        if not name:
+            continue
+        relationships.append(
+            {
+                "childSObject": relationship.get("childSObject", ""),
+                "field": relationship.get("field", ""),
+                "relationshipName": name,
+            }
+        )
+    return relationships
+
+
 def serialize_org(org: OrgConfig) -> Dict[str, Optional[str]]:
     data = asdict(org)
     # Hide secrets when exposing to the browser
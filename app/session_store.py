@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import logging
+import pickle
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .storage import DATA_DIR
+
+DEFAULT_SESSION_TTL = 3600.0
+DEFAULT_MAX_SESSIONS = 200
+DEFAULT_SESSION_MEMORY_BUDGET = 1024 * 1024 * 1024
+SESSION_SPILL_DIR = DATA_DIR / "sessions"
+
+_SESSION_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]
+
+
+@dataclass
+class _Entry:
+    value: object
+    last_used: float
+
+
+def estimate_size(value: object, _depth: int = 0) -> int:
+    """Rough recursive ``sys.getsizeof`` for JSON-like payloads."""
+    size = sys.getsizeof(value)
+    if _depth > 64:
+        return size
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, _depth + 1) + estimate_size(item, _depth + 1)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            size += estimate_size(item, _depth + 1)
+    return size
+
+
+class SessionManager:
+    """In-memory per-browser state with idle TTL, LRU eviction and a byte budget.
+
+    Values are grouped by namespace (``data_import``, ``account_explorer``) and
+    must expose ``memory_usage()``. Evicted values can be pickled to disk and are
+    loaded back the next time the same session asks for them.
+    """
+
+    def __init__(self, spill_dir: Path = SESSION_SPILL_DIR) -> None:
+        self.spill_dir = spill_dir
+        self.ttl = DEFAULT_SESSION_TTL
+        self.max_sessions = DEFAULT_MAX_SESSIONS
+        self.memory_budget = DEFAULT_SESSION_MEMORY_BUDGET
+        self.spill = False
+        self._entries: "OrderedDict[SessionKey, _Entry]" = OrderedDict()
+        # Guards the bookkeeping only: factories and spill writes run outside it.
+        self._lock = threading.Lock()
+        # Keys whose factory or spill file is being loaded, set once it is done.
+        self._loading: Dict[SessionKey, threading.Event] = {}
+        # Evicted values waiting to be written to disk; a get() takes them back.
+        self._pending_spills: Dict[SessionKey, object] = {}
+        self._evictions = 0
+        self._expirations = 0
+        self._spilled = 0
+        self._rehydrated = 0
+
+    def configure(
+        self,
+        ttl: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+        spill: Optional[bool] = None,
+    ) -> None:
+        with self._lock:
+            if ttl is not None:
+                self.ttl = max(0.0, float(ttl))
+            if max_sessions is not None:
+                self.max_sessions = max(1, int(max_sessions))
+            if memory_budget is not None:
+                self.memory_budget = max(0, int(memory_budget))
+            if spill is not None:
+                self.spill = bool(spill)
+
+    def get(self, namespace: str, session_id: str, factory: Callable[[], object]) -> object:
+        key = (namespace, session_id)
+        while True:
+            owner = False
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None and key in self._pending_spills:
+                    entry = _Entry(value=self._pending_spills.pop(key), last_used=0.0)
+                    self._entries[key] = entry
+                if entry is not None:
+                    result = self._touch(key, entry)
+                    break
+                loading = self._loading.get(key)
+                if loading is None:
+                    loading = self._loading[key] = threading.Event()
+                    owner = True
+            if owner:
+                result = self._load(key, loading, factory)
+                break
+            # Another request is loading this session; use its result.
+            loading.wait()
+        self._write_pending_spills()
+        return result
+
+    def _load(self, key: SessionKey, loading: threading.Event, factory: Callable[[], object]) -> object:
+        try:
+            value = self._load_spilled(key)
+            rehydrated = value is not None
+            if not rehydrated:
+                value = factory()
+        except BaseException:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+            raise
+        with self._lock:
+            del self._loading[key]
+            self._rehydrated += rehydrated
+            # A put() during the load wins over the loaded value.
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(value=value, last_used=0.0)
+            result = self._touch(key, entry)
+        loading.set()
+        return result
+
+    def _touch(self, key: SessionKey, entry: _Entry) -> object:
+        """Mark ``entry`` as used and enforce limits; called with the lock held."""
+        now = time.monotonic()
+        self._entries.move_to_end(key)
+        entry.last_used = now
+        self._enforce_limits(now, keep=key)
+        return entry.value
+
+    def put(self, namespace: str, session_id: str, value: object) -> None:
+        key = (namespace, session_id)
+        now = time.monotonic()
+        with self._lock:
+            self._pending_spills.pop(key, None)
+            self._entries[key] = _Entry(value=value, last_used=now)
+            self._entries.move_to_end(key)
+            self._enforce_limits(now, keep=key)
+        self._write_pending_spills()
+
+    def discard(self, namespace: str, session_id: str) -> None:
+        key = (namespace, session_id)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._pending_spills.pop(key, None)
+            path = self._spill_path(key)
+            if path is not None and path.exists():
+                path.unlink()
+
+    def enforce_limits(self) -> None:
+        with self._lock:
+            self._enforce_limits(time.monotonic())
+        self._write_pending_spills()
+
+    def _enforce_limits(self, now: float, keep: Optional[SessionKey] = None) -> None:
+        if self.ttl:
+            expired = [
+                key for key, entry in self._entries.items()
+                if key != keep and now - entry.last_used > self.ttl
+            ]
+            for key in expired:
+                del self._entries[key]
+                self._expirations += 1
+        while len(self._entries) > self.max_sessions and self._evict_oldest(keep):
+            pass
+        if self.memory_budget:
+            while self._memory_usage() > self.memory_budget and self._evict_oldest(keep):
+                pass
+
+    def _evict_oldest(self, keep: Optional[SessionKey]) -> bool:
+        for key in self._entries:
+            if key == keep:
+                continue
+            entry = self._entries.pop(key)
+            self._evictions += 1
+            if self.spill and self._spill_path(key) is not None:
+                self._pending_spills[key] = entry.value
+            return True
+        return False
+
+    def _memory_usage(self) -> int:
+        return sum(_entry_size(entry.value) for entry in self._entries.values())
+
+    def _spill_path(self, key: SessionKey) -> Optional[Path]:
+        namespace, session_id = key
+        if not _SESSION_ID_PATTERN.match(session_id):
+            return None
+        return self.spill_dir / f"{namespace}-{session_id}.pickle"
+
+    def _write_pending_spills(self) -> None:
+        """Pickle evicted values to disk without holding the lock."""
+        with self._lock:
+            pending = list(self._pending_spills.items())
+        for key, value in pending:
+            self._spill(key, value)
+
+    def _spill(self, key: SessionKey, value: object) -> None:
+        path = self._spill_path(key)
+        if path is None:
+            return
+        tmp_path: Optional[Path] = None
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.spill_dir, suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            with open(fd, "wb") as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                # Only publish the file if nobody took the value back meanwhile.
+                if self._pending_spills.get(key) is value:
+                    del self._pending_spills[key]
+                    tmp_path.replace(path)
+                    tmp_path = None
+                    self._spilled += 1
+        except Exception:  # pragma: no cover - spilling is best effort
+            logger.exception("Unable to spill session %s/%s", *key)
+            with self._lock:
+                if self._pending_spills.get(key) is value:
+                    del self._pending_spills[key]
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def _load_spilled(self, key: SessionKey) -> Optional[object]:
+        path = self._spill_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            expired = self.ttl and time.time() - path.stat().st_mtime > self.ttl
+            if expired:
+                return None
+            with path.open("rb") as handle:
+                return pickle.load(handle)
+        except Exception:  # pragma: no cover - a broken spill file just starts fresh
+            logger.exception("Unable to load spilled session %s/%s", *key)
+            return None
+        finally:
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            namespaces: Dict[str, Dict[str, int]] = {}
+            for (namespace, _), entry in self._entries.items():
+                bucket = namespaces.setdefault(namespace, {"sessions": 0, "memoryBytes": 0})
+                bucket["sessions"] += 1
+                bucket["memoryBytes"] += _entry_size(entry.value)
+            spilled_files: List[Path] = (
+                list(self.spill_dir.glob("*.pickle")) if self.spill_dir.exists() else []
+            )
+            return {
+                "sessions": len(self._entries),
+                "memoryBytes": sum(item["memoryBytes"] for item in namespaces.values()),
+                "namespaces": namespaces,
+                "ttl": self.ttl,
+                "maxSessions": self.max_sessions,
+                "memoryBudget": self.memory_budget,
+                "spill": self.spill,
+                "spilledSessions": len(spilled_files),
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "spills": self._spilled,
+                "rehydrations": self._rehydrated,
+            }
+
+
+def _entry_size(value: object) -> int:
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        return int(memory_usage())
+    return estimate_size(value)
+
+
+session_manager = SessionManager()
+
+
+def configure_session_manager(
+    ttl: Optional[float] = None,
+    max_sessions: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+    spill: Optional[bool] = None,
+) -> None:
+    session_manager.configure(
+        ttl=ttl, max_sessions=max_sessions, memory_budget=memory_budget, spill=spill
+    )
+
+
+def get_session_manager_stats() -> Dict[str, object]:
+    return session_manager.stats()
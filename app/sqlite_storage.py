@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import uuid
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .storage import (OrgConfig, OrgStorage, QueryHistoryEntry,
+                      QueryHistoryStorage, SavedQuery, SavedQueryStorage,
+                      generate_saved_query_id)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS orgs (
+    id TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    client_id TEXT NOT NULL,
+    client_secret TEXT NOT NULL,
+    environment TEXT NOT NULL,
+    redirect_uri TEXT NOT NULL,
+    auth_scope TEXT NOT NULL,
+    instance_url TEXT,
+    access_token TEXT,
+    refresh_token TEXT
+);
+CREATE TABLE IF NOT EXISTS saved_queries (
+    id TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    soql TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS query_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    org_id TEXT NOT NULL,
+    soql TEXT NOT NULL,
+    object_name TEXT,
+    executed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_query_history_org_id ON query_history (org_id);
+CREATE INDEX IF NOT EXISTS idx_query_history_object_name ON query_history (object_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_query_history_executed_at ON query_history (executed_at);
+"""
+
+_ORG_COLUMNS = [item.name for item in fields(OrgConfig)]
+
+
+class SQLiteDatabase:
+    """Per-thread SQLite connections to one database file in WAL mode."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection().executescript(_SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def transaction(self) -> "_Transaction":
+        return _Transaction(self.connection())
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+
+class _Transaction:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+
+
+class SQLiteOrgStorage:
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self.database = database
+
+    def load_all(self) -> Dict[str, OrgConfig]:
+        rows = self.database.connection().execute("SELECT * FROM orgs ORDER BY rowid").fetchall()
+        return {row["id"]: OrgConfig(**{column: row[column] for column in _ORG_COLUMNS}) for row in rows}
+
+    def save_all(self, orgs: Dict[str, OrgConfig]) -> None:
+        with self.database.transaction() as conn:
+            conn.execute("DELETE FROM orgs")
+            for org in orgs.values():
+                _insert_org(conn, org)
+
+    def upsert(self, org: OrgConfig) -> OrgConfig:
+        with self.database.transaction() as conn:
+            _insert_org(conn, org)
+        return org
+
+    def delete(self, org_id: str) -> None:
+        with self.database.transaction() as conn:
+            conn.execute("DELETE FROM orgs WHERE id = ?", (org_id,))
+
+    def get(self, org_id: str) -> Optional[OrgConfig]:
+        row = self.database.connection().execute("SELECT * FROM orgs WHERE id = ?", (org_id,)).fetchone()
+        if not row:
+            return None
+        return OrgConfig(**{column: row[column] for column in _ORG_COLUMNS})
+
+    def list(self) -> List[OrgConfig]:
+        return list(self.load_all().values())
+
+
+def _insert_org(conn: sqlite3.Connection, org: OrgConfig) -> None:
+    data = asdict(org)
+    placeholders = ", ".join("?" for _ in _ORG_COLUMNS)
+    updates = ", ".join(f"{column} = excluded.{column}" for column in _ORG_COLUMNS if column != "id")
+    conn.execute(
+        f"INSERT INTO orgs ({', '.join(_ORG_COLUMNS)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}",
+        [data[column] for column in _ORG_COLUMNS],
+    )
+
+
+class SQLiteSavedQueryStorage:
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self.database = database
+
+    def load_all(self) -> Dict[str, SavedQuery]:
+        rows = self.database.connection().execute(
+            "SELECT id, label, soql FROM saved_queries ORDER BY rowid"
+        ).fetchall()
+        return {row["id"]: SavedQuery(id=row["id"], label=row["label"], soql=row["soql"]) for row in rows}
+
+    def upsert(self, label: str, soql: str, query_id: Optional[str] = None) -> Tuple[SavedQuery, bool]:
+        with self.database.transaction() as conn:
+            existing = {row["id"] for row in conn.execute("SELECT id FROM saved_queries")}
+            created = False
+            if query_id and query_id in existing:
+                identifier = query_id
+            else:
+                identifier = generate_saved_query_id(label, existing)
+                created = True
+            conn.execute(
+                "INSERT INTO saved_queries (id, label, soql) VALUES (?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET label = excluded.label, soql = excluded.soql",
+                (identifier, label, soql),
+            )
+        return SavedQuery(id=identifier, label=label, soql=soql), created
+
+    def delete(self, query_id: str) -> None:
+        with self.database.transaction() as conn:
+            conn.execute("DELETE FROM saved_queries WHERE id = ?", (query_id,))
+
+    def get(self, query_id: str) -> Optional[SavedQuery]:
+        row = self.database.connection().execute(
+            "SELECT id, label, soql FROM saved_queries WHERE id = ?", (query_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return SavedQuery(id=row["id"], label=row["label"], soql=row["soql"])
+
+    def list(self) -> List[SavedQuery]:
+        return list(self.load_all().values())
+
+
+class SQLiteQueryHistoryStorage:
+    max_entries: int = QueryHistoryStorage.max_entries
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        self.database = database
+
+    def _rows_to_entries(self, rows: Iterator[sqlite3.Row]) -> List[QueryHistoryEntry]:
+        return [
+            QueryHistoryEntry(
+                id=row["id"],
+                org_id=row["org_id"],
+                soql=row["soql"],
+                object_name=row["object_name"],
+                executed_at=row["executed_at"],
+            )
+            for row in rows
+        ]
+
+    def load_all(self) -> List[QueryHistoryEntry]:
+        rows = self.database.connection().execute(
+            "SELECT * FROM query_history ORDER BY seq DESC LIMIT ?", (self.max_entries,)
+        )
+        return list(reversed(self._rows_to_entries(rows)))
+
+    def add(self, org_id: str, soql: str, object_name: Optional[str]) -> QueryHistoryEntry:
+        entry = QueryHistoryEntry(
+            id=uuid.uuid4().hex,
+            org_id=org_id,
+            soql=soql,
+            object_name=object_name,
+            executed_at=datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+        )
+        with self.database.transaction() as conn:
+            _insert_history_entry(conn, entry)
+            conn.execute(
+                "DELETE FROM query_history WHERE seq <= "
+                "(SELECT seq FROM query_history ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        return entry
+
+    def list(self, object_name: Optional[str] = None) -> List[QueryHistoryEntry]:
+        conn = self.database.connection()
+        if object_name:
+            rows = conn.execute(
+                "SELECT * FROM query_history WHERE object_name = ? COLLATE NOCASE "
+                "ORDER BY seq DESC LIMIT ?",
+                (object_name, self.max_entries),
+            )
+        else:
+            rows = conn.execute(
+                "SELECT * FROM query_history ORDER BY seq DESC LIMIT ?", (self.max_entries,)
+            )
+        return self._rows_to_entries(rows)
+
+    def list_objects(self) -> List[str]:
+        rows = self.database.connection().execute(
+            "SELECT DISTINCT object_name FROM query_history WHERE object_name IS NOT NULL AND object_name != ''"
+        )
+        return sorted((row["object_name"] for row in rows), key=lambda value: value.lower())
+
+
+def _insert_history_entry(conn: sqlite3.Connection, entry: QueryHistoryEntry) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO query_history (id, org_id, soql, object_name, executed_at) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (entry.id, entry.org_id, entry.soql, entry.object_name, entry.executed_at),
+    )
+
+
+def migrate_json_to_sqlite(
+    database: SQLiteDatabase,
+    orgs: OrgStorage,
+    saved_queries: SavedQueryStorage,
+    history: QueryHistoryStorage,
+) -> bool:
+    """Copy the JSON stores into ``database`` once; returns whether it ran."""
+    if database.get_meta("json_migrated_at"):
+        return False
+    org_records = orgs.load_all()
+    query_records = saved_queries.load_all()
+    history_entries = history.load_all()
+    with database.transaction() as conn:
+        for org in org_records.values():
+            _insert_org(conn, org)
+        for saved in query_records.values():
+            conn.execute(
+                "INSERT OR IGNORE INTO saved_queries (id, label, soql) VALUES (?, ?, ?)",
+                (saved.id, saved.label, saved.soql),
+            )
+        for entry in history_entries:
+            _insert_history_entry(conn, entry)
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated_at', ?)",
+            (datetime.utcnow().replace(microsecond=0).isoformat() + "Z",),
+        )
+    return True
@@ -223,6 +223,29 @@
     return isoString;
   }
 
+  function formatQueryStats(stats) {
+    if (!stats || typeof stats !== "object" || !stats.chunks || typeof stats.chunks !== "object") {
+      return "";
+    }
+    let queries = 0;
+    let largest = 0;
+    Object.values(stats.chunks).forEach((entry) => {
+      if (!entry || typeof entry !== "object") {
+        return;
+      }
+      queries += Number(entry.queries) || 0;
+      largest = Math.max(largest, Number(entry.largest) || 0);
+    });
+    if (!queries) {
+      return "";
+    }
+    const strategy =
+      stats.fetchStrategy === "subquery" || stats.fetchStrategy === "per_object"
+        ? translateKey(`account_explorer.run.strategy_${stats.fetchStrategy}`)
+        : "";
+    return translateKey("account_explorer.run.query_stats", { queries, largest, strategy });
+  }
+
   function normalizeObjectDefinitions(raw) {
     if (!Array.isArray(raw)) {
       return [];
@@ -881,6 +904,7 @@
     const orgSelect = document.getElementById("account-explorer-org");
     const runButton = document.getElementById("account-explorer-run");
     const downloadButton = document.getElementById("account-explorer-download");
+    const cancelButton = document.getElementById("account-explorer-cancel");
     const statusEl = document.getElementById("account-explorer-status");
     const missingEl = document.getElementById("account-explorer-missing");
     const resultsPlaceholder = document.getElementById("account-explorer-results-placeholder");
@@ -918,8 +942,12 @@
       return;
     }
 
+    const accountLimit = Number(window.ACCOUNT_EXPLORER_LIMIT) || 200;
+    const JOB_POLL_INTERVAL = 1000;
+
     let accountIds = [];
     let explorerResult = null;
+    let activeJobId = null;
     let selectedAccountId = null;
     let availableOrgs = [];
     let latestTreeAccount = null;
@@ -964,7 +992,10 @@
     function updateRunState() {
       const hasAccounts = accountIds.length > 0;
       if (runButton) {
-        runButton.disabled = !hasAccounts || !orgSelect.value;
+        runButton.disabled = !hasAccounts || !orgSelect.value || !!activeJobId;
+      }
+      if (cancelButton) {
+        cancelButton.classList.toggle("d-none", !activeJobId);
       }
       if (downloadButton) {
         const available = !!(explorerResult && explorerResult.downloadAvailable);
@@ -2227,6 +2258,10 @@
           })
         );
       }
+      const queryStats = formatQueryStats(result.data?.stats);
+      if (queryStats) {
+        statusMessages.push(queryStats);
+      }
       if (statusMessages.length) {
         setStatus(statusMessages.join(" • "), statusType);
       } else {
@@ -2312,6 +2347,147 @@
         });
     }
 
+    function reportRunError(error) {
+      if (error instanceof Error && error.message.startsWith("server:")) {
+        const message = error.message.slice("server:".length).trim();
+        const fallback = translateKey("frontend.account_explorer.run_failed");
+        const displayMessage = message || fallback;
+        showToast(displayMessage, "danger");
+        setStatus(displayMessage, "danger");
+        return;
+      }
+      const code = error instanceof Error ? error.message : "run_failed";
+      const translationKeys = [
+        `frontend.account_explorer.errors.${code}`,
+        `frontend.account_explorer.${code}`,
+      ];
+      let message = "";
+      translationKeys.some((key) => {
+        const translated = translateKey(key);
+        if (translated !== key) {
+          message = translated;
+          return true;
+        }
+        return false;
+      });
+      if (!message) {
+        message = translateKey("frontend.account_explorer.run_failed");
+      }
+      showToast(message, "danger");
+      setStatus(message, "danger");
+    }
+
+    function readJson(response) {
+      return response.json().then((data) => ({ ok: response.ok, data }));
+    }
+
+    function toRunError(data, fallback) {
+      const code = typeof data?.code === "string" ? data.code : null;
+      const serverMessage = !code && typeof data?.error === "string" ? data.error : null;
+      return new Error(serverMessage ? `server:${serverMessage}` : code || fallback);
+    }
+
+    function startExplorerJob() {
+      runButton.disabled = true;
+      fetch("/api/account-explorer/jobs", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({
+          org_id: orgSelect.value,
+          account_ids: accountIds,
+        }),
+      })
+        .then(readJson)
+        .then(({ ok, data }) => {
+          if (!ok || !data?.job) {
+            throw toRunError(data, "run_failed");
+          }
+          activeJobId = data.job.id;
+          showToast(translateKey("account_explorer.run.job_started", { limit: accountLimit }), "primary");
+          showJobProgress(data.job);
+          updateRunState();
+          window.setTimeout(pollExplorerJob, JOB_POLL_INTERVAL);
+        })
+        .catch((error) => {
+          reportRunError(error);
+          updateRunState();
+        });
+    }
+
+    function showJobProgress(job) {
+      setStatus(
+        translateKey("account_explorer.run.job_progress", {
+          processed: job.processed || 0,
+          total: job.total || 0,
+        }),
+        "primary"
+      );
+    }
+
+    function pollExplorerJob() {
+      if (!activeJobId) {
+        return;
+      }
+      fetch(`/api/account-explorer/jobs/${encodeURIComponent(activeJobId)}`)
+        .then(readJson)
+        .then(({ ok, data }) => {
+          if (!ok || !data?.job) {
+            throw toRunError(data, "run_failed");
+          }
+          const job = data.job;
+          if (job.state === "queued" || job.state === "running") {
+            showJobProgress(job);
+            window.setTimeout(pollExplorerJob, JOB_POLL_INTERVAL);
+            return null;
+          }
+          activeJobId = null;
+          if (job.state === "cancelled") {
+            setStatus(translateKey("account_explorer.run.job_cancelled"), "muted");
+            showToast(translateKey("account_explorer.run.job_cancelled"), "warning");
+            return null;
+          }
+          if (job.state === "failed") {
+            throw new Error(job.error && job.error !== "run_failed" ? `server:${job.error}` : "run_failed");
+          }
+          return fetch("/api/account-explorer/result")
+            .then(readJson)
+            .then(({ data: resultData }) => {
+              explorerResult = resultData?.result || null;
+              renderResults(explorerResult);
+              showToast(translateKey("frontend.account_explorer.run_success"), "success");
+              const data = explorerResult?.data;
+              if (data?.truncated) {
+                setStatus(
+                  translateKey("account_explorer.run.job_truncated", {
+                    shown: Array.isArray(data.accounts) ? data.accounts.length : 0,
+                    total: data.totalAccounts || 0,
+                  }),
+                  "warning"
+                );
+              }
+            });
+        })
+        .catch((error) => {
+          activeJobId = null;
+          reportRunError(error);
+        })
+        .finally(() => {
+          updateRunState();
+        });
+    }
+
+    function cancelExplorerJob() {
+      if (!activeJobId) {
+        return;
+      }
+      cancelButton.disabled = true;
+      fetch(`/api/account-explorer/jobs/${encodeURIComponent(activeJobId)}/cancel`, { method: "POST" })
+        .catch(() => null)
+        .finally(() => {
+          cancelButton.disabled = false;
+        });
+    }
+
     function runExplorer() {
       if (!accountIds.length) {
         showToast(translateKey("frontend.account_explorer.no_accounts"), "warning");
@@ -2321,9 +2497,81 @@
         showToast(translateKey("frontend.account_explorer.no_org"), "warning");
         return;
       }
+      if (accountIds.length > accountLimit) {
+        startExplorerJob();
+        return;
+      }
       runButton.disabled = true;
       setStatus(translateKey("account_explorer.run.status_running"), "primary");
-      fetch("/api/account-explorer/run", {
+      const streamed = {
+        accountIds: [],
+        missingAccountIds: [],
+        generatedAt: null,
+        data: { accounts: [], objects: [], config: {}, alerts: [], summary: {} },
+        downloadAvailable: false,
+      };
+      let total = 0;
+      let renderPending = false;
+      let finished = false;
+      const scheduleRender = () => {
+        if (renderPending) {
+          return;
+        }
+        renderPending = true;
+        window.requestAnimationFrame(() => {
+          renderPending = false;
+          if (finished) {
+            return;
+          }
+          renderResults(streamed);
+          setStatus(
+            translateKey("account_explorer.run.progress_account", {
+              count: streamed.data.accounts.length,
+              total,
+            }),
+            "primary"
+          );
+        });
+      };
+      const handleEvent = (event, data) => {
+        if (event === "start") {
+          total = data.total || 0;
+          streamed.data.objects = data.objects || [];
+          streamed.data.config = data.config || {};
+          streamed.data.alerts = data.alerts || [];
+          setStatus(translateKey("account_explorer.run.progress_start", { total }), "primary");
+        } else if (event === "object") {
+          const definition = objectDefinitions.find((item) => item.key === data.object);
+          setStatus(
+            translateKey("account_explorer.run.progress_object", {
+              label: definition?.label || data.object,
+              count: data.count,
+              seconds: data.seconds,
+            }),
+            "primary"
+          );
+        } else if (event === "accounts") {
+          setStatus(translateKey("account_explorer.run.progress_accounts", data), "primary");
+        } else if (event === "account") {
+          const { elapsed, ...account } = data;
+          streamed.data.accounts.push(account);
+          scheduleRender();
+        } else if (event === "alerts") {
+          setStatus(translateKey("account_explorer.run.progress_alerts", data), "primary");
+        } else if (event === "file") {
+          setStatus(translateKey("account_explorer.run.progress_file", data), "primary");
+        } else if (event === "result") {
+          finished = true;
+          const { elapsed, ...result } = data;
+          explorerResult = { ...result, data: { ...result.data, accounts: streamed.data.accounts } };
+          renderResults(explorerResult);
+          showToast(translateKey("frontend.account_explorer.run_success"), "success");
+        } else if (event === "error") {
+          finished = true;
+          throw toRunError(data, "run_failed");
+        }
+      };
+      fetch("/api/account-explorer/run/stream", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
@@ -2331,54 +2579,20 @@
           account_ids: accountIds,
         }),
       })
-        .then((response) =>
-          response
-            .json()
-            .then((data) => ({ ok: response.ok, data }))
-        )
-        .then(({ ok, data }) => {
-          if (!ok) {
-            const code = typeof data?.code === "string" ? data.code : null;
-            const serverMessage =
-              !code && typeof data?.error === "string" ? data.error : null;
-            if (serverMessage) {
-              throw new Error(`server:${serverMessage}`);
-            }
-            throw new Error(code || "run_failed");
+        .then((response) => {
+          if (!response.ok) {
+            return readJson(response).then(({ data }) => {
+              throw toRunError(data, "run_failed");
+            });
           }
-          explorerResult = data;
-          renderResults(explorerResult);
-          showToast(translateKey("frontend.account_explorer.run_success"), "success");
+          return readEventStream(response, handleEvent);
         })
-        .catch((error) => {
-          if (error instanceof Error && error.message.startsWith("server:")) {
-            const message = error.message.slice("server:".length).trim();
-            const fallback = translateKey("frontend.account_explorer.run_failed");
-            const displayMessage = message || fallback;
-            showToast(displayMessage, "danger");
-            setStatus(displayMessage, "danger");
-            return;
-          }
-          const code = error instanceof Error ? error.message : "run_failed";
-          const translationKeys = [
-            `frontend.account_explorer.errors.${code}`,
-            `frontend.account_explorer.${code}`,
-          ];
-          let message = "";
-          translationKeys.some((key) => {
-            const translated = translateKey(key);
-            if (translated !== key) {
-              message = translated;
-              return true;
-            }
-            return false;
-          });
-          if (!message) {
-            message = translateKey("frontend.account_explorer.run_failed");
+        .then(() => {
+          if (!finished) {
+            throw new Error("run_failed");
           }
-          showToast(message, "danger");
-          setStatus(message, "danger");
         })
+        .catch(reportRunError)
         .finally(() => {
           runButton.disabled = false;
           updateRunState();
@@ -4276,6 +4490,9 @@
     if (runButton) {
       runButton.addEventListener("click", runExplorer);
     }
+    if (cancelButton) {
+      cancelButton.addEventListener("click", cancelExplorerJob);
+    }
     if (downloadButton) {
       downloadButton.addEventListener("click", () => {
         if (downloadButton.disabled) {
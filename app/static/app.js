@@ -1195,14 +1195,7 @@ function renderQueryResult(data) {
   };
 
   const headerRow = orderedColumns.map((col) => `<th scope="col">${escapeHtml(col)}</th>`).join("");
-  const rows = records
-    .map((record) => {
-      const cells = orderedColumns
-        .map((col) => `<td>${escapeHtml(formatDisplayValue(record[col]))}</td>`)
-        .join("");
-      return `<tr>${cells}</tr>`;
-    })
-    .join("");
+  const rows = renderQueryResultRows(orderedColumns, records);
 
   container.innerHTML = `
     <div class="query-result-panel">
@@ -1232,6 +1225,83 @@ function renderQueryResult(data) {
   bindResultActions(container);
 }
 
+function renderQueryResultRows(columns, records) {
+  return records
+    .map((record) => {
+      const cells = columns
+        .map((col) => `<td>${escapeHtml(formatDisplayValue(record[col]))}</td>`)
+        .join("");
+      return `<tr>${cells}</tr>`;
+    })
+    .join("");
+}
+
+function appendQueryResultRows(records) {
+  const tbody = document.querySelector("#query-result tbody");
+  if (!tbody || !Array.isArray(records) || records.length === 0) return;
+  tbody.insertAdjacentHTML("beforeend", renderQueryResultRows(state.queryResult.columns, records));
+  records.forEach((record) => state.queryResult.records.push(record));
+}
+
+async function readNdjsonStream(response, onMessage) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let newlineIndex = buffer.indexOf("\n");
+    while (newlineIndex >= 0) {
+      const line = buffer.slice(0, newlineIndex).trim();
+      buffer = buffer.slice(newlineIndex + 1);
+      if (line) {
+        onMessage(JSON.parse(line));
+      }
+      newlineIndex = buffer.indexOf("\n");
+    }
+  }
+  buffer += decoder.decode();
+  if (buffer.trim()) {
+    onMessage(JSON.parse(buffer));
+  }
+}
+
+async function readEventStream(response, onEvent) {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  const dispatch = (block) => {
+    let event = "message";
+    const dataLines = [];
+    block.split("\n").forEach((line) => {
+      if (line.startsWith("event:")) {
+        event = line.slice("event:".length).trim();
+      } else if (line.startsWith("data:")) {
+        dataLines.push(line.slice("data:".length).trimStart());
+      }
+    });
+    if (dataLines.length) {
+      onEvent(event, JSON.parse(dataLines.join("\n")));
+    }
+  };
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let separatorIndex = buffer.indexOf("\n\n");
+    while (separatorIndex >= 0) {
+      dispatch(buffer.slice(0, separatorIndex));
+      buffer = buffer.slice(separatorIndex + 2);
+      separatorIndex = buffer.indexOf("\n\n");
+    }
+  }
+  buffer += decoder.decode();
+  if (buffer.trim()) {
+    dispatch(buffer);
+  }
+}
+
 function escapeHtml(value) {
   if (value === null || value === undefined) {
     return "";
@@ -1403,7 +1473,7 @@ async function runQuery(options = {}) {
   if (fetchAll) {
     const parsedMaxRecords = Number.isFinite(maxRecords) ? maxRecords : Number.parseInt(maxRecords, 10);
     effectiveMaxRecords = Number.isFinite(parsedMaxRecords) && parsedMaxRecords > 0 ? parsedMaxRecords : null;
-    payload.options = { fetch_all: true };
+    payload.options = { fetch_all: true, stream: true };
     if (effectiveMaxRecords) {
       payload.options.max_records = effectiveMaxRecords;
     }
@@ -1415,15 +1485,20 @@ async function runQuery(options = {}) {
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify(payload),
     });
-    const data = await response.json();
-    if (!response.ok) {
-      throw new Error(data.error || translate("toast.query_failed"));
-    }
     const queryFields = getSelectFields(query);
-    renderQueryResult({ ...data, queryFields });
+    let data;
+    if (fetchAll && response.ok) {
+      data = await renderStreamedQueryResult(response, queryFields);
+    } else {
+      data = await response.json();
+      if (!response.ok) {
+        throw new Error(data.error || translate("toast.query_failed"));
+      }
+      renderQueryResult({ ...data, queryFields });
+    }
     loadQueryHistory(state.queryHistory.filter);
     if (data?.truncated) {
-      const limit = data?.max_records ?? effectiveMaxRecords ?? data?.records?.length ?? "";
+      const limit = data?.max_records ?? effectiveMaxRecords ?? data?.totalSize ?? "";
       const limitText = typeof limit === "number" ? limit.toLocaleString() : limit;
       showToast(
         translate("frontend.toast.query_truncated", { limit: limitText }),
@@ -1436,6 +1511,89 @@ async function runQuery(options = {}) {
   }
 }
 
+async function renderStreamedQueryResult(response, queryFields) {
+  let summary = {};
+  let rendered = false;
+  await readNdjsonStream(response, (message) => {
+    if (message?.error) {
+      throw new Error(message.error);
+    }
+    if (Array.isArray(message?.records)) {
+      if (rendered) {
+        appendQueryResultRows(message.records);
+      } else if (message.records.length > 0) {
+        renderQueryResult({ records: message.records, queryFields });
+        rendered = true;
+      }
+      return;
+    }
+    summary = message || {};
+  });
+  if (!rendered) {
+    renderQueryResult({ records: [], queryFields });
+  }
+  return summary;
+}
+
+async function runBulkExport() {
+  const queryInput = document.getElementById("soql-query");
+  const query = queryInput?.value.trim() ?? "";
+  if (!state.selectedOrg) {
+    showToast(translate("toast.select_org"), "warning");
+    return;
+  }
+  if (!query) {
+    showToast(translate("toast.enter_query"), "warning");
+    return;
+  }
+
+  saveQueryDraftToStorage(queryInput?.value ?? query);
+  showToast(translate("toast.bulk_export_started"), "info");
+
+  try {
+    const response = await fetch("/api/query", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ org_id: state.selectedOrg, query, options: { engine: "bulk" } }),
+    });
+    const data = await response.json().catch(() => ({}));
+    if (!response.ok || !data.bulkJob?.id) {
+      throw new Error(data.error || translate("toast.query_failed"));
+    }
+    loadQueryHistory(state.queryHistory.filter);
+    const orgId = state.selectedOrg;
+    const { id, filename } = data.bulkJob;
+    const pollInterval = Math.max(Number(data.bulkJob.pollInterval) || 2, 0.5) * 1000;
+    let job = data.bulkJob;
+    while (job.state !== "JobComplete") {
+      if (job.state === "Failed" || job.state === "Aborted") {
+        throw new Error(job.error || job.state);
+      }
+      await new Promise((resolve) => window.setTimeout(resolve, pollInterval));
+      const statusResponse = await fetch(
+        `/api/query/bulk-jobs/${encodeURIComponent(id)}?org_id=${encodeURIComponent(orgId)}`
+      );
+      const status = await statusResponse.json().catch(() => ({}));
+      if (!statusResponse.ok || !status.bulkJob) {
+        throw new Error(status.error || translate("toast.query_failed"));
+      }
+      job = status.bulkJob;
+    }
+    // Let the browser stream the CSV to disk instead of buffering it in a Blob.
+    const params = new URLSearchParams({ org_id: orgId, filename });
+    const link = document.createElement("a");
+    link.href = `/api/query/bulk-jobs/${encodeURIComponent(id)}/results?${params}`;
+    link.download = filename;
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    showToast(translate("toast.bulk_export_ready"));
+  } catch (error) {
+    const message = error instanceof Error ? error.message : translate("toast.query_failed");
+    showToast(message, "danger");
+  }
+}
+
 function bindQueryForm() {
   const form = document.getElementById("query-form");
   if (!form) return;
@@ -1454,6 +1612,10 @@ function bindQueryForm() {
       runQuery({ bypassValidation: true, fetchAll: true, maxRecords });
     });
   }
+  const bulkExportButton = document.getElementById("run-query-bulk-export");
+  if (bulkExportButton) {
+    bulkExportButton.addEventListener("click", () => runBulkExport());
+  }
 }
 
 async function loadSavedQueries() {
@@ -36,9 +36,16 @@
     const resultCountBadge = document.getElementById("data-import-result-count");
     const searchForm = document.getElementById("data-import-search");
     const resetButton = document.getElementById("data-import-reset");
+    const linkModeSelect = document.getElementById("data-import-link-mode");
+    const batchInput = document.getElementById("data-import-batch");
+
+    const RELATED_PAGE_SIZE = 500;
+    const JOB_POLL_INTERVAL = 1000;
 
     let autocompleteTimeout = null;
     let currentGraph = null;
+    let currentSearch = null;
+    let loadingMore = false;
     let selectedObjectKey = null;
     let selectedRecordId = null;
     let matchKeySet = new Set();
@@ -82,6 +89,18 @@
       }
       const entry = getStatus(objectKey);
       updateBadge(card, entry);
+      const progressEl = card.querySelector(".data-import-job-progress");
+      if (progressEl) {
+        const job = entry?.job;
+        const running = job && job.state === "running";
+        progressEl.classList.toggle("d-none", !running);
+        progressEl.textContent = running
+          ? getTranslation("frontend.data_import.parse_progress", {
+              filename: job.filename || "",
+              rows: job.rows || 0,
+            })
+          : "";
+      }
       const emptyState = card.querySelector('.data-import-status[data-status="empty"]');
       const loadedState = card.querySelector('.data-import-status[data-status="loaded"]');
       if (!entry || !entry.loaded) {
@@ -104,9 +123,57 @@
         if (updatedAtEl) {
           updatedAtEl.textContent = formatDate(entry.updatedAt);
         }
+        const referenceSelect = loadedState.querySelector(".data-import-reference-fields");
+        if (referenceSelect) {
+          populateReferenceFields(referenceSelect, entry);
+        }
       }
     }
 
+    function populateReferenceFields(select, entry) {
+      const selected = new Set(Array.isArray(entry.referenceFields) ? entry.referenceFields : []);
+      select.innerHTML = "";
+      (entry.fields || [])
+        .filter((fieldName) => fieldName.toLowerCase() !== "id")
+        .forEach((fieldName) => {
+          const option = document.createElement("option");
+          option.value = fieldName;
+          option.textContent = fieldName;
+          option.selected = selected.has(fieldName);
+          select.appendChild(option);
+        });
+    }
+
+    function updateLinkSettings(payload, control) {
+      if (control) control.disabled = true;
+      fetch("/api/data-import/links", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(payload),
+      })
+        .then((response) => response.json().then((data) => ({ ok: response.ok, data })))
+        .then(({ ok, data }) => {
+          if (!ok) {
+            throw new Error(lookupErrorMessage(data.error, "frontend.data_import.links_failed"));
+          }
+          setStatus(data.status);
+          updateAllCards();
+          if (linkModeSelect && data.links?.mode) {
+            linkModeSelect.value = data.links.mode;
+          }
+          resetResults();
+          showToast(getTranslation("frontend.data_import.links_updated"), "success");
+        })
+        .catch((error) => {
+          const message = error instanceof Error ? error.message : getTranslation("frontend.data_import.links_failed");
+          showToast(message, "danger");
+          refreshStatus();
+        })
+        .finally(() => {
+          if (control) control.disabled = false;
+        });
+    }
+
     function updateAllCards() {
       objects.forEach((definition) => updateCard(definition.key));
     }
@@ -213,6 +280,16 @@
             updateAllCards();
             populateObjectSelect();
           }
+          if (data.job) {
+            showToast(getTranslation("frontend.data_import.parse_started", { filename: data.job.filename }));
+            return waitForJob(objectKey, data.job.id);
+          }
+          return null;
+        })
+        .then((job) => {
+          if (job && job.state !== "done") {
+            throw new Error(lookupErrorMessage(job.error, "frontend.data_import.upload_failed"));
+          }
           const definition = objects.find((item) => item.key === objectKey);
           const entry = getStatus(objectKey);
           const count = entry?.recordCount ?? 0;
@@ -233,6 +310,124 @@
         });
     }
 
+    function normalizeObjectName(value) {
+      return String(value || "").toLowerCase().replace(/[^a-z0-9]/g, "");
+    }
+
+    function matchObjectForFile(filename) {
+      const stem = normalizeObjectName(filename.replace(/\.[^.]+$/, ""));
+      return (
+        objects.find((item) => normalizeObjectName(item.key) === stem) ||
+        objects.find((item) => normalizeObjectName(item.label) === stem) ||
+        null
+      );
+    }
+
+    function handleBatchUpload(input) {
+      const files = Array.from(input.files || []);
+      if (!files.length) {
+        return;
+      }
+      const formData = new FormData();
+      const unmatched = [];
+      files.forEach((file) => {
+        const definition = matchObjectForFile(file.name);
+        if (definition) {
+          formData.append(definition.key, file);
+        } else {
+          unmatched.push(file.name);
+        }
+      });
+      if (unmatched.length) {
+        showToast(
+          getTranslation("frontend.data_import.batch_unmatched", { filenames: unmatched.join(", ") }),
+          "warning"
+        );
+      }
+      if (unmatched.length === files.length) {
+        input.value = "";
+        return;
+      }
+      input.disabled = true;
+      fetch("/api/data-import/upload-batch", {
+        method: "POST",
+        body: formData,
+      })
+        .then((response) =>
+          response
+            .json()
+            .catch(() => ({ error: "invalid_file" }))
+            .then((data) => ({ ok: response.ok, data }))
+        )
+        .then(({ ok, data }) => {
+          if (!ok) {
+            throw new Error(lookupErrorMessage(data.code || data.error, "frontend.data_import.upload_failed"));
+          }
+          if (Array.isArray(data.status)) {
+            setStatus(data.status);
+            updateAllCards();
+            populateObjectSelect();
+          }
+          const files = Array.isArray(data.files) ? data.files : [];
+          const loaded = files.filter((item) => !item.error);
+          files
+            .filter((item) => item.error)
+            .forEach((item) => {
+              showToast(
+                getTranslation("frontend.data_import.batch_file_failed", {
+                  filename: item.filename,
+                  message: lookupErrorMessage(item.error, "frontend.data_import.upload_failed"),
+                }),
+                "danger"
+              );
+            });
+          if (loaded.length) {
+            showToast(
+              getTranslation("frontend.data_import.batch_success", {
+                count: loaded.length,
+                seconds: data.totalSeconds,
+              })
+            );
+          }
+        })
+        .catch((error) => {
+          const message = error instanceof Error ? error.message : getTranslation("frontend.data_import.upload_failed");
+          showToast(message, "danger");
+        })
+        .finally(() => {
+          input.disabled = false;
+          input.value = "";
+        });
+    }
+
+    function waitForJob(objectKey, jobId) {
+      return new Promise((resolve, reject) => {
+        const poll = () => {
+          fetch("/api/data-import/status")
+            .then((response) => response.json().then((data) => ({ ok: response.ok, data })))
+            .then(({ ok, data }) => {
+              if (!ok) {
+                throw new Error(getTranslation("frontend.data_import.status_failed"));
+              }
+              setStatus(data);
+              updateAllCards();
+              populateObjectSelect();
+              const job = getStatus(objectKey)?.job;
+              if (!job || job.id !== jobId) {
+                // Superseded by a newer upload or removed.
+                resolve({ state: "failed", error: "cancelled" });
+              } else if (job.state === "running") {
+                window.setTimeout(poll, JOB_POLL_INTERVAL);
+              } else {
+                resolve(job);
+              }
+            })
+            .catch(reject);
+        };
+        window.setTimeout(poll, JOB_POLL_INTERVAL);
+      });
+    }
+
     function handleRemove(button) {
       const card = button.closest(".data-import-card");
       if (!card) {
@@ -441,7 +636,7 @@
         labelSpan.textContent = getObjectDefinition(key)?.label || key;
         const badge = document.createElement("span");
         badge.className = "badge bg-primary rounded-pill";
-        badge.textContent = String(objectData.records.length);
+        badge.textContent = String(objectData.total ?? objectData.records.length);
         wrapper.appendChild(labelSpan);
         wrapper.appendChild(badge);
         button.appendChild(wrapper);
@@ -517,6 +712,74 @@
         });
         recordListEl.appendChild(button);
       });
+      if (currentGraph.hasMore) {
+        recordListEl.appendChild(createLoadMoreButton());
+      }
+    }
+
+    function countLoadedRecords(graph) {
+      return Object.values(graph?.objects || {}).reduce(
+        (total, objectData) => total + (objectData.records?.length || 0),
+        0
+      );
+    }
+
+    function createLoadMoreButton() {
+      const button = document.createElement("button");
+      button.type = "button";
+      button.className = "list-group-item list-group-item-action text-center text-primary";
+      button.disabled = loadingMore;
+      button.textContent = getTranslation("frontend.data_import.load_more", {
+        loaded: countLoadedRecords(currentGraph),
+        total: currentGraph.total,
+      });
+      button.addEventListener("click", loadMoreRelated);
+      return button;
+    }
+
+    function mergeGraphPage(page) {
+      Object.entries(page.objects || {}).forEach(([key, objectData]) => {
+        const existing = currentGraph.objects[key];
+        if (existing) {
+          existing.records.push(...objectData.records);
+        } else {
+          currentGraph.objects[key] = objectData;
+        }
+      });
+      currentGraph.offset = page.offset;
+      currentGraph.hasMore = page.hasMore;
+    }
+
+    function loadMoreRelated() {
+      if (!currentGraph || !currentSearch || loadingMore) {
+        return;
+      }
+      loadingMore = true;
+      renderRecordList();
+      const payload = { ...currentSearch, offset: countLoadedRecords(currentGraph) };
+      fetch("/api/data-import/related", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(payload),
+      })
+        .then((response) => {
+          if (!response.ok) {
+            throw new Error(getTranslation("frontend.data_import.load_more_failed"));
+          }
+          return response.json();
+        })
+        .then((page) => {
+          mergeGraphPage(page);
+        })
+        .catch((error) => {
+          const message = error instanceof Error ? error.message : getTranslation("frontend.data_import.load_more_failed");
+          showToast(message, "danger");
+        })
+        .finally(() => {
+          loadingMore = false;
+          renderObjectList();
+          renderRecordList();
+        });
     }
 
     function findRecord(objectKey, recordId) {
@@ -628,11 +891,7 @@
       }
 
       const objectKeys = Object.keys(graph.objects);
-      let totalRecords = 0;
-      objectKeys.forEach((key) => {
-        const records = graph.objects[key].records || [];
-        totalRecords += records.length;
-      });
+      const totalRecords = typeof graph.total === "number" ? graph.total : countLoadedRecords(graph);
       resultCountBadge.textContent = String(totalRecords);
 
       if (Array.isArray(graph.matches)) {
@@ -662,6 +921,7 @@
 
     function resetResults() {
       currentGraph = null;
+      currentSearch = null;
       selectedObjectKey = null;
       selectedRecordId = null;
       matchKeySet = new Set();
@@ -693,6 +953,7 @@
         object: objectKey,
         field: fieldName,
         value: searchValue,
+        limit: RELATED_PAGE_SIZE,
       };
       fetch("/api/data-import/related", {
         method: "POST",
@@ -714,6 +975,7 @@
             resetResults();
             return;
           }
+          currentSearch = payload;
           renderGraph(data);
         })
         .catch((error) => {
@@ -739,6 +1001,19 @@
       ) {
         handleUpload(target);
       }
+      if (
+        target instanceof HTMLSelectElement &&
+        target.classList.contains("data-import-reference-fields")
+      ) {
+        const selected = Array.from(target.selectedOptions).map((option) => option.value);
+        updateLinkSettings({ referenceFields: { [target.dataset.object]: selected } }, target);
+      }
+    });
+
+    batchInput?.addEventListener("change", () => handleBatchUpload(batchInput));
+
+    linkModeSelect?.addEventListener("change", () => {
+      updateLinkSettings({ mode: linkModeSelect.value }, linkModeSelect);
     });
 
     cardsContainer.addEventListener("click", (event) => {
@@ -1,22 +1,56 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import tempfile
 import threading
 import uuid
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Container, Deque, Dict, List, Optional, Tuple
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+SQLITE_DATA_FILE = DATA_DIR / "sf_integrator.db"
 ORGS_DATA_FILE = DATA_DIR / "orgs.json"
 SAVED_QUERIES_DATA_FILE = DATA_DIR / "saved_queries.json"
-QUERY_HISTORY_DATA_FILE = DATA_DIR / "query_history.json"
+QUERY_HISTORY_DATA_FILE = DATA_DIR / "query_history.jsonl"
+LEGACY_QUERY_HISTORY_DATA_FILE = DATA_DIR / "query_history.json"
 
 _lock = threading.Lock()
 
 
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _atomic_write_json(path: Path, payload: object) -> None:
+    _atomic_write_text(path, json.dumps(payload, indent=2, sort_keys=True))
+
+
 @dataclass
 class OrgConfig:
     id: str
@@ -40,20 +74,37 @@ class OrgConfig:
 
 
 class OrgStorage:
+    """Org definitions cached in memory and reloaded when the file's mtime or size changes."""
+
     def __init__(self, path: Path) -> None:
         self.path = path
+        self._cache: Optional[Dict[str, OrgConfig]] = None
+        self._cache_signature: Optional[Tuple[int, int]] = None
+        self._cache_lock = threading.Lock()
 
-    def load_all(self) -> Dict[str, OrgConfig]:
-        if not self.path.exists():
-            return {}
+    def _read(self) -> Dict[str, OrgConfig]:
         with self.path.open("r", encoding="utf-8") as fh:
             raw = json.load(fh)
         return {item["id"]: OrgConfig(**item) for item in raw}
 
+    def load_all(self) -> Dict[str, OrgConfig]:
+        signature = _file_signature(self.path)
+        if signature is None:
+            return {}
+        with self._cache_lock:
+            if self._cache is not None and self._cache_signature == signature:
+                return dict(self._cache)
+        orgs = self._read()
+        with self._cache_lock:
+            self._cache = orgs
+            self._cache_signature = signature
+        return dict(orgs)
+
     def save_all(self, orgs: Dict[str, OrgConfig]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as fh:
-            json.dump([asdict(org) for org in orgs.values()], fh, indent=2, sort_keys=True)
+        _atomic_write_json(self.path, [asdict(org) for org in orgs.values()])
+        with self._cache_lock:
+            self._cache = dict(orgs)
+            self._cache_signature = _file_signature(self.path)
 
     def upsert(self, org: OrgConfig) -> OrgConfig:
         with _lock:
@@ -83,6 +134,17 @@ class SavedQuery:
     soql: str
 
 
+def generate_saved_query_id(label: str, existing: Container[str]) -> str:
+    tokens = re.findall(r"[a-z0-9]+", label.lower())
+    base = "-".join(tokens) or "query"
+    candidate = base
+    index = 1
+    while candidate in existing:
+        candidate = f"{base}-{index}"
+        index += 1
+    return candidate
+
+
 class SavedQueryStorage:
     def __init__(self, path: Path) -> None:
         self.path = path
@@ -100,14 +162,7 @@ class SavedQueryStorage:
             json.dump([asdict(query) for query in queries.values()], fh, indent=2, sort_keys=True)
 
     def _generate_id(self, label: str, existing: Dict[str, SavedQuery]) -> str:
-        tokens = re.findall(r"[a-z0-9]+", label.lower())
-        base = "-".join(tokens) or "query"
-        candidate = base
-        index = 1
-        while candidate in existing:
-            candidate = f"{base}-{index}"
-            index += 1
-        return candidate
+        return generate_saved_query_id(label, existing)
 
     def upsert(self, label: str, soql: str, query_id: Optional[str] = None) -> Tuple[SavedQuery, bool]:
         with _lock:
@@ -147,38 +202,93 @@ class QueryHistoryEntry:
 
 
 class QueryHistoryStorage:
+    """Append-only JSONL history with the most recent entries kept in memory.
+
+    Each ``add`` appends one line. Once the file holds ``compact_slack`` more
+    lines than ``max_entries`` it is rewritten with only the newest entries.
+    The in-memory tail is reloaded when another process changes the file.
+    """
+
     max_entries: int = 1000
+    compact_slack: int = 500
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, legacy_path: Optional[Path] = None) -> None:
         self.path = path
-
-    def load_all(self) -> List[QueryHistoryEntry]:
+        self.legacy_path = legacy_path
+        self._entries: Optional[Deque[QueryHistoryEntry]] = None
+        self._lines_on_disk = 0
+        self._signature: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def _read_lines(self) -> List[QueryHistoryEntry]:
+        entries: List[QueryHistoryEntry] = []
         if not self.path.exists():
-            return []
+            return entries
         with self.path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(QueryHistoryEntry(**json.loads(line)))
+                except (TypeError, ValueError):
+                    continue
+        return entries
+
+    def _migrate_legacy(self) -> None:
+        if not self.legacy_path or not self.legacy_path.exists():
+            return
+        if self.path.exists() and self.path.stat().st_size:
+            return
+        with self.legacy_path.open("r", encoding="utf-8") as fh:
             raw = json.load(fh)
-        return [QueryHistoryEntry(**item) for item in raw]
+        entries = [QueryHistoryEntry(**item) for item in raw]
+        self.save_all(entries[-self.max_entries :])
+        self.legacy_path.rename(self.legacy_path.with_suffix(".json.migrated"))
+
+    def _ensure_loaded(self) -> Deque[QueryHistoryEntry]:
+        signature = _file_signature(self.path)
+        if self._entries is None or signature != self._signature:
+            if self._entries is None:
+                self._migrate_legacy()
+                signature = _file_signature(self.path)
+            entries = self._read_lines()
+            self._entries = deque(entries, maxlen=self.max_entries)
+            self._lines_on_disk = len(entries)
+            self._signature = signature
+        return self._entries
+
+    def load_all(self) -> List[QueryHistoryEntry]:
+        with self._lock:
+            return list(self._ensure_loaded())
 
     def save_all(self, entries: List[QueryHistoryEntry]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as fh:
-            json.dump([asdict(entry) for entry in entries], fh, indent=2, sort_keys=True)
+        text = "".join(json.dumps(asdict(entry), sort_keys=True) + "\n" for entry in entries)
+        _atomic_write_text(self.path, text)
+        self._entries = deque(entries, maxlen=self.max_entries)
+        self._lines_on_disk = len(entries)
+        self._signature = _file_signature(self.path)
 
     def add(self, org_id: str, soql: str, object_name: Optional[str]) -> QueryHistoryEntry:
-        with _lock:
-            entries = self.load_all()
-            entry = QueryHistoryEntry(
-                id=uuid.uuid4().hex,
-                org_id=org_id,
-                soql=soql,
-                object_name=object_name,
-                executed_at=datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
-            )
+        entry = QueryHistoryEntry(
+            id=uuid.uuid4().hex,
+            org_id=org_id,
+            soql=soql,
+            object_name=object_name,
+            executed_at=datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+        )
+        line = json.dumps(asdict(entry), sort_keys=True) + "\n"
+        with self._lock:
+            entries = self._ensure_loaded()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as fh:
+                fh.write(line)
             entries.append(entry)
-            if len(entries) > self.max_entries:
-                entries = entries[-self.max_entries :]
-            self.save_all(entries)
-            return entry
+            self._lines_on_disk += 1
+            self._signature = _file_signature(self.path)
+            if self._lines_on_disk > self.max_entries + self.compact_slack:
+                self.save_all(list(entries))
+        return entry
 
     def list(self, object_name: Optional[str] = None) -> List[QueryHistoryEntry]:
         entries = self.load_all()
@@ -198,11 +308,61 @@ class QueryHistoryStorage:
 
 def ensure_storage() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    for path in (ORGS_DATA_FILE, SAVED_QUERIES_DATA_FILE, QUERY_HISTORY_DATA_FILE):
+    for path in (ORGS_DATA_FILE, SAVED_QUERIES_DATA_FILE):
         if not path.exists():
             path.write_text("[]", encoding="utf-8")
 
 
-storage = OrgStorage(ORGS_DATA_FILE)
-saved_queries_storage = SavedQueryStorage(SAVED_QUERIES_DATA_FILE)
-query_history_storage = QueryHistoryStorage(QUERY_HISTORY_DATA_FILE)
+class _BackendProxy:
+    """Stable module-level handle whose backend can be swapped by ``configure_storage``."""
+
+    def __init__(self, backend: object) -> None:
+        self._backend = backend
+
+    def set_backend(self, backend: object) -> None:
+        self._backend = backend
+
+    @property
+    def backend(self) -> object:
+        return self._backend
+
+    def __getattr__(self, name: str):
+        return getattr(self._backend, name)
+
+
+STORAGE_BACKENDS = ("json", "sqlite")
+
+
+def configure_storage(backend: str = "json", sqlite_path: Optional[Path] = None) -> None:
+    if backend not in STORAGE_BACKENDS:
+        raise ValueError(f"Unknown storage backend: {backend}")
+    if backend == "json":
+        storage.set_backend(OrgStorage(ORGS_DATA_FILE))
+        saved_queries_storage.set_backend(SavedQueryStorage(SAVED_QUERIES_DATA_FILE))
+        query_history_storage.set_backend(
+            QueryHistoryStorage(QUERY_HISTORY_DATA_FILE, LEGACY_QUERY_HISTORY_DATA_FILE)
+        )
+        return
+
+    from .sqlite_storage import (SQLiteDatabase, SQLiteOrgStorage,
+                                 SQLiteQueryHistoryStorage,
+                                 SQLiteSavedQueryStorage,
+                                 migrate_json_to_sqlite)
+
+    database = SQLiteDatabase(sqlite_path or SQLITE_DATA_FILE)
+    migrate_json_to_sqlite(
+        database,
+        orgs=OrgStorage(ORGS_DATA_FILE),
+        saved_queries=SavedQueryStorage(SAVED_QUERIES_DATA_FILE),
+        history=QueryHistoryStorage(QUERY_HISTORY_DATA_FILE, LEGACY_QUERY_HISTORY_DATA_FILE),
+    )
+    storage.set_backend(SQLiteOrgStorage(database))
+    saved_queries_storage.set_backend(SQLiteSavedQueryStorage(database))
+    query_history_storage.set_backend(SQLiteQueryHistoryStorage(database))
+
+
+storage = _BackendProxy(OrgStorage(ORGS_DATA_FILE))
+saved_queries_storage = _BackendProxy(SavedQueryStorage(SAVED_QUERIES_DATA_FILE))
+query_history_storage = _BackendProxy(
+    QueryHistoryStorage(QUERY_HISTORY_DATA_FILE, LEGACY_QUERY_HISTORY_DATA_FILE)
+)
@@ -0,0 +1,34 @@
+import importlib.util
+import threading
+from pathlib import Path
+
+import pytest
+from werkzeug.serving import make_server
+
+from app.storage import OrgConfig
+
+STUB_PATH = Path(__file__).resolve().parent.parent / "tools" / "salesforce_stub.py"
+
+
+@pytest.fixture(scope="session")
+def stub():
+    """tools/salesforce_stub.py served on a free local port, with an org pointing at it."""
+    spec = importlib.util.spec_from_file_location("salesforce_stub", STUB_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.app.config.update(STUB_RECORDS=1000, STUB_BATCH_SIZE=200)
+    server = make_server("127.0.0.1", 0, module.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    org = OrgConfig(
+        id="stub",
+        label="Stub",
+        client_id="client",
+        client_secret="secret",
+        environment="production",
+        redirect_uri="http://localhost/callback",
+        instance_url=f"http://127.0.0.1:{server.server_port}",
+        access_token="token",
+    )
+    yield module, org
+    server.shutdown()
@@ -0,0 +1,105 @@
+import pytest
+
+from app import account_explorer
+from app.salesforce import COMPOSITE_BATCH_LIMIT, batch_query_calls, composite_batch_calls
+
+IDS = [f"001{index:015d}" for index in range(1000)]
+PREFIX = "SELECT Id, Name FROM Account WHERE Id IN ("
+
+
+@pytest.fixture(autouse=True)
+def fetch_settings(monkeypatch):
+    monkeypatch.setattr(
+        account_explorer,
+        "_fetch_settings",
+        {
+            "strategy": account_explorer.FETCH_STRATEGY_AUTO,
+            "composite_batch": True,
+            "url_budget": 4000,
+            "soql_budget": 20000,
+        },
+    )
+
+
+def _query(chunk):
+    return f"{PREFIX}{account_explorer._format_ids_for_soql(chunk)})"
+
+
+@pytest.mark.parametrize("composite_batch", [True, False])
+def test_chunks_fit_the_url_budget(composite_batch):
+    account_explorer._fetch_settings["composite_batch"] = composite_batch
+    chunks = account_explorer._plan_id_chunks(PREFIX, IDS)
+    assert [value for chunk in chunks for value in chunk] == IDS
+    assert all(account_explorer._query_url_length(_query(chunk)) <= 4000 for chunk in chunks)
+    # Each chunk is full: one more ID would not have fitted.
+    for chunk, following in zip(chunks, chunks[1:]):
+        assert account_explorer._query_url_length(_query([*chunk, following[0]])) > 4000
+
+
+def test_prefix_too_long_for_a_url_falls_back_to_the_soql_budget():
+    prefix = f"SELECT {', '.join(f'Field{index}__c' for index in range(400))} FROM Account WHERE Id IN ("
+    chunks = account_explorer._plan_id_chunks(prefix, IDS)
+    assert all(len(f"{prefix}{account_explorer._format_ids_for_soql(chunk)})") <= 20000 for chunk in chunks)
+    assert len(chunks) < len(IDS)
+
+
+def test_composite_round_trips_respect_count_and_body_limits():
+    short = ["v57.0/query?q=x"] * (COMPOSITE_BATCH_LIMIT * 2 + 1)
+    assert composite_batch_calls(short) == 3
+    long = ["v57.0/query?q=" + "x" * 990] * 10
+    assert composite_batch_calls(long, max_body=3000) == 5
+    assert composite_batch_calls(long[:1], max_body=10) == 1
+
+
+def test_estimates_count_http_calls():
+    queries = [_query(chunk) for chunk in account_explorer._plan_id_chunks(PREFIX, IDS)]
+    assert len(queries) > 1
+    assert account_explorer._estimate_calls(queries) == batch_query_calls(queries, 20000)
+    assert account_explorer._estimate_calls(queries) < len(queries)
+    account_explorer._fetch_settings["composite_batch"] = False
+    assert account_explorer._estimate_calls(queries) == len(queries)
+
+
+def _nested_accounts(truncated):
+    return [
+        {
+            "Id": account_id,
+            "Contacts": {
+                "records": [{"Id": f"003{index:015d}"}],
+                **({"nextRecordsUrl": f"/next/{account_id}"} if index < truncated else {}),
+            },
+        }
+        for index, account_id in enumerate(IDS[:50])
+    ]
+
+
+@pytest.mark.parametrize("truncated, requeried", [(1, False), (50, True)])
+def test_expensive_nested_paging_is_replaced_by_in_queries(monkeypatch, truncated, requeried):
+    account_explorer._fetch_settings["composite_batch"] = False
+    monkeypatch.setattr(account_explorer, "_nested_paging_rates", {})
+    pages = []
+    queried = []
+    monkeypatch.setattr(
+        account_explorer, "query_more", lambda org, url: pages.append(url) or [{"Id": url}]
+    )
+    monkeypatch.setattr(
+        account_explorer,
+        "_query_records_by_ids",
+        lambda org, object_key, *args, **kwargs: queried.append(object_key) or [{"Id": "requeried"}],
+    )
+    plan = account_explorer.QueryPlan(
+        {"Contact": account_explorer.ObjectQueryPlan(["Id", "AccountId"], ["Id"], [])}
+    )
+    stats = {}
+    children = account_explorer._collect_nested_children(
+        None, plan, IDS[:50], _nested_accounts(truncated), {"Contact": "Contacts"}, {}, stats=stats
+    )
+    if requeried:
+        assert queried == ["Contact"] and not pages
+        assert children["Contact"] == [{"Id": "requeried"}]
+        assert stats["requeriedObjects"] == ["Contact"]
+    else:
+        assert not queried and len(pages) == 1
+        assert len(children["Contact"]) == 51
+        assert stats["nestedPages"] == 1
+    assert account_explorer._nested_paging_rates[("", "Contact")] == truncated / 50
@@ -0,0 +1,96 @@
+import json
+import threading
+import time
+
+import pytest
+
+from app import account_explorer
+from app.account_explorer import ExplorerJob
+
+SESSION_ID = "e" * 32
+ACCOUNT_IDS = [f"001{index:015d}" for index in range(account_explorer.JOB_WINDOW_SIZE * 3)]
+
+
+@pytest.fixture(autouse=True)
+def explorer(tmp_path, monkeypatch):
+    monkeypatch.setattr(account_explorer, "RESULTS_DIR", tmp_path / "results")
+    monkeypatch.setattr(account_explorer, "CONFIG_FILE", tmp_path / "config.json")
+    monkeypatch.setattr(account_explorer, "_build_query_plan", lambda org, config, concurrency: None)
+
+
+def _windows(monkeypatch, on_window=None):
+    windows = []
+
+    def explore_window(org, window, config, plan, concurrency, warnings, stats=None):
+        windows.append(list(window))
+        if on_window is not None:
+            on_window(len(windows))
+        return [{"Id": account_id} for account_id in window], [], {"Account": len(window)}
+
+    monkeypatch.setattr(account_explorer, "_explore_window", explore_window)
+    return windows
+
+
+def _job():
+    return ExplorerJob(id="f" * 32, session_id=SESSION_ID, account_ids=list(ACCOUNT_IDS))
+
+
+def test_result_paths_are_unique_within_a_second():
+    paths = {account_explorer._new_result_path() for _ in range(50)}
+    assert len(paths) == 50
+    assert account_explorer._new_result_path("job1").name.endswith("_job1.json")
+
+
+def test_job_streams_every_window_into_the_result_file(monkeypatch):
+    windows = _windows(monkeypatch)
+    job = _job()
+    account_explorer._run_explorer_job(job, None, 1)
+    assert job.state == "done"
+    assert job.processed == len(ACCOUNT_IDS)
+    assert len(windows) == 3
+
+    result = account_explorer._get_session_by_id(SESSION_ID).result
+    assert job.id in result.file_path
+    with open(result.file_path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    assert [account["Id"] for account in data["accounts"]] == ACCOUNT_IDS
+    assert len(result.data["accounts"]) == account_explorer.JOB_PREVIEW_ACCOUNTS
+    assert result.data["truncated"]
+
+
+def test_cancelled_job_stops_between_windows_and_removes_its_file(tmp_path, monkeypatch):
+    job = _job()
+    windows = _windows(monkeypatch, on_window=lambda count: job.cancel_event.set())
+    account_explorer._run_explorer_job(job, None, 1)
+    assert job.state == "cancelled"
+    assert job.finished and job.finished_at is not None
+    assert len(windows) == 1
+    assert job.processed == account_explorer.JOB_WINDOW_SIZE
+    assert not list((tmp_path / "results").iterdir())
+
+
+def test_closing_the_stream_stops_the_run(monkeypatch):
+    from app import create_app
+
+    reported = []
+    stopped = threading.Event()
+
+    def explore_window(org, window, config, plan, concurrency, warnings, progress=None, stats=None):
+        try:
+            for account_id in window:
+                progress("account", {"Id": account_id})
+                reported.append(account_id)
+                time.sleep(0.01)
+        finally:
+            stopped.set()
+        return [], [], {}
+
+    monkeypatch.setattr(account_explorer, "_explore_window", explore_window)
+    with create_app().test_request_context():
+        events = account_explorer.stream_explorer(None, ACCOUNT_IDS[:50])
+        assert next(events)[0] == "start"
+        assert next(events)[0] == "account"
+        events.close()
+    assert stopped.wait(5)
+    assert len(reported) < 50
+    assert not list(account_explorer.RESULTS_DIR.glob("*.json"))
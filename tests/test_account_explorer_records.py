@@ -0,0 +1,60 @@
+import random
+
+from app import account_explorer
+
+ACCOUNT_IDS = [f"001{index:015d}" for index in range(20)]
+
+
+def _results(seed):
+    rnd = random.Random(seed)
+    results = {}
+    for object_key in account_explorer._DIRECT_OBJECTS:
+        filter_field = account_explorer._OBJECT_DEFINITIONS[object_key]["filter_field"]
+        results[object_key] = [
+            {"Id": f"{object_key}-{index}", filter_field: rnd.choice([*ACCOUNT_IDS, "", None])}
+            for index in range(200)
+        ]
+    return results
+
+
+def test_indexed_records_match_a_full_scan():
+    results = _results(0)
+    index = account_explorer._index_direct_records(results)
+    for object_key in account_explorer._DIRECT_OBJECTS:
+        filter_field = account_explorer._OBJECT_DEFINITIONS[object_key]["filter_field"]
+        for account_id in ACCOUNT_IDS:
+            related = account_explorer._get_related_records_for_account(
+                object_key,
+                account_id,
+                direct_records_by_account=index,
+                contact_by_account=index["Contact"],
+                individual_by_account={},
+                individual_records={},
+                contact_point_mappings={},
+            )
+            expected = [record for record in results[object_key] if record[filter_field] == account_id]
+            assert related == expected
+
+
+def test_missing_objects_index_as_empty():
+    index = account_explorer._index_direct_records({})
+    assert set(index) == set(account_explorer._DIRECT_OBJECTS)
+    assert not any(index.values())
+
+
+def test_query_plan_builds_each_object_once(monkeypatch):
+    calls = []
+
+    def build_query_fields(org, object_key, config):
+        calls.append(object_key)
+        return ["Id", f"{object_key}Field"], [f"{object_key}Field"]
+
+    monkeypatch.setattr(account_explorer, "_build_query_fields", build_query_fields)
+    for concurrency in (1, 4):
+        calls.clear()
+        plan = account_explorer._build_query_plan(None, account_explorer.ExplorerConfig(), concurrency)
+        assert sorted(calls) == sorted(account_explorer._OBJECT_DEFINITIONS)
+        for object_key, object_plan in plan.objects.items():
+            assert object_plan.query_fields == ["Id", f"{object_key}Field"]
+            assert object_plan.display_fields == [f"{object_key}Field"]
+            assert object_plan.link_fields == account_explorer._get_object_link_fields(object_key)
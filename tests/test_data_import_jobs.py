@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from app import data_import
+from app.data_import import ImportSession
+from app.session_store import SessionManager
+
+SESSION_A = "a" * 32
+SESSION_B = "b" * 32
+ACCOUNTS = "Id,Name\n001000000000001AAA,Acme\n001000000000002AAA,Globex\n"
+
+
+@pytest.fixture(autouse=True)
+def parse_jobs(monkeypatch):
+    monkeypatch.setattr(data_import, "_parse_jobs", {})
+    data_import.configure_parse_pool(processes=1)
+    yield
+    data_import.configure_parse_pool(processes=data_import.DEFAULT_PARSE_PROCESSES)
+
+
+def _upload(tmp_path, name):
+    path = tmp_path / name
+    path.write_text(ACCOUNTS, encoding="utf-8")
+    return str(path)
+
+
+def test_running_job_survives_a_spill(tmp_path):
+    manager = SessionManager(spill_dir=tmp_path / "sessions")
+    manager.configure(ttl=0, memory_budget=0, max_sessions=1, spill=True)
+    import_session = ImportSession(session_id=SESSION_A)
+    source_path = _upload(tmp_path, "accounts.csv")
+    job = import_session.start_parse_job("Account", "accounts.csv", source_path)
+    manager.put("data_import", SESSION_A, import_session)
+    manager.put("data_import", SESSION_B, ImportSession(session_id=SESSION_B))
+    assert (tmp_path / "sessions" / f"data_import-{SESSION_A}.pickle").exists()
+
+    reloaded = manager.get("data_import", SESSION_A, lambda: None)
+    assert reloaded is not import_session
+    assert reloaded.jobs["Account"] is job
+    job.future.result(timeout=30)
+    assert reloaded.apply_finished_jobs()
+    assert len(reloaded.objects["Account"].records) == 2
+    assert job.state == "done"
+    assert not Path(source_path).exists()
+    assert not Path(job.progress_path).exists()
+
+
+def test_cancelled_job_removes_its_files(tmp_path):
+    import_session = ImportSession(session_id=SESSION_A)
+    job = import_session.start_parse_job("Account", "accounts.csv", _upload(tmp_path, "accounts.csv"))
+    job.future.result(timeout=30)
+    Path(job.progress_path).write_text("1", encoding="utf-8")
+    assert import_session.cancel_parse_job("Account")
+    assert not import_session.jobs
+    assert not Path(job.source_path).exists()
+    assert not Path(job.progress_path).exists()
+
+
+def test_abandoned_finished_jobs_are_pruned(tmp_path):
+    abandoned = ImportSession(session_id=SESSION_A)
+    job = abandoned.start_parse_job("Account", "accounts.csv", _upload(tmp_path, "accounts.csv"))
+    job.future.result(timeout=30)
+    job.started_at = datetime.now(timezone.utc) - timedelta(seconds=data_import.PARSE_JOB_RETENTION + 1)
+
+    ImportSession(session_id=SESSION_B).start_parse_job(
+        "Account", "other.csv", _upload(tmp_path, "other.csv")
+    )
+    assert SESSION_A not in data_import._parse_jobs
+    assert not Path(job.source_path).exists()
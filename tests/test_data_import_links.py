@@ -0,0 +1,218 @@
+import random
+
+import pytest
+
+from app.data_import import LINK_MODE_ALL, LINK_MODE_SALESFORCE_IDS, ImportSession, ObjectDataset
+
+
+def _dataset(records, fields=("Id", "Ref")):
+    return ObjectDataset(
+        fields=list(fields),
+        records={
+            record_id: dict(zip(fields, (record_id, *values)))
+            for record_id, values in (
+                (record_id, values if isinstance(values, tuple) else (values,))
+                for record_id, values in records.items()
+            )
+        },
+        filename="test.csv",
+    )
+
+
+def _graph(import_session):
+    import_session._ensure_link_index()
+    edges = {
+        frozenset((node, neighbor))
+        for node, neighbors in import_session._links.items()
+        for neighbor in neighbors
+    }
+    referrers = {target: set(sources) for target, sources in import_session._referrers.items() if sources}
+    dangling = {
+        object_key: {
+            token: {sources} if isinstance(sources, str) else set(sources)
+            for token, sources in tokens.items()
+        }
+        for object_key, tokens in import_session._dangling.items()
+        if tokens
+    }
+    return edges, referrers, import_session._id_index, dangling
+
+
+def _rebuilt(import_session):
+    fresh = ImportSession()
+    fresh.link_mode = import_session.link_mode
+    fresh.reference_fields = dict(import_session.reference_fields)
+    fresh.objects = dict(import_session.objects)
+    fresh._rebuild_links()
+    return fresh
+
+
+def _assert_matches_rebuild(import_session):
+    assert _graph(import_session) == _graph(_rebuilt(import_session))
+    import_session._ensure_components()
+    fresh = _rebuilt(import_session)
+    fresh._ensure_components()
+    for node in import_session._links:
+        assert sorted(import_session._component_of(node)) == sorted(fresh._component_of(node))
+
+
+def test_shared_ids_resolve_to_object_loaded_last():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset({"X1": "", "A2": "X1"}))
+    import_session.set_object_data("Contact", _dataset({"X1": "", "C2": "X1"}))
+    assert import_session._id_index["X1"] == ("Contact", "X1")
+    assert ("Contact", "X1") in import_session._links[("Account", "A2")]
+    _assert_matches_rebuild(import_session)
+
+
+def test_clearing_object_with_shared_ids_keeps_survivor_edges():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset({"X1": "", "X2": "", "A3": "X1 X2"}))
+    import_session.set_object_data("Contact", _dataset({"X1": "", "X2": "", "C3": "X1"}))
+    import_session.set_object_data("Case", _dataset({"K1": "X1", "K2": "X2"}))
+    import_session.clear_object_data("Contact")
+    assert import_session._id_index["X1"] == ("Account", "X1")
+    assert ("Account", "X1") in import_session._links[("Case", "K1")]
+    _assert_matches_rebuild(import_session)
+
+
+@pytest.mark.parametrize("link_mode", [LINK_MODE_ALL, LINK_MODE_SALESFORCE_IDS])
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_graph_matches_full_rebuild(link_mode, seed):
+    rnd = random.Random(seed)
+    prefixes = {"Account": "001", "Contact": "003", "Case": "500", "Order": "801"}
+    pool = [f"001{index:015d}" for index in range(8)] + [f"003{index:015d}" for index in range(8)]
+
+    def random_records(object_key):
+        records = {}
+        for index in range(rnd.randrange(1, 8)):
+            # Reuse IDs from the shared pool so objects collide on them.
+            if rnd.random() < 0.4:
+                record_id = rnd.choice(pool)
+            else:
+                record_id = f"{prefixes[object_key]}{rnd.randrange(20):015d}"
+            records[record_id] = " ".join(rnd.sample(pool, rnd.randrange(3)))
+        return records
+
+    import_session = ImportSession()
+    import_session.link_mode = link_mode
+    for _ in range(12):
+        object_key = rnd.choice(list(prefixes))
+        action = rnd.random()
+        if action < 0.6:
+            import_session.set_object_data(object_key, _dataset(random_records(object_key)))
+        elif action < 0.8:
+            import_session.clear_object_data(object_key)
+        else:
+            batch = {key: _dataset(random_records(key)) for key in rnd.sample(list(prefixes), 2)}
+            import_session.set_objects_data(batch)
+        _assert_matches_rebuild(import_session)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_free_text_links_match_full_rebuild(seed):
+    rnd = random.Random(seed)
+    fields = ("Id", "ParentId", "Notes")
+    # Short keys are not Salesforce IDs, so plain columns do not keep them as dangling.
+    pool = [f"X{index}" for index in range(10)] + [f"001{index:015d}" for index in range(4)]
+
+    def random_records():
+        return {
+            rnd.choice(pool): (rnd.choice(pool + [""]), rnd.choice(pool + ["", "free text"]))
+            for _ in range(rnd.randrange(1, 6))
+        }
+
+    import_session = ImportSession()
+    objects = ["Account", "Contact", "Case"]
+    for _ in range(12):
+        object_key = rnd.choice(objects)
+        action = rnd.random()
+        if action < 0.6:
+            import_session.set_object_data(object_key, _dataset(random_records(), fields))
+        elif action < 0.8:
+            import_session.clear_object_data(object_key)
+        else:
+            batch = {key: _dataset(random_records(), fields) for key in rnd.sample(objects, 2)}
+            import_session.set_objects_data(batch)
+        _assert_matches_rebuild(import_session)
+
+
+def test_only_keyable_tokens_are_kept_as_dangling():
+    import_session = ImportSession()
+    import_session.set_object_data(
+        "Contact",
+        _dataset(
+            {
+                "C1": ("A1", "Call back"),
+                "C2": ("A2", "See 001000000000009"),
+                "C3": ("", "001000000000009AAA"),
+            },
+            fields=("Id", "AccountId", "Notes"),
+        ),
+    )
+    assert set(import_session._dangling["Contact"]) == {"A1", "A2", "001000000000009AAA"}
+
+    import_session.set_object_data("Account", _dataset({"Call back": "", "A1": ""}))
+    assert ("Account", "Call back") in import_session._links[("Contact", "C1")]
+    assert ("Account", "A1") in import_session._links[("Contact", "C1")]
+    _assert_matches_rebuild(import_session)
+
+
+def test_memory_usage_counts_link_structures():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset({f"A{index}": "" for index in range(200)}))
+    import_session.set_object_data(
+        "Contact", _dataset({f"C{index}": f"A{index}" for index in range(200)}, fields=("Id", "AccountId"))
+    )
+    datasets = sum(dataset.memory_usage() for dataset in import_session.objects.values())
+    linked = import_session.memory_usage()
+    assert linked > datasets
+
+    import_session._get_field_index("Contact", "AccountId").complete("a1", 10)
+    assert import_session.memory_usage() > linked
+    import_session.clear_object_data("Contact")
+    assert import_session.memory_usage() < linked
+
+
+ACCOUNT_15 = "001000000000001"
+ACCOUNT_18 = f"{ACCOUNT_15}AAA"
+
+
+@pytest.mark.parametrize("account_id, reference", [(ACCOUNT_18, ACCOUNT_15), (ACCOUNT_15, ACCOUNT_18)])
+def test_salesforce_ids_match_across_15_and_18_characters(account_id, reference):
+    import_session = ImportSession()
+    import_session.configure_links(mode=LINK_MODE_SALESFORCE_IDS)
+    import_session.set_object_data("Account", _dataset({account_id: ""}))
+    import_session.set_object_data(
+        "Contact", _dataset({"003000000000001": reference}, fields=("Id", "AccountId"))
+    )
+    assert import_session._links[("Contact", "003000000000001")] == {("Account", account_id)}
+    _assert_matches_rebuild(import_session)
+
+
+def test_salesforce_ids_mode_ignores_foreign_prefixes_and_plain_tokens():
+    import_session = ImportSession()
+    import_session.configure_links(mode=LINK_MODE_SALESFORCE_IDS)
+    # A Contact-prefixed id is not keyed as an Account, and "A1" is not an id.
+    import_session.set_object_data("Account", _dataset({"003000000000009": "", "A1": ""}))
+    import_session.set_object_data(
+        "Contact",
+        _dataset({"003000000000001": ("003000000000009", "A1")}, fields=("Id", "AccountId", "Notes")),
+    )
+    import_session._ensure_link_index()
+    assert not import_session._links.get(("Contact", "003000000000001"))
+    assert "A1" not in import_session._dangling.get("Contact", {})
+    _assert_matches_rebuild(import_session)
+
+
+def test_switching_link_mode_rebuilds_links():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset({"A1": ""}))
+    import_session.set_object_data("Contact", _dataset({"C1": "A1"}, fields=("Id", "AccountId")))
+    assert import_session._links[("Contact", "C1")] == {("Account", "A1")}
+    import_session.configure_links(mode=LINK_MODE_SALESFORCE_IDS)
+    import_session._ensure_link_index()
+    assert not import_session._links.get(("Contact", "C1"))
+    with pytest.raises(ValueError, match="invalid_link_mode"):
+        import_session.configure_links(mode="fuzzy")
+    assert import_session.link_mode == LINK_MODE_SALESFORCE_IDS
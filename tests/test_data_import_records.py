@@ -0,0 +1,84 @@
+import pickle
+
+import pytest
+
+from app import import_snapshot
+from app.data_import import ColumnarRecords, ImportSession, ObjectDataset
+
+FIELDS = ["Id", "Name", "Industry"]
+
+
+def _records(count=10):
+    return {
+        f"R{index}": {"Id": f"R{index}", "Name": f"Name {index}", "Industry": ["Tech", "Retail", ""][index % 3]}
+        for index in range(count)
+    }
+
+
+def test_round_trips_a_mapping():
+    records = _records()
+    columnar = ColumnarRecords.from_mapping(FIELDS, records)
+    assert {record_id: dict(record) for record_id, record in columnar.items()} == records
+    assert list(columnar) == list(records)
+    assert columnar.get("R4")["Industry"] == "Retail"
+    assert columnar.get("missing") is None
+    assert "R9" in columnar and "R10" not in columnar
+    assert columnar.value(columnar.row_of("R5"), "Name") == "Name 5"
+    assert columnar.value(0, "Missing") is None
+    assert list(columnar.iter_column("Industry"))[:2] == [("R0", "Tech"), ("R1", "Retail")]
+
+
+def test_missing_fields_read_as_blank():
+    columnar = ColumnarRecords.from_mapping(FIELDS, {"R0": {"Id": "R0"}})
+    assert dict(columnar["R0"]) == {"Id": "R0", "Name": "", "Industry": ""}
+
+
+@pytest.mark.parametrize("count, typecode", [(10, "B"), (300, "H"), (70000, "I")])
+def test_freeze_narrows_code_arrays(count, typecode):
+    columnar = ColumnarRecords.from_mapping(FIELDS, _records(count))
+    codes, dictionary = columnar.encoded_column("Name")
+    assert codes.typecode == typecode
+    assert len(dictionary) == count
+    assert columnar.encoded_column("Industry")[0].typecode == "B"
+    with pytest.raises(RuntimeError):
+        columnar.append("extra", ["extra", "", ""])
+
+
+def test_pickling_keeps_records():
+    columnar = ColumnarRecords.from_mapping(FIELDS, _records(300))
+    restored = pickle.loads(pickle.dumps(columnar))
+    assert restored.fields == FIELDS
+    assert {key: dict(value) for key, value in restored.items()} == _records(300)
+    assert restored.encoded_column("Name")[0].typecode == "H"
+
+
+def test_pickling_copies_memory_mapped_buffers(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        import_snapshot,
+        "_settings",
+        {"enabled": True, "ttl": 0.0, "delay": 0.0, "directory": tmp_path},
+    )
+    session_id = "e" * 32
+    import_session = ImportSession(session_id=session_id)
+    import_session.set_object_data(
+        "Account", ObjectDataset(fields=FIELDS, records=_records(), filename="accounts.csv")
+    )
+    import_snapshot.write_snapshot(session_id, import_session)
+    loaded = import_snapshot.load_snapshot(session_id).objects["Account"].records
+    assert isinstance(loaded._ids, import_snapshot.MappedStrings)
+
+    restored = pickle.loads(pickle.dumps(loaded))
+    assert isinstance(restored._ids, list)
+    assert {key: dict(value) for key, value in restored.items()} == _records()
+
+
+def test_memory_usage_tracks_the_id_lookup():
+    columnar = ColumnarRecords.from_columns(
+        FIELDS,
+        [f"R{index}" for index in range(100)],
+        *zip(*ColumnarRecords.from_mapping(FIELDS, _records(100)).iter_encoded_columns()),
+    )
+    before = columnar.memory_usage()
+    assert before > 0
+    assert columnar.row_of("R7") == 7
+    assert columnar.memory_usage() > before
@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from app.data_import import ImportSession, ObjectDataset
+
+WORDS = ["Acme", "acme corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "  Acme  ", ""]
+
+
+def _dataset(values, fields=("Id", "Name")):
+    return ObjectDataset(
+        fields=list(fields),
+        records={f"R{index}": dict(zip(fields, (f"R{index}", value))) for index, value in enumerate(values)},
+        filename="test.csv",
+    )
+
+
+def _expected_completions(values, term, limit):
+    distinct = sorted({value.strip() for value in values if value.strip()})
+    matches = [value for value in distinct if term in value.lower()]
+    return matches[:limit] if limit else matches
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_autocomplete_matches_a_substring_scan(seed):
+    rnd = random.Random(seed)
+    values = [f"{rnd.choice(WORDS)} {rnd.randrange(50)}".strip() for _ in range(300)]
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset(values))
+    for term in ["", "acme", "ACME 1", "e 4", "1", "zzz", rnd.choice(values)[1:4]]:
+        for limit in (0, 5, 12):
+            expected = _expected_completions(values, term.strip().lower(), limit)
+            assert import_session.get_autocomplete_values("Account", "Name", term, limit) == expected
+
+
+def test_terms_spanning_two_values_do_not_match():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset(["abc", "def"]))
+    assert import_session.get_autocomplete_values("Account", "Name", "cd") == []
+    assert import_session.get_autocomplete_values("Account", "Name", "c\x00d") == []
+
+
+def test_search_matches_whole_values_case_insensitively():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset(["Acme", " acme ", "Acme Corp", ""]))
+    assert import_session.search_records("Account", "Name", "ACME") == [
+        ("Account", "R0"),
+        ("Account", "R1"),
+    ]
+    assert import_session.search_records("Account", "Name", "  ") == []
+    assert import_session.search_records("Account", "Missing", "Acme") == []
+
+
+def test_field_index_is_rebuilt_when_the_object_is_replaced():
+    import_session = ImportSession()
+    import_session.set_object_data("Account", _dataset(["Acme"]))
+    assert import_session.get_autocomplete_values("Account", "Name", "ac") == ["Acme"]
+    import_session.set_object_data("Account", _dataset(["Globex"]))
+    assert import_session.get_autocomplete_values("Account", "Name", "ac") == []
+    assert import_session.search_records("Account", "Name", "globex") == [("Account", "R0")]
+
+
+def _linked_session():
+    import_session = ImportSession()
+    import_session.set_object_data(
+        "Account",
+        ObjectDataset(
+            fields=["Id", "Name"],
+            records={"A1": {"Id": "A1", "Name": "Acme"}, "A2": {"Id": "A2", "Name": "Globex"}},
+            filename="accounts.csv",
+        ),
+    )
+    import_session.set_object_data(
+        "Contact",
+        ObjectDataset(
+            fields=["Id", "AccountId"],
+            records={f"C{index:02d}": {"Id": f"C{index:02d}", "AccountId": "A1"} for index in range(25)},
+            filename="contacts.csv",
+        ),
+    )
+    return import_session
+
+
+def test_component_pages_cover_every_record_once():
+    import_session = _linked_session()
+    seen = []
+    offset = 0
+    while True:
+        page = import_session.get_related_component([("Account", "A1")], offset=offset, limit=10)
+        assert page["total"] == 26
+        assert page["objects"]["Contact"]["total"] == 25
+        records = [
+            (object_key, record["id"])
+            for object_key, info in page["objects"].items()
+            for record in info["records"]
+        ]
+        seen.extend(records)
+        offset += len(records)
+        if not page["hasMore"]:
+            break
+    assert seen == [("Account", "A1")] + [("Contact", f"C{index:02d}") for index in range(25)]
+    assert import_session.get_related_component([("Account", "A1")])["hasMore"] is False
+
+
+def test_component_follows_cleared_objects():
+    import_session = _linked_session()
+    assert import_session.get_related_component([("Account", "A1")])["total"] == 26
+    import_session.clear_object_data("Contact")
+    assert import_session.get_related_component([("Account", "A1")])["total"] == 1
+    assert import_session.get_related_component([("Account", "A2")])["total"] == 1
+
+
+def test_max_depth_limits_the_component():
+    import_session = _linked_session()
+    one_hop = import_session.get_related_component([("Contact", "C00")], max_depth=1)
+    assert one_hop["total"] == 2
+    assert one_hop["objects"]["Contact"]["records"][0]["related"] == [{"object": "Account", "id": "A1"}]
+    assert import_session.get_related_component([("Contact", "C00")], max_depth=2)["total"] == 26
+    assert import_session.get_related_component([("Contact", "C00")])["total"] == 26
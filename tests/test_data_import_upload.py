@@ -0,0 +1,69 @@
+import io
+import threading
+
+import pytest
+
+from app import create_app, data_import, import_snapshot
+from app.session_store import SessionManager
+
+ACCOUNTS = "Id,Name\n001000000000001AAA,Acme\n001000000000002AAA,Globex\n"
+CONTACTS = "Id,AccountId\n003000000000001AAA,001000000000002AAA\n"
+
+
+@pytest.fixture(autouse=True)
+def parse_pool():
+    yield
+    data_import.configure_parse_pool(processes=data_import.DEFAULT_PARSE_PROCESSES)
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_import, "session_manager", SessionManager(spill_dir=tmp_path / "sessions"))
+    monkeypatch.setattr(import_snapshot, "_settings", {**import_snapshot._settings, "enabled": False})
+    return create_app().test_client()
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+def test_batch_upload_parses_every_file(client, processes):
+    data_import.configure_parse_pool(processes=processes)
+    response = client.post(
+        "/api/data-import/upload-batch",
+        data={
+            "Account": (io.BytesIO(ACCOUNTS.encode()), "accounts.csv"),
+            "Contact": (io.BytesIO(CONTACTS.encode()), "contacts.csv"),
+            "Case": (io.BytesIO(b""), "cases.csv"),
+        },
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 200
+    files = {item["object"]: item for item in response.get_json()["files"]}
+    assert files["Account"]["recordCount"] == 2
+    assert files["Contact"]["recordCount"] == 1
+    assert files["Case"]["error"] == "empty_file"
+
+    with client.session_transaction() as flask_session:
+        session_id = flask_session[data_import.DATA_IMPORT_SESSION_KEY]
+    import_session = data_import.session_manager.get(
+        "data_import", session_id, lambda: None
+    )
+    assert sorted(import_session.objects) == ["Account", "Contact"]
+
+
+def test_uploads_are_parsed_on_threads_without_a_process_pool(tmp_path, monkeypatch):
+    data_import.configure_parse_pool(processes=0)
+    threads = set()
+    timed_parse = data_import._timed_parse
+
+    def record_thread(filename, path):
+        threads.add(threading.current_thread().name)
+        return timed_parse(filename, path)
+
+    monkeypatch.setattr(data_import, "_timed_parse", record_thread)
+    uploads = []
+    for index in range(3):
+        path = tmp_path / f"accounts{index}.csv"
+        path.write_text(ACCOUNTS, encoding="utf-8")
+        uploads.append(("Account", path.name, str(path)))
+    results = data_import.parse_uploaded_files(uploads)
+    assert [len(result["dataset"].records) for result in results] == [2, 2, 2]
+    assert all(name.startswith("data-import-parse") for name in threads)
@@ -0,0 +1,160 @@
+import json
+import os
+import time
+
+import pytest
+
+from app import data_import, import_snapshot
+from app.data_import import ImportSession, ObjectDataset
+
+SESSION_ID = "d" * 32
+
+
+@pytest.fixture(autouse=True)
+def snapshot_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        import_snapshot,
+        "_settings",
+        {"enabled": True, "ttl": 0.0, "delay": 0.0, "directory": tmp_path / "snapshots"},
+    )
+    yield
+    import_snapshot.flush_all_snapshots()
+
+
+def _dataset(records):
+    return ObjectDataset(
+        fields=["Id", "Name", "ParentId"],
+        records={
+            record_id: {"Id": record_id, "Name": name, "ParentId": ref}
+            for record_id, (name, ref) in records.items()
+        },
+        filename="test.csv",
+    )
+
+
+def _session():
+    import_session = ImportSession(session_id=SESSION_ID)
+    import_session.set_object_data("Account", _dataset({"A1": ("Acme", ""), "A2": ("Globex", "A1")}))
+    import_session.set_object_data(
+        "Contact",
+        _dataset({"C1": ("Ann", "A2"), "C2": ("Bob", "MISSING"), "C3": ("Cy", "MISSING")}),
+    )
+    return import_session
+
+
+def _graph(import_session):
+    references, dangling = import_session.export_link_index()
+    return sorted(references), {
+        object_key: {
+            token: sorted([sources] if isinstance(sources, str) else sources)
+            for token, sources in tokens.items()
+        }
+        for object_key, tokens in dangling.items()
+    }
+
+
+def test_written_snapshot_loads_back(tmp_path):
+    import_session = _session()
+    signature = import_snapshot.write_snapshot(SESSION_ID, import_session)
+    assert signature == import_snapshot.snapshot_signature(SESSION_ID)
+
+    loaded = import_snapshot.load_snapshot(SESSION_ID)
+    assert loaded.snapshot_signature == signature
+    assert list(loaded.objects) == ["Account", "Contact"]
+    assert dict(loaded.objects["Contact"].records["C1"]) == {"Id": "C1", "Name": "Ann", "ParentId": "A2"}
+    assert _graph(loaded) == _graph(import_session)
+    assert _graph(loaded)[1]["Contact"]
+
+
+def test_ids_and_link_index_stay_in_mapped_sections():
+    import_session = _session()
+    import_snapshot.write_snapshot(SESSION_ID, import_session)
+    raw = import_snapshot.snapshot_path(SESSION_ID).read_bytes()
+    _, header_offset = import_snapshot._PREFIX.unpack_from(raw, 0)
+    header = json.loads(raw[header_offset:])
+    assert set(header) == {"version", "linkMode", "referenceFields", "objects", "references"}
+    assert b"MISSING" not in raw[header_offset:]
+
+    loaded = import_snapshot.load_snapshot(SESSION_ID)
+    records = loaded.objects["Contact"].records
+    assert isinstance(records._ids, import_snapshot.MappedStrings)
+    assert records._row_by_id is None
+    assert records.row_of("C3") == 2
+    assert _graph(loaded)[1]["Contact"] == {"MISSING": ["C2", "C3"]}
+
+
+def test_snapshot_loads_without_mmap(monkeypatch):
+    monkeypatch.setattr(import_snapshot, "_USE_MMAP", False)
+    import_session = _session()
+    import_snapshot.write_snapshot(SESSION_ID, import_session)
+    loaded = import_snapshot.load_snapshot(SESSION_ID)
+    assert _graph(loaded) == _graph(import_session)
+
+
+def test_scheduled_writes_are_debounced(monkeypatch):
+    import_snapshot._settings["delay"] = 60.0
+    writes = []
+    write_state = import_snapshot._write_state
+    monkeypatch.setattr(
+        import_snapshot,
+        "_write_state",
+        lambda session_id, state: writes.append(session_id) or write_state(session_id, state),
+    )
+    import_session = _session()
+    import_snapshot.schedule_snapshot(SESSION_ID, import_session)
+    import_session.clear_object_data("Contact")
+    import_snapshot.schedule_snapshot(SESSION_ID, import_session)
+    assert import_snapshot.has_pending_write(SESSION_ID)
+    assert import_snapshot.snapshot_signature(SESSION_ID) is None
+
+    import_snapshot.flush_snapshot(SESSION_ID)
+    assert writes == [SESSION_ID]
+    assert not import_snapshot.has_pending_write(SESSION_ID)
+    assert import_session.snapshot_signature == import_snapshot.snapshot_signature(SESSION_ID)
+    assert list(import_snapshot.load_snapshot(SESSION_ID).objects) == ["Account"]
+
+
+def test_locked_snapshot_file_is_retried(monkeypatch):
+    import_snapshot._settings["delay"] = 60.0
+    replace = os.replace
+    failures = []
+
+    def locked_replace(source, target):
+        if not failures:
+            failures.append(target)
+            raise PermissionError(13, "in use")
+        replace(source, target)
+
+    monkeypatch.setattr(import_snapshot.os, "replace", locked_replace)
+    import_session = _session()
+    import_snapshot.schedule_snapshot(SESSION_ID, import_session)
+    import_snapshot.flush_snapshot(SESSION_ID)
+    assert failures
+    assert import_snapshot.has_pending_write(SESSION_ID)
+    assert not list(import_snapshot.snapshot_path(SESSION_ID).parent.glob("*.tmp"))
+
+    import_snapshot.flush_snapshot(SESSION_ID)
+    assert import_snapshot.load_snapshot(SESSION_ID) is not None
+
+
+def test_newer_snapshot_from_another_worker_is_reloaded(tmp_path, monkeypatch):
+    from app import create_app
+    from app.session_store import SessionManager
+
+    monkeypatch.setattr(data_import, "session_manager", SessionManager(spill_dir=tmp_path / "sessions"))
+    app = create_app()
+    with app.test_request_context():
+        data_import.session[data_import.DATA_IMPORT_SESSION_KEY] = SESSION_ID
+        import_session = data_import.get_import_session()
+        assert not import_session.objects
+
+        # Simulate another worker saving this browser session.
+        other = _session()
+        time.sleep(0.01)
+        import_snapshot.write_snapshot(SESSION_ID, other)
+
+        reloaded = data_import.get_import_session()
+        assert reloaded is not import_session
+        assert list(reloaded.objects) == ["Account", "Contact"]
+        assert reloaded.snapshot_signature == import_snapshot.snapshot_signature(SESSION_ID)
+        assert data_import.get_import_session() is reloaded
@@ -0,0 +1,99 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app import create_app, routes, storage as storage_module
+from app.salesforce import SalesforceError
+from app.storage import OrgStorage, QueryHistoryStorage
+
+
+@pytest.fixture
+def client(stub, tmp_path, monkeypatch):
+    _, org = stub
+    app = create_app()
+    orgs = OrgStorage(tmp_path / "orgs.json")
+    orgs.upsert(org)
+    monkeypatch.setattr(storage_module.storage, "_backend", orgs)
+    monkeypatch.setattr(
+        storage_module.query_history_storage, "_backend", QueryHistoryStorage(tmp_path / "history.jsonl")
+    )
+    return app.test_client()
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_fetch_all_streams_one_ndjson_line_per_page(client, stub, prefetch):
+    _, org = stub
+    options = {"fetch_all": True, "stream": True, "max_records": 500, "prefetch": prefetch}
+    response = client.post(
+        "/api/query", json={"org_id": org.id, "query": "SELECT Id FROM Account", "options": options}
+    )
+    assert response.mimetype == "application/x-ndjson"
+    lines = _lines(response)
+    pages, summary = lines[:-1], lines[-1]
+    assert [len(page["records"]) for page in pages] == [200, 200, 100]
+    assert summary["totalSize"] == 500
+    assert summary["truncated"] and not summary["done"]
+
+    buffered = client.post(
+        "/api/query",
+        json={"org_id": org.id, "query": "SELECT Id FROM Account", "options": {**options, "stream": False}},
+    ).get_json()
+    assert buffered["records"] == [record for page in pages for record in page["records"]]
+
+
+def test_stream_reports_errors_after_the_first_page(client, stub, monkeypatch):
+    _, org = stub
+
+    def failing_pages(*args, **kwargs):
+        yield {"records": [{"Id": "001"}]}
+        raise SalesforceError("invalid query locator")
+
+    monkeypatch.setattr(routes, "iter_query_all", failing_pages)
+    response = client.post(
+        "/api/query",
+        json={
+            "org_id": org.id,
+            "query": "SELECT Id FROM Account",
+            "options": {"fetch_all": True, "stream": True},
+        },
+    )
+    assert response.status_code == 200
+    assert _lines(response) == [{"records": [{"Id": "001"}]}, {"error": "invalid query locator"}]
+
+
+def test_bulk_query_is_polled_and_downloaded(client, stub):
+    _, org = stub
+    response = client.post(
+        "/api/query",
+        json={"org_id": org.id, "query": "SELECT Id, Name FROM Account", "options": {"engine": "bulk"}},
+    )
+    assert response.status_code == 202
+    job = response.get_json()["bulkJob"]
+    assert job["filename"].startswith("Account_")
+
+    while job["state"] != "JobComplete":
+        response = client.get(f"/api/query/bulk-jobs/{job['id']}", query_string={"org_id": org.id})
+        assert response.status_code == 200
+        job = response.get_json()["bulkJob"]
+
+    response = client.get(
+        f"/api/query/bulk-jobs/{job['id']}/results",
+        query_string={"org_id": org.id, "filename": "Account_export.csv"},
+    )
+    assert response.status_code == 200
+    assert 'filename="Account_export.csv"' in response.headers["Content-Disposition"]
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0] == ["Id", "Name"]
+    assert len(rows) == 1001
+
+
+def test_unknown_bulk_job_is_rejected(client, stub):
+    _, org = stub
+    response = client.get("/api/query/bulk-jobs/not-a-job/results", query_string={"org_id": org.id})
+    assert response.status_code == 404
@@ -0,0 +1,142 @@
+import csv
+import io
+import time
+
+import pytest
+
+from app import salesforce
+from app.salesforce import SalesforceError, SessionPool
+from app.storage import OrgConfig
+
+ORG = OrgConfig(
+    id="prod",
+    label="Production",
+    client_id="client",
+    client_secret="secret",
+    environment="production",
+    redirect_uri="http://localhost/callback",
+    instance_url="http://localhost",
+    access_token="token",
+)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = SessionPool()
+    monkeypatch.setattr(salesforce, "session_pool", pool)
+    yield pool
+    pool.close_all()
+
+
+def test_requests_to_one_host_share_a_pooled_session(stub, pool):
+    _, org = stub
+    for _ in range(3):
+        salesforce.query(org, "SELECT Id FROM Account")
+    stats = pool.stats()
+    assert stats["hosts"] == [org.instance_url]
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert pool.get(org.instance_url + "/other") is pool.get(org.instance_url.upper())
+
+
+def test_idle_sessions_are_closed_and_replaced(stub, pool):
+    _, org = stub
+    pool.configure(idle_timeout=60)
+    session = pool.get(org.instance_url)
+    key = org.instance_url.lower()
+    pool._sessions[key] = (session, time.monotonic() - 120)
+    assert pool.get(org.instance_url) is not session
+    assert pool.stats()["evictions"] == 1
+
+    pool.configure(keep_alive=False)
+    assert pool.stats()["size"] == 0
+    assert pool.get(org.instance_url).headers["Connection"] == "close"
+
+
+@pytest.mark.parametrize("max_records", [None, 450, 1000, 5000])
+def test_prefetched_pages_match_sequential_paging(stub, pool, max_records):
+    _, org = stub
+    soql = "SELECT Id, Name FROM Account"
+    sequential = salesforce.query_all(org, soql, max_records=max_records)
+    prefetched = salesforce.query_all(org, soql, max_records=max_records, prefetch=4)
+    assert prefetched == sequential
+    assert len(prefetched["records"]) == min(max_records or 1000, 1000)
+    assert prefetched["truncated"] == bool(max_records and max_records < 1000)
+
+
+def test_prefetch_follows_an_unexpected_next_url(monkeypatch):
+    pages = {
+        "/query": {"totalSize": 6, "records": [{"Id": 0}], "nextRecordsUrl": "/next/01g-1"},
+        "/next/01g-1": {"records": [{"Id": 1}], "nextRecordsUrl": "/next/01g-2"},
+        # The server switched locators: the speculative /next/01g-3 must be dropped.
+        "/next/01g-2": {"records": [{"Id": 2}], "nextRecordsUrl": "/other/01g-3"},
+        "/other/01g-3": {"records": [{"Id": 3}], "nextRecordsUrl": "/other/01g-4"},
+        "/other/01g-4": {"records": [{"Id": 4}, {"Id": 5}], "nextRecordsUrl": None},
+        "/next/01g-3": {"records": [{"Id": "stale"}], "nextRecordsUrl": "/next/01g-4"},
+        "/next/01g-4": {"records": [{"Id": "stale"}], "nextRecordsUrl": None},
+        "/next/01g-5": {"records": [{"Id": "stale"}], "nextRecordsUrl": None},
+    }
+    monkeypatch.setattr(
+        salesforce,
+        "_authorized_get",
+        lambda org, path, params=None: (pages["/query" if params else path], org),
+    )
+    result = salesforce.query_all(ORG, "SELECT Id FROM Account", prefetch=3)
+    assert [record["Id"] for record in result["records"]] == [0, 1, 2, 3, 4, 5]
+    assert result["done"]
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64 * 1024])
+def test_bulk_results_keep_one_header_across_locator_pages(stub, pool, chunk_size):
+    _, org = stub
+    job = salesforce.start_bulk_query(org, "SELECT Id, Name FROM Account")
+    while salesforce.get_bulk_query_job(org, job["id"])[0]["state"] != "JobComplete":
+        pass
+    content = b"".join(
+        salesforce.iter_bulk_query_results(org, job["id"], page_size=300, chunk_size=chunk_size)
+    )
+    rows = list(csv.reader(io.StringIO(content.decode("utf-8"))))
+    assert rows[0] == ["Id", "Name"]
+    assert len(rows) == 1001
+    assert [row[1] for row in rows[1:]] == [f"Name {index}" for index in range(1000)]
+
+
+class _Response:
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+
+def _composite(monkeypatch, drop=0):
+    calls = []
+
+    def fake_request(org, method, path, params=None, json=None, **kwargs):
+        requests = json["batchRequests"]
+        calls.append(len(requests))
+        results = [
+            {"statusCode": 200, "result": {"records": [{"Id": request["url"]}]}}
+            for request in requests[drop:]
+        ]
+        return _Response({"hasErrors": False, "results": results}), org
+
+    monkeypatch.setattr(salesforce, "_authorized_request", fake_request)
+    return calls
+
+
+def test_composite_batch_returns_one_result_per_subrequest(monkeypatch):
+    calls = _composite(monkeypatch)
+    paths = [f"/services/data/v57.0/query/01g-{index}" for index in range(30)]
+    results = salesforce.composite_batch(ORG, paths)
+    assert calls == [25, 5]
+    assert [result["records"][0]["Id"] for result in results] == [
+        f"v57.0/query/01g-{index}" for index in range(30)
+    ]
+
+
+def test_composite_batch_rejects_missing_results(monkeypatch):
+    _composite(monkeypatch, drop=1)
+    with pytest.raises(SalesforceError, match="returned 2 results for 3 subrequests"):
+        salesforce.composite_batch(ORG, ["/a", "/b", "/c"])
+    with pytest.raises(SalesforceError):
+        salesforce.batch_query_all(ORG, ["SELECT Id FROM Account", "SELECT Id FROM Contact"])
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from app.session_store import SessionManager
+
+SESSION_A = "a" * 32
+SESSION_B = "b" * 32
+SESSION_C = "c" * 32
+
+
+def _manager(tmp_path, **settings):
+    manager = SessionManager(spill_dir=tmp_path / "sessions")
+    manager.configure(**{"ttl": 0, "memory_budget": 0, **settings})
+    return manager
+
+
+def test_idle_sessions_expire_after_ttl(tmp_path):
+    manager = _manager(tmp_path, ttl=60)
+    manager.put("ns", SESSION_A, {"value": 1})
+    manager._entries[("ns", SESSION_A)].last_used = time.monotonic() - 120
+    manager.put("ns", SESSION_B, {"value": 2})
+    assert ("ns", SESSION_A) not in manager._entries
+    assert manager.get("ns", SESSION_A, dict) == {}
+    assert manager.stats()["expirations"] == 1
+
+
+def test_least_recently_used_session_is_evicted(tmp_path):
+    manager = _manager(tmp_path, max_sessions=2)
+    manager.put("ns", SESSION_A, {"value": 1})
+    manager.put("ns", SESSION_B, {"value": 2})
+    manager.get("ns", SESSION_A, dict)
+    manager.put("ns", SESSION_C, {"value": 3})
+    assert list(manager._entries) == [("ns", SESSION_A), ("ns", SESSION_C)]
+    assert manager.get("ns", SESSION_B, dict) == {}
+    assert manager.stats()["evictions"] == 2
+
+
+def test_evicted_session_is_spilled_and_reloaded(tmp_path):
+    manager = _manager(tmp_path, max_sessions=1, spill=True)
+    manager.put("ns", SESSION_A, {"value": 1})
+    manager.put("ns", SESSION_B, {"value": 2})
+    assert (tmp_path / "sessions" / f"ns-{SESSION_A}.pickle").exists()
+    assert manager.get("ns", SESSION_A, dict) == {"value": 1}
+    assert not (tmp_path / "sessions" / f"ns-{SESSION_A}.pickle").exists()
+    stats = manager.stats()
+    assert stats["spills"] == 2
+    assert stats["rehydrations"] == 1
+
+
+def test_pending_spill_is_taken_back_before_it_is_written(tmp_path):
+    manager = _manager(tmp_path, max_sessions=1, spill=True)
+    manager.put("ns", SESSION_A, {"value": 1})
+    with manager._lock:
+        manager._evict_oldest(keep=None)
+    assert manager.get("ns", SESSION_A, dict) == {"value": 1}
+    assert not (tmp_path / "sessions" / f"ns-{SESSION_A}.pickle").exists()
+    assert manager.stats()["spills"] == 0
+
+
+def test_factory_runs_once_and_outside_the_lock(tmp_path):
+    manager = _manager(tmp_path)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 1}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(manager.get("ns", SESSION_A, factory)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    # Other sessions stay reachable while the slow factory runs.
+    assert manager.get("ns", SESSION_B, lambda: {"value": 2}) == {"value": 2}
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert all(result is results[0] for result in results)
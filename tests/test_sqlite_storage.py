@@ -0,0 +1,67 @@
+from app.sqlite_storage import (
+    SQLiteDatabase,
+    SQLiteOrgStorage,
+    SQLiteQueryHistoryStorage,
+    SQLiteSavedQueryStorage,
+    migrate_json_to_sqlite,
+)
+from app.storage import OrgConfig, OrgStorage, QueryHistoryStorage, SavedQueryStorage
+
+
+def _json_stores(tmp_path):
+    orgs = OrgStorage(tmp_path / "orgs.json")
+    orgs.upsert(
+        OrgConfig(
+            id="prod",
+            label="Production",
+            client_id="client",
+            client_secret="secret",
+            environment="production",
+            redirect_uri="http://localhost/callback",
+            instance_url="https://example.my.salesforce.com",
+            access_token="token",
+            refresh_token="refresh",
+        )
+    )
+    orgs.upsert(
+        OrgConfig(
+            id="dev",
+            label="Sandbox",
+            client_id="client2",
+            client_secret="secret2",
+            environment="sandbox",
+            redirect_uri="http://localhost/callback",
+        )
+    )
+    saved_queries = SavedQueryStorage(tmp_path / "queries.json")
+    saved_queries.upsert("Accounts", "SELECT Id FROM Account")
+    saved_queries.upsert("Contacts", "SELECT Id, Name FROM Contact")
+    history = QueryHistoryStorage(tmp_path / "history.jsonl")
+    history.add("prod", "SELECT Id FROM Account", "Account")
+    history.add("dev", "SELECT Id FROM Contact", "Contact")
+    history.add("prod", "SELECT Id FROM Case", None)
+    return orgs, saved_queries, history
+
+
+def test_json_stores_migrate_to_sqlite(tmp_path):
+    orgs, saved_queries, history = _json_stores(tmp_path)
+    database = SQLiteDatabase(tmp_path / "sfintegrator.sqlite3")
+
+    assert migrate_json_to_sqlite(database, orgs, saved_queries, history)
+
+    assert SQLiteOrgStorage(database).load_all() == orgs.load_all()
+    assert SQLiteSavedQueryStorage(database).load_all() == saved_queries.load_all()
+    sqlite_history = SQLiteQueryHistoryStorage(database)
+    assert sqlite_history.load_all() == history.load_all()
+    assert sqlite_history.list_objects() == history.list_objects()
+
+
+def test_migration_runs_only_once(tmp_path):
+    orgs, saved_queries, history = _json_stores(tmp_path)
+    database = SQLiteDatabase(tmp_path / "sfintegrator.sqlite3")
+    assert migrate_json_to_sqlite(database, orgs, saved_queries, history)
+
+    sqlite_orgs = SQLiteOrgStorage(database)
+    sqlite_orgs.delete("dev")
+    assert not migrate_json_to_sqlite(database, orgs, saved_queries, history)
+    assert list(sqlite_orgs.load_all()) == ["prod"]
@@ -0,0 +1,125 @@
+import json
+import os
+
+from app.storage import OrgConfig, OrgStorage, QueryHistoryStorage
+
+
+def _org(org_id, label="Org"):
+    return OrgConfig(
+        id=org_id,
+        label=label,
+        client_id="client",
+        client_secret="secret",
+        environment="production",
+        redirect_uri="http://localhost/callback",
+    )
+
+
+def _counting_reads(storage, monkeypatch):
+    reads = []
+    read = storage._read
+    monkeypatch.setattr(storage, "_read", lambda: reads.append(1) or read())
+    return reads
+
+
+def test_orgs_are_read_once_while_the_file_is_unchanged(tmp_path, monkeypatch):
+    OrgStorage(tmp_path / "orgs.json").upsert(_org("prod"))
+    storage = OrgStorage(tmp_path / "orgs.json")
+    reads = _counting_reads(storage, monkeypatch)
+    assert storage.get("prod").label == "Org"
+    assert [org.id for org in storage.list()] == ["prod"]
+    assert len(reads) == 1
+
+    # Callers get copies, so mutating a result does not touch the cache.
+    storage.load_all().clear()
+    assert storage.get("prod") is not None
+    assert len(reads) == 1
+
+
+def test_own_writes_refresh_the_cache_without_a_read(tmp_path, monkeypatch):
+    storage = OrgStorage(tmp_path / "orgs.json")
+    reads = _counting_reads(storage, monkeypatch)
+    storage.upsert(_org("prod"))
+    storage.upsert(_org("dev"))
+    storage.delete("prod")
+    assert list(storage.load_all()) == ["dev"]
+    assert not reads
+
+
+def test_changes_by_another_process_are_picked_up(tmp_path):
+    path = tmp_path / "orgs.json"
+    storage = OrgStorage(path)
+    storage.upsert(_org("prod", "Before"))
+    assert storage.get("prod").label == "Before"
+
+    stat = path.stat()
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload[0]["label"] = "Aft3r!"  # Same length: only the mtime tells the change apart.
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert storage.get("prod").label == "Aft3r!"
+
+    path.unlink()
+    assert storage.load_all() == {}
+
+
+def _history(tmp_path, **settings):
+    history = QueryHistoryStorage(tmp_path / "history.jsonl", tmp_path / "history.json")
+    for name, value in settings.items():
+        setattr(history, name, value)
+    return history
+
+
+def _lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def test_history_appends_one_line_per_query(tmp_path):
+    history = _history(tmp_path)
+    history.add("prod", "SELECT Id FROM Account", "Account")
+    history.add("prod", "SELECT Id FROM Contact", "Contact")
+    assert [json.loads(line)["soql"] for line in _lines(tmp_path / "history.jsonl")] == [
+        "SELECT Id FROM Account",
+        "SELECT Id FROM Contact",
+    ]
+    assert [entry.object_name for entry in history.list()] == ["Contact", "Account"]
+    assert history.list_objects() == ["Account", "Contact"]
+
+
+def test_history_is_compacted_past_the_slack(tmp_path):
+    history = _history(tmp_path, max_entries=5, compact_slack=3)
+    for index in range(8):
+        history.add("prod", f"SELECT Id FROM Account LIMIT {index}", "Account")
+    assert len(_lines(tmp_path / "history.jsonl")) == 8
+    assert len(history.load_all()) == 5
+
+    history.add("prod", "SELECT Id FROM Account LIMIT 8", "Account")
+    lines = _lines(tmp_path / "history.jsonl")
+    assert [json.loads(line)["soql"][-1] for line in lines] == ["4", "5", "6", "7", "8"]
+    assert _history(tmp_path, max_entries=5).load_all() == history.load_all()
+
+
+def test_appends_from_another_process_are_picked_up(tmp_path):
+    history = _history(tmp_path)
+    history.add("prod", "SELECT Id FROM Account", "Account")
+    _history(tmp_path).add("dev", "SELECT Id FROM Case", "Case")
+    assert [entry.org_id for entry in history.load_all()] == ["prod", "dev"]
+
+
+def test_legacy_json_history_is_migrated_once(tmp_path):
+    legacy = [
+        {
+            "id": f"legacy{index}",
+            "org_id": "prod",
+            "soql": f"SELECT Id FROM Account LIMIT {index}",
+            "object_name": "Account",
+            "executed_at": "2024-01-01T00:00:00Z",
+        }
+        for index in range(7)
+    ]
+    (tmp_path / "history.json").write_text(json.dumps(legacy), encoding="utf-8")
+    history = _history(tmp_path, max_entries=5)
+    assert [entry.id for entry in history.load_all()] == [f"legacy{index}" for index in range(2, 7)]
+    assert not (tmp_path / "history.json").exists()
+    assert (tmp_path / "history.json.migrated").exists()
+    assert len(_lines(tmp_path / "history.jsonl")) == 5
@@ -0,0 +1,74 @@
+"""Micro-benchmark for per-account related record lookup in the Account Explorer.
+
+Compares scanning every direct object's records for each account (the former
+``_filter_records_by_field`` approach) with the one-pass index built by
+``_index_direct_records``. Run ``python tools/bench_related_records.py``.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.account_explorer import (  # noqa: E402
+    _DIRECT_OBJECTS,
+    _OBJECT_DEFINITIONS,
+    _index_direct_records,
+)
+
+
+def _build_results(accounts: int, records_per_account: int) -> Dict[str, List[Dict[str, object]]]:
+    results: Dict[str, List[Dict[str, object]]] = {}
+    for object_key in _DIRECT_OBJECTS:
+        filter_field = str(_OBJECT_DEFINITIONS[object_key]["filter_field"])
+        records = []
+        for account_index in range(accounts):
+            account_id = f"001{account_index:015d}"
+            for record_index in range(records_per_account):
+                records.append({"Id": f"{object_key[:3]}{account_index:09d}{record_index:06d}", filter_field: account_id})
+        results[object_key] = records
+    return results
+
+
+def _scan(results: Dict[str, List[Dict[str, object]]], account_ids: List[str]) -> int:
+    total = 0
+    for account_id in account_ids:
+        for object_key in _DIRECT_OBJECTS:
+            filter_field = str(_OBJECT_DEFINITIONS[object_key]["filter_field"])
+            total += len([record for record in results[object_key] if str(record.get(filter_field, "")) == account_id])
+    return total
+
+
+def _indexed(results: Dict[str, List[Dict[str, object]]], account_ids: List[str]) -> int:
+    total = 0
+    index = _index_direct_records(results)
+    for account_id in account_ids:
+        for object_key in _DIRECT_OBJECTS:
+            total += len(index[object_key].get(account_id, []))
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--records-per-account", type=int, default=20)
+    args = parser.parse_args()
+
+    results = _build_results(args.accounts, args.records_per_account)
+    account_ids = [f"001{index:015d}" for index in range(args.accounts)]
+    timings = {}
+    for label, func in (("scan", _scan), ("index", _indexed)):
+        started = time.perf_counter()
+        count = func(results, account_ids)
+        timings[label] = time.perf_counter() - started
+        print(f"{label:>5}: {timings[label] * 1000:9.1f} ms ({count} related records)")
+    if timings["index"]:
+        print(f"speed-up: {timings['scan'] / timings['index']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
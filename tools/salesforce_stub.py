@@ -0,0 +1,151 @@
+"""Offline stand-in for the Salesforce query endpoints used by SF Integrator.
+
+Serves synthetic records for the REST ``query`` endpoint (with
+``nextRecordsUrl`` paging) and for Bulk API 2.0 query jobs (with
+``Sforce-Locator`` paging), so large exports can be exercised without an org.
+
+Run ``python tools/salesforce_stub.py --records 250000`` and point an org at
+``http://localhost:5001`` with any ``access_token`` and ``instance_url`` set.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import re
+import threading
+import uuid
+from typing import Dict, List
+
+from flask import Flask, Response, jsonify, request
+
+API_PREFIX = "/services/data/v57.0"
+
+_SELECT_PATTERN = re.compile(r"^\s*SELECT\s+(.+?)\s+FROM\s+([a-zA-Z0-9_]+)", re.IGNORECASE | re.DOTALL)
+
+app = Flask(__name__)
+app.config.update(STUB_RECORDS=10000, STUB_BATCH_SIZE=2000, STUB_POLLS_UNTIL_COMPLETE=2)
+
+_jobs: Dict[str, Dict[str, object]] = {}
+_cursors: Dict[str, Dict[str, object]] = {}
+_lock = threading.Lock()
+
+
+def _parse_soql(soql: str) -> Dict[str, object]:
+    match = _SELECT_PATTERN.match(soql or "")
+    if not match:
+        return {"fields": ["Id"], "object": "Account"}
+    fields = [field.strip() for field in match.group(1).split(",") if field.strip()]
+    return {"fields": fields or ["Id"], "object": match.group(2)}
+
+
+def _make_record(object_name: str, fields: List[str], index: int) -> Dict[str, object]:
+    record: Dict[str, object] = {}
+    for field in fields:
+        if field.lower() == "id":
+            record[field] = f"001{index:015d}"[:18]
+        else:
+            record[field] = f"{field} {index}"
+    return record
+
+
+def _rest_page(cursor_id: str, offset: int) -> Dict[str, object]:
+    with _lock:
+        cursor = _cursors.get(cursor_id)
+    if not cursor:
+        return {}
+    total = int(app.config["STUB_RECORDS"])
+    batch = int(app.config["STUB_BATCH_SIZE"])
+    end = min(offset + batch, total)
+    records = []
+    for index in range(offset, end):
+        record = _make_record(cursor["object"], cursor["fields"], index)
+        record["attributes"] = {"type": cursor["object"]}
+        records.append(record)
+    next_url = f"{API_PREFIX}/query/{cursor_id}-{end}" if end < total else None
+    return {"totalSize": total, "done": next_url is None, "records": records, "nextRecordsUrl": next_url}
+
+
+@app.route(f"{API_PREFIX}/query", methods=["GET"])
+def rest_query():
+    cursor_id = f"01g{uuid.uuid4().hex[:15]}"
+    with _lock:
+        _cursors[cursor_id] = _parse_soql(request.args.get("q", ""))
+    return jsonify(_rest_page(cursor_id, 0))
+
+
+@app.route(f"{API_PREFIX}/query/<cursor_id>-<int:offset>", methods=["GET"])
+def rest_query_more(cursor_id: str, offset: int):
+    page = _rest_page(cursor_id, offset)
+    if not page:
+        return jsonify([{"errorCode": "INVALID_QUERY_LOCATOR", "message": "invalid query locator"}]), 400
+    return jsonify(page)
+
+
+@app.route(f"{API_PREFIX}/jobs/query", methods=["POST"])
+def create_job():
+    payload = request.get_json(force=True) or {}
+    job_id = f"750{uuid.uuid4().hex[:15]}"
+    job = {"id": job_id, "operation": "query", "state": "UploadComplete", "polls": 0}
+    job.update(_parse_soql(str(payload.get("query") or "")))
+    with _lock:
+        _jobs[job_id] = job
+    return jsonify({"id": job_id, "operation": "query", "state": "UploadComplete"})
+
+
+@app.route(f"{API_PREFIX}/jobs/query/<job_id>", methods=["GET"])
+def get_job(job_id: str):
+    with _lock:
+        job = _jobs.get(job_id)
+        if not job:
+            return jsonify([{"errorCode": "NOT_FOUND", "message": "Job not found"}]), 404
+        job["polls"] = int(job["polls"]) + 1
+        if job["polls"] >= int(app.config["STUB_POLLS_UNTIL_COMPLETE"]):
+            job["state"] = "JobComplete"
+        elif job["state"] == "UploadComplete":
+            job["state"] = "InProgress"
+        state = job["state"]
+    return jsonify({"id": job_id, "operation": "query", "state": state})
+
+
+@app.route(f"{API_PREFIX}/jobs/query/<job_id>/results", methods=["GET"])
+def get_job_results(job_id: str):
+    with _lock:
+        job = _jobs.get(job_id)
+    if not job or job["state"] != "JobComplete":
+        return jsonify([{"errorCode": "INVALIDJOBSTATE", "message": "Job is not complete"}]), 400
+    total = int(app.config["STUB_RECORDS"])
+    page_size = request.args.get("maxRecords", type=int) or 50000
+    offset = int(request.args.get("locator") or 0)
+    end = min(offset + page_size, total)
+    fields: List[str] = job["fields"]
+
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(fields)
+        for index in range(offset, end):
+            record = _make_record(job["object"], fields, index)
+            writer.writerow([record[field] for field in fields])
+            if buffer.tell() > 64 * 1024:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    locator = str(end) if end < total else "null"
+    return Response(generate(), mimetype="text/csv", headers={"Sforce-Locator": locator})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--records", type=int, default=app.config["STUB_RECORDS"])
+    parser.add_argument("--batch-size", type=int, default=app.config["STUB_BATCH_SIZE"])
+    args = parser.parse_args()
+    app.config.update(STUB_RECORDS=args.records, STUB_BATCH_SIZE=args.batch_size)
+    app.run(port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()